@@ -0,0 +1,254 @@
+"""
+크롤링 파이프라인 벤치마크 — 소스별 fetch / parse / 이름 해석 / DB 쓰기 시간
+
+crawlers.replay의 fixture 재생(CRAWL_HTTP_MODE=replay)으로 네트워크 없이 같은 응답을 반복 재현하고,
+각 스크래퍼의 save_to_db()를 그대로 실행하면서 구간을 나눠 측정합니다 (로컬 Postgres에 실제로 씀).
+
+  fetch:   HTTP 요청이 하나 이상 진행 중이던 시간 (http_client.fetch_clock — fan-out 겹침은 한 번만)
+  parse:   fetch_schedules() 전체 - fetch (HTML/JSON 파싱, Fallback 판단, 캐시 파일 저장)
+  resolve: 자격증 이름 → cert_id 해석 (CertResolver.resolve 호출 합계)
+  upsert:  save_to_db() 전체 - fetch_schedules() - resolve (날짜 파싱 + 지문 비교 + INSERT ... ON CONFLICT / UPDATE + 커밋)
+
+해석기 로드(certifications 전체 읽기)는 run_crawlers와 같이 반복마다 한 번 — 별도 행으로 표시합니다.
+조건부 요청 캐시(crawlers.http_cache)는 기본으로 끄고 측정합니다. --http-cache를 주면 켜므로
+첫 반복은 전체 실행, 이후 반복은 "응답 변경 없음" 경로(재검증만 하고 파싱/DB 쓰기 생략)를 측정합니다.
+일정 집합 지문(crawl_fingerprints)도 기본으로 매 실행 전에 지워 쓰기 경로를 측정하고,
+--keep-fingerprints를 주면 지문이 같은 반복의 "쓰기 생략" 경로를 측정합니다.
+
+준비 (네트워크 되는 곳에서 1회 녹화):
+  CRAWL_HTTP_MODE=record python -m crawlers.run_crawlers
+
+사용법 (backend 디렉터리에서):
+  python -m benchmarks.bench_crawl
+  python -m benchmarks.bench_crawl --sources qnet,finance --repeat 5 --latency-ms 80 --jitter-ms 40
+  python -m benchmarks.bench_crawl --failure-rate 0.2 --seed 7     # 장애 주입 → Fallback 경로 측정
+  python -m benchmarks.bench_crawl --mode live --repeat 1          # 실제 사이트 대상
+  python -m benchmarks.bench_crawl --http-cache --repeat 3         # 조건부 요청 캐시 적중 경로
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from crawlers.replay import DEFAULT_FIXTURE_DIR
+
+# 소스 이름 → (모듈, 클래스) — run_crawlers 실행 함수와 같은 구성
+SCRAPERS = {
+    "qnet": ("crawlers.qnet_scraper", "QNetScraper"),
+    "kdata": ("crawlers.kdata_scraper", "KDataScraper"),
+    "cloud": ("crawlers.cloud_scraper", "CloudScraper"),
+    "finance": ("crawlers.finance_scraper", "FinanceScraper"),
+    "itdomestic": ("crawlers.it_domestic_scraper", "ITDomesticScraper"),
+    "intl": ("crawlers.intl_cert_scraper", "IntlCertScraper"),
+}
+PHASES = ("fetch", "parse", "resolve", "upsert", "total")
+
+
+class TimedResolver:
+    """CertResolver 래퍼 — resolve() 호출 시간 합계"""
+
+    def __init__(self, resolver):
+        self._resolver = resolver
+        self.ns = 0
+        self.calls = 0
+
+    def resolve(self, name: str):
+        t0 = time.perf_counter_ns()
+        try:
+            return self._resolver.resolve(name)
+        finally:
+            self.ns += time.perf_counter_ns() - t0
+            self.calls += 1
+
+    def __getattr__(self, name):
+        return getattr(self._resolver, name)
+
+    def __len__(self):
+        return len(self._resolver)
+
+
+def clear_fingerprint(source_name: str):
+    """소스의 일정 집합 지문 삭제 → 다음 save_to_db()는 행 단위 비교로 씀"""
+    from sqlalchemy import text
+
+    from crawlers.base import get_sync_engine
+
+    with get_sync_engine().begin() as conn:
+        conn.execute(text("DELETE FROM crawl_fingerprints WHERE source = :s"), {"s": source_name})
+
+
+def run_source(source: str, resolver, keep_fingerprint: bool = False) -> Dict:
+    """소스 1개 save_to_db() 실행 + 구간별 시간 (ms)"""
+    from crawlers.http_client import fetch_clock
+    from services.query_stats import call_site
+
+    module_name, class_name = SCRAPERS[source]
+    scraper = getattr(importlib.import_module(module_name), class_name)()
+    if not keep_fingerprint:
+        clear_fingerprint(scraper.source_name)
+    timed_resolver = TimedResolver(resolver)
+    scraper.resolver = timed_resolver
+
+    collect = {"ns": 0, "schedules": 0}
+    fetch_schedules = scraper.fetch_schedules
+
+    def timed_fetch_schedules():
+        t0 = time.perf_counter_ns()
+        try:
+            schedules = fetch_schedules()
+            collect["schedules"] = len(schedules)
+            return schedules
+        finally:
+            collect["ns"] += time.perf_counter_ns() - t0
+
+    scraper.fetch_schedules = timed_fetch_schedules
+
+    error = None
+    t0 = time.perf_counter_ns()
+    try:
+        with fetch_clock() as clock, call_site(f"crawler:{source}"):
+            stats = scraper.save_to_db()
+    except Exception as e:
+        stats, error = dict(scraper.stats), str(e)
+    finally:
+        scraper.close()
+    total_ns = time.perf_counter_ns() - t0
+
+    return {
+        "method": scraper.method_used,
+        "error": error,
+        "schedules": collect["schedules"],
+        "requests": clock.requests,
+        "stats": stats,
+        "ms": {
+            "fetch": clock.busy_ns / 1e6,
+            "parse": max(collect["ns"] - clock.busy_ns, 0) / 1e6,
+            "resolve": timed_resolver.ns / 1e6,
+            "upsert": max(total_ns - collect["ns"] - timed_resolver.ns, 0) / 1e6,
+            "total": total_ns / 1e6,
+        },
+    }
+
+
+def summarize(runs: List[Dict]) -> Dict:
+    """반복 결과 → 구간별 중앙값 (ms) + 마지막 실행 정보"""
+    last = runs[-1]
+    return {
+        "method": last["method"],
+        "methods": sorted({r["method"] for r in runs}),
+        "errors": [r["error"] for r in runs if r["error"]],
+        "schedules": last["schedules"],
+        "requests": last["requests"],
+        "stats": last["stats"],
+        "median_ms": {p: round(statistics.median(r["ms"][p] for r in runs), 2) for p in PHASES},
+        "max_ms": {p: round(max(r["ms"][p] for r in runs), 2) for p in PHASES},
+    }
+
+
+def configure_http(args):
+    """crawlers.replay 설정 — get_crawl_setting은 환경변수를 먼저 읽으므로 환경변수로 지정"""
+    os.environ["CRAWL_HTTP_MODE"] = args.mode
+    os.environ["CRAWL_FIXTURE_DIR"] = str(args.fixtures)
+    os.environ["CRAWL_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["CRAWL_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["CRAWL_REPLAY_FAILURE_RATE"] = str(args.failure_rate)
+    os.environ["CRAWL_REPLAY_SEED"] = str(args.seed)
+    os.environ["CRAWL_HTTP_CACHE_ENABLED"] = "true" if args.http_cache else "false"
+
+
+def print_report(results: Dict[str, Dict], resolver_load_ms: float):
+    print(f"\n{'소스':<12}{'방법':<10}{'일정':>6}{'요청':>6}" + "".join(f"{p:>10}" for p in PHASES) + "   (ms, 중앙값)")
+    for source, r in results.items():
+        print(
+            f"{source:<12}{r['method']:<10}{r['schedules']:>6}{r['requests']:>6}"
+            + "".join(f"{r['median_ms'][p]:>10.1f}" for p in PHASES)
+        )
+        for error in r["errors"][:1]:
+            print(f"{'':<12}❌ {error[:100]}")
+    print(f"{'(해석기 로드)':<34}{resolver_load_ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 파이프라인 벤치마크 (fixture 재생)")
+    parser.add_argument("--sources", default=",".join(SCRAPERS), help=f"쉼표 구분 소스 (기본: 전체 — {', '.join(SCRAPERS)})")
+    parser.add_argument("--mode", choices=("replay", "live"), default="replay", help="replay: fixture 재생 / live: 실제 사이트")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURE_DIR, help="fixture 디렉터리")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="재생 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="재생 지연 편차 (± ms)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="장애 주입 확률 (0~1)")
+    parser.add_argument("--seed", type=int, default=0, help="장애 주입 시드")
+    parser.add_argument("--http-cache", action="store_true", help="조건부 요청 캐시 사용 (기본: 끔 — 매 반복 전체 실행)")
+    parser.add_argument("--keep-fingerprints", action="store_true", help="일정 집합 지문 유지 (기본: 매 실행 전 삭제)")
+    parser.add_argument("--repeat", type=int, default=3, help="소스별 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--label", default="crawl", help="결과 이름")
+    parser.add_argument("--no-save", action="store_true", help="결과 파일 저장 안 함")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+    args = parser.parse_args()
+
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+    unknown = [s for s in sources if s not in SCRAPERS]
+    if unknown:
+        parser.error(f"알 수 없는 소스: {', '.join(unknown)}")
+    if args.repeat < 1:
+        parser.error("--repeat는 1 이상이어야 합니다")
+    if args.mode == "replay" and not args.fixtures.exists():
+        print(f"⚠️ fixture 디렉터리 없음: {args.fixtures} — 모든 요청이 실패하고 캐시 Fallback만 측정됩니다")
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.ERROR,
+        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    )
+    configure_http(args)
+
+    from crawlers.cert_resolver import load_resolver
+    from crawlers.replay import reset_replay_state
+
+    runs: Dict[str, List[Dict]] = {source: [] for source in sources}
+    resolver_load = []
+    for i in range(args.repeat):
+        # 반복마다 장애 주입 순번을 처음부터 — 같은 시드면 반복끼리 같은 장애 패턴
+        reset_replay_state()
+        t0 = time.perf_counter()
+        resolver = load_resolver()
+        resolver_load.append((time.perf_counter() - t0) * 1000)
+        if resolver is None:
+            raise SystemExit("❌ 자격증 이름 해석기 로드 실패 — DATABASE_URL_SYNC의 Postgres를 확인하세요")
+        for source in sources:
+            runs[source].append(run_source(source, resolver, args.keep_fingerprints))
+        print(f"  반복 {i + 1}/{args.repeat} 완료", flush=True)
+
+    results = {source: summarize(source_runs) for source, source_runs in runs.items()}
+    resolver_load_ms = round(statistics.median(resolver_load), 2)
+    print_report(results, resolver_load_ms)
+
+    if not args.no_save:
+        from benchmarks.load_test import RESULTS_DIR, git_commit, save
+
+        path = save({
+            "label": args.label,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_commit": git_commit(),
+            "config": {
+                "mode": args.mode,
+                "sources": sources,
+                "repeat": args.repeat,
+                "latency_ms": args.latency_ms,
+                "jitter_ms": args.jitter_ms,
+                "failure_rate": args.failure_rate,
+                "seed": args.seed,
+                "http_cache": args.http_cache,
+                "keep_fingerprints": args.keep_fingerprints,
+            },
+            "resolver_load_ms": resolver_load_ms,
+            "sources": results,
+        }, RESULTS_DIR)
+        print(f"\n💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
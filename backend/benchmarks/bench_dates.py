@@ -0,0 +1,151 @@
+"""
+날짜 파싱 마이크로벤치마크 — 기존 parse_date 대비 crawlers.dates (빠른 경로 / 메모 캐시 / 열 단위 일괄)
+
+스크래퍼가 넘기는 일정 열과 비슷한 합성 열(같은 날짜 반복, 형식 혼합, 빈 값 / None)을 만들어
+아래 방식의 열당 시간을 중앙값으로 비교하고, 모든 값의 결과가 기존 구현과 같은지 확인합니다.
+
+  legacy   — 이전 base.parse_date(str(value)) (기준)
+  fast     — 메모 캐시 없이 빠른 경로만 (처음 보는 값 — 캐시가 빈 크롤 첫 사이클)
+  memo     — dates.parse_date (값마다 호출, 캐시 유지)
+  batch    — dates.parse_dates (열 전체 한 번에, BaseScraper.save_to_db가 쓰는 방식)
+
+사용법 (backend 디렉터리에서):
+  python -m benchmarks.bench_dates
+  python -m benchmarks.bench_dates --rows 2000 --distinct 120 --repeat 30
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from crawlers import dates
+
+# 결과 동일성 확인용 경계값 (합성 열과 별도로 항상 비교)
+EDGE_CASES = [
+    "", "   ", "None", "-", "미정", "2026", "2026.03", "20260315", " 2026.03.15 ", "2026.3.5", "2026/03/15",
+    "2026-03-15(토)", "2026-03-15 (토)", "2026-3-5(토)", "2026-03-15(Sun)", "2026-3-5(Sat)", "2026-03-15(sunday)",
+    "03/15", "3/5", "3.5", "02-29", "12-31", "0-5", "13-01", "2026-02-30", "2026-00-10", "2026-13-01",
+    "20260230", "202603151", "2026-03- 5", "접수 2026.03.15", "2026.03.15 ~ 2026.03.18", "２０２６-０３-１５",
+    "2026.03.15.", "2026..03.15", "0000-01-01", "9999-12-31", "2026-03-15T09:00", "2026년 3월 15일",
+]
+
+
+def synthetic_column(rows: int, distinct: int, seed: int = 0) -> List:
+    """시험일정 한 열 — distinct개 날짜가 형식을 바꿔가며 반복, 일부는 빈 값 / None"""
+    rng = random.Random(seed)
+    days = [(rng.randint(1, 12), rng.randint(1, 28)) for _ in range(distinct)]
+    formats = [
+        lambda m, d: f"2026.{m:02d}.{d:02d}",
+        lambda m, d: f"2026-{m:02d}-{d:02d}(토)",
+        lambda m, d: f"2026{m:02d}{d:02d}",
+        lambda m, d: f"{m:02d}/{d:02d}",
+        lambda m, d: f"2026-{m}-{d}",
+    ]
+    column = []
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.05:
+            column.append(None)
+        elif roll < 0.10:
+            column.append("")
+        else:
+            m, d = rng.choice(days)
+            column.append(rng.choice(formats)(m, d))
+    return column
+
+
+def _legacy(column: List) -> List:
+    return [dates._parse_legacy(str(v)) for v in column]
+
+
+def _fast(column: List) -> List:
+    year = datetime.now().year
+    return [None if v is None else dates._parse(v if isinstance(v, str) else str(v), year) for v in column]
+
+
+def _memo(column: List) -> List:
+    return [dates.parse_date(v) for v in column]
+
+
+def _batch(column: List) -> List:
+    return dates.parse_dates(column)
+
+
+METHODS: Dict[str, Callable[[List], List]] = {"legacy": _legacy, "fast": _fast, "memo": _memo, "batch": _batch}
+
+
+def measure(fn: Callable[[List], List], column: List, repeat: int) -> float:
+    """열 하나를 처리하는 시간의 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(column)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def check(column: List) -> List[Dict]:
+    """기존 구현과 결과가 다른 값 목록"""
+    values = list(dict.fromkeys(v for v in column + EDGE_CASES if v is not None))
+    expected = _legacy(values)
+    mismatches = []
+    for name in ("fast", "memo", "batch"):
+        dates.clear_cache()
+        for value, want, got in zip(values, expected, METHODS[name](values)):
+            if want != got:
+                mismatches.append({"method": name, "value": value, "legacy": str(want), "got": str(got)})
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜 파싱 마이크로벤치마크 (기존 parse_date 대비)")
+    parser.add_argument("--rows", type=int, default=1000, help="열 길이 (일정 행 수)")
+    parser.add_argument("--distinct", type=int, default=80, help="열 안의 서로 다른 날짜 수")
+    parser.add_argument("--repeat", type=int, default=20, help="방식별 반복 횟수 (중앙값)")
+    parser.add_argument("--label", default="dates", help="결과 이름")
+    parser.add_argument("--no-save", action="store_true", help="결과 파일 저장 안 함")
+    args = parser.parse_args()
+    if args.rows < 1 or args.distinct < 1 or args.repeat < 1:
+        parser.error("--rows / --distinct / --repeat는 1 이상이어야 합니다")
+
+    column = synthetic_column(args.rows, args.distinct)
+    mismatches = check(column)
+
+    timings = {}
+    for name, fn in METHODS.items():
+        dates.clear_cache()
+        timings[name] = measure(fn, column, args.repeat)
+    info = dates.cache_info()
+
+    base = timings["legacy"]
+    print(f"\n열 {args.rows}행 (서로 다른 날짜 {args.distinct}개) — 열당 중앙값")
+    print(f"{'방식':<10}{'ms':>10}{'µs/값':>10}{'속도 향상':>12}")
+    for name, ms in timings.items():
+        print(f"{name:<10}{ms:>10.3f}{ms * 1000 / args.rows:>10.2f}{(base / ms if ms else 0.0):>11.1f}x")
+    print(f"메모 캐시: hits {info.hits} / misses {info.misses} / 크기 {info.currsize}/{info.maxsize}")
+    if mismatches:
+        print(f"❌ 기존 구현과 다른 결과 {len(mismatches)}건")
+        for m in mismatches[:5]:
+            print(f"   {m['method']}: {m['value']!r} → 기존 {m['legacy']} / {m['got']}")
+    else:
+        print(f"✅ 결과 동일 (열 + 경계값 {len(EDGE_CASES)}개)")
+
+    if not args.no_save:
+        from benchmarks.load_test import RESULTS_DIR, git_commit, save
+
+        path = save({
+            "label": args.label,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_commit": git_commit(),
+            "config": {"rows": args.rows, "distinct": args.distinct, "repeat": args.repeat},
+            "timings_ms": {name: round(ms, 4) for name, ms in timings.items()},
+            "mismatches": mismatches,
+        }, RESULTS_DIR)
+        print(f"\n💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+스크래퍼 HTML 파싱 벤치마크 — 백엔드별 파싱 시간 + 결과 동일성 확인 (crawlers.html_tables)
+
+녹화된 페이지(crawlers.replay fixture 중 text/html 응답) 또는 지정한 .html 파일마다
+4개 스크래퍼 파서를 백엔드별로 실행해 중앙값 시간을 재고, 결과 레코드가 기준
+백엔드(html.parser — 문서 전체 파싱, 이전 동작)와 같은지 비교합니다.
+
+  qnet:        QNetScraper._parse_html_schedules
+  kdata:       KDataScraper._parse_html_schedules
+  finance:     FinanceScraper._parse_html_table
+  it_domestic: ITDomesticScraper._parse_generic_table (스크래퍼가 쓰는 키워드 전체)
+
+페이지가 없으면 실제 시험일정 페이지와 비슷한 합성 페이지(메뉴/스크립트 + 일정 테이블)로 측정합니다.
+합성 페이지는 닫는 태그를 모두 쓴 것과 </td>/</tr>를 생략한 것(HTML에서 유효, 오래된 기관 페이지에 흔함)
+두 가지입니다. 생략형에서 lxml은 HTML 명세대로 셀을 나누고 html.parser / bs4는 셀을 중첩시키므로
+결과가 다르게 나오는 것이 정상입니다 (crawlers.html_tables 참고).
+파싱만 실행하며 DB는 쓰지 않습니다.
+
+합성 페이지만으로는 실제 마크업에서의 동일성을 보장할 수 없으므로, 백엔드를 바꾸기 전에
+--record로 Q-Net / KData / Finance / IT Domestic 웹 페이지를 fixture로 녹화해 측정하세요
+(녹화만 네트워크 사용 — 이후 실행은 fixture만 읽음). 녹화한 fixture는 커밋해 두면 다음 비교에 재사용됩니다.
+
+사용법 (backend 디렉터리에서):
+  python -m benchmarks.bench_parse                              # 녹화된 fixture 전체
+  python -m benchmarks.bench_parse --html page1.html page2.html --repeat 20
+  python -m benchmarks.bench_parse --synthetic-rows 400         # 합성 페이지
+  python -m benchmarks.bench_parse --record                     # 실제 페이지 녹화 후 측정
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+from crawlers.html_tables import BACKENDS, lxml
+from crawlers.replay import DEFAULT_FIXTURE_DIR
+
+BASELINE = "html.parser"
+
+# 닫는 태그 생략형 합성 페이지의 최대 행 수 — html.parser는 셀이 행 수만큼 깊게 중첩돼
+# 셀마다 하위 전체 텍스트를 모으므로 행 수에 대해 2차 이상으로 느려짐 (50행 ≈ 3초)
+OMITTED_END_TAG_ROWS = 30
+
+# it_domestic_scraper의 _fetch_* 가 넘기는 키워드 합집합
+IT_DOMESTIC_KEYWORDS = ["네트워크관리사", "CPMP", "PPM", "리눅스마스터", "ISTQB", "CSTS", "컴퓨터활용능력", "전산회계"]
+
+
+def parsers() -> Dict[str, Callable[[str], List[Dict]]]:
+    """스크래퍼 이름 → HTML 파서 (네트워크 요청 없이 파싱 메서드만 호출)"""
+    from crawlers.finance_scraper import FinanceScraper
+    from crawlers.it_domestic_scraper import ITDomesticScraper
+    from crawlers.kdata_scraper import KDataScraper
+    from crawlers.qnet_scraper import QNetScraper
+
+    qnet, kdata, finance, it_domestic = QNetScraper(), KDataScraper(), FinanceScraper(), ITDomesticScraper()
+    return {
+        "qnet": qnet._parse_html_schedules,
+        "kdata": kdata._parse_html_schedules,
+        "finance": lambda html: finance._parse_html_table(html, "bench"),
+        "it_domestic": lambda html: it_domestic._parse_generic_table(html, IT_DOMESTIC_KEYWORDS, "bench"),
+    }
+
+
+# ============================================================
+# 페이지 수집
+# ============================================================
+
+def record_pages(directory: Path):
+    """HTML 파서를 쓰는 스크래퍼의 2단계(웹 크롤링)를 record 모드로 실행 → 응답이 fixture로 저장됨"""
+    from crawlers.finance_scraper import FinanceScraper
+    from crawlers.it_domestic_scraper import ITDomesticScraper
+    from crawlers.kdata_scraper import KDataScraper
+    from crawlers.qnet_scraper import QNetScraper
+
+    os.environ["CRAWL_HTTP_MODE"] = "record"
+    os.environ["CRAWL_FIXTURE_DIR"] = str(directory)
+    # 조건부 요청 캐시가 304를 받으면 본문 없는 응답이 녹화되므로 끔
+    os.environ["CRAWL_HTTP_CACHE_ENABLED"] = "false"
+    try:
+        for scraper_cls in (QNetScraper, KDataScraper, FinanceScraper, ITDomesticScraper):
+            scraper = scraper_cls()
+            try:
+                schedules = scraper.try_web_scraping()
+                print(f"🎙️ {scraper.source_name}: 녹화 완료 (일정 {len(schedules or [])}건)")
+            except Exception as e:
+                print(f"⚠️ {scraper.source_name}: 녹화 실패 — {e}")
+            finally:
+                scraper.close()
+    finally:
+        os.environ["CRAWL_HTTP_MODE"] = "live"
+
+def fixture_pages(directory: Path) -> List[Tuple[str, str]]:
+    """replay fixture 중 HTML 응답 → (이름, 디코딩된 본문) — 스크래퍼의 response.text와 같은 디코딩"""
+    pages = []
+    for path in sorted(directory.glob("*/*.json")):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        response = httpx.Response(payload["status"], headers=payload["headers"], content=base64.b64decode(payload["body"]))
+        if "html" not in response.headers.get("content-type", "") or not response.content:
+            continue
+        pages.append((f"{path.parent.name}/{path.stem}", response.text))
+    return pages
+
+
+def synthetic_page(rows: int, seed: int = 0, omit_end_tags: bool = False) -> str:
+    """
+    메뉴/스크립트/푸터 사이에 일정 테이블이 있는 페이지 (기관 시험일정 페이지 구조)
+    omit_end_tags=True면 </td> / </tr>를 생략 (HTML에서 유효한 마크업)
+    """
+    rng = random.Random(seed)
+    names = ["정보처리기사", "SQLD", "ADsP", "빅데이터분석기사", "펀드투자권유자문인력", "투자자산운용사",
+             "네트워크관리사", "리눅스마스터 2급", "ISTQB", "컴퓨터활용능력", "전산회계"]
+    nav = "".join(f'<li><a href="/menu/{i}">메뉴 {i}</a><ul><li><a href="/menu/{i}/sub">하위</a></li></ul></li>' for i in range(200))
+    body = []
+    for i in range(rows):
+        month, day = rng.randint(1, 12), rng.randint(1, 25)
+        body.append(
+            f"<tr><td>{names[i % len(names)]} 제{i % 4 + 1}회</td>"
+            f"<td>2026.{month:02d}.{day:02d} ~ 2026.{month:02d}.{day + 3:02d}</td>"
+            f"<td>2026-{month:02d}-{day:02d}(토)</td><td><span>2026/{month:02d}/{day:02d}</span></td>"
+            f"<td><a href='/apply/{i}'>접수</a></td></tr>"
+        )
+    if omit_end_tags:
+        body = [row.replace("</td>", "").replace("</tr>", "") for row in body]
+    return (
+        f"<!DOCTYPE html><html><head><title>시험일정</title><script>var cfg = {{'a': '<table>'}};</script>"
+        f"<style>td {{ padding: 0 }}</style></head><body><nav><ul>{nav}</ul></nav>"
+        f"<div class='content'><table class='tbl_type'><caption>2026년 시험일정</caption>"
+        f"<thead><tr><th>종목</th><th>접수</th><th>시험</th><th>발표</th><th></th></tr></thead>"
+        f"<tbody>{''.join(body)}</tbody></table></div>"
+        f"<footer>{'<p>footer &nbsp; text</p>' * 300}</footer></body></html>"
+    )
+
+
+# ============================================================
+# 측정
+# ============================================================
+
+def measure(fn: Callable[[str], List[Dict]], html: str, backend: str, repeat: int) -> Tuple[float, List[Dict]]:
+    """(중앙값 ms, 결과 레코드) — get_crawl_setting은 환경변수를 먼저 읽으므로 환경변수로 백엔드 지정"""
+    os.environ["CRAWL_HTML_BACKEND"] = backend
+    samples = []
+    records: List[Dict] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        records = fn(html)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), records
+
+
+def run(pages: List[Tuple[str, str]], backends: List[str], repeat: int) -> Dict:
+    results = {}
+    for scraper, fn in parsers().items():
+        totals = {b: 0.0 for b in backends}
+        mismatches = []
+        records_found = 0
+        for name, html in pages:
+            baseline_records = None
+            for backend in backends:
+                ms, records = measure(fn, html, backend, repeat)
+                totals[backend] += ms
+                if backend == BASELINE:
+                    baseline_records = records
+                    records_found += len(records)
+                elif baseline_records is not None and records != baseline_records:
+                    diff = next(
+                        (i for i, (a, b) in enumerate(zip(baseline_records, records)) if a != b),
+                        min(len(baseline_records), len(records)),
+                    )
+                    mismatches.append({
+                        "page": name, "backend": backend,
+                        "baseline": len(baseline_records), "got": len(records), "first_diff": diff,
+                    })
+        results[scraper] = {
+            "records": records_found,
+            "total_ms": {b: round(v, 3) for b, v in totals.items()},
+            "mismatches": mismatches,
+        }
+    return results
+
+
+def print_report(results: Dict, backends: List[str], pages: int):
+    print(f"\n페이지 {pages}개 — 파서별 합계 (ms, 페이지별 중앙값의 합)")
+    print(f"{'스크래퍼':<14}{'레코드':>8}" + "".join(f"{b:>14}" for b in backends) + f"{'속도 향상':>12}   결과")
+    for scraper, r in results.items():
+        totals = r["total_ms"]
+        best = min((totals[b] for b in backends if b != BASELINE), default=totals[BASELINE])
+        speedup = totals[BASELINE] / best if best else 0.0
+        status = "✅ 동일" if not r["mismatches"] else f"❌ 불일치 {len(r['mismatches'])}건"
+        print(
+            f"{scraper:<14}{r['records']:>8}" + "".join(f"{totals[b]:>14.2f}" for b in backends)
+            + f"{speedup:>11.1f}x   {status}"
+        )
+        for m in r["mismatches"][:3]:
+            print(
+                f"{'':<14}  {m['backend']}: {m['page']} "
+                f"(기준 {m['baseline']}건 / {m['got']}건, 첫 차이 #{m['first_diff']})"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래퍼 HTML 파싱 벤치마크 (백엔드 비교)")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURE_DIR, help="replay fixture 디렉터리 (HTML 응답만 사용)")
+    parser.add_argument("--html", type=Path, nargs="*", default=[], help="추가로 측정할 .html 파일")
+    parser.add_argument("--record", action="store_true", help="먼저 실제 웹 페이지를 --fixtures에 녹화 (네트워크 필요)")
+    parser.add_argument("--synthetic-rows", type=int, default=300, help="측정할 페이지가 없을 때 합성 페이지의 일정 행 수")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help=f"쉼표 구분 백엔드 (기준 {BASELINE}은 항상 포함)")
+    parser.add_argument("--repeat", type=int, default=10, help="페이지 x 파서 x 백엔드별 반복 횟수 (중앙값)")
+    parser.add_argument("--label", default="parse", help="결과 이름")
+    parser.add_argument("--no-save", action="store_true", help="결과 파일 저장 안 함")
+    args = parser.parse_args()
+
+    backends = [BASELINE] + [b.strip() for b in args.backends.split(",") if b.strip() and b.strip() != BASELINE]
+    unknown = [b for b in backends if b not in BACKENDS]
+    if unknown:
+        parser.error(f"알 수 없는 백엔드: {', '.join(unknown)}")
+    if "lxml" in backends and lxml is None:
+        print("⚠️ lxml 미설치 — lxml 백엔드는 bs4로 대체되어 측정됩니다")
+    if args.repeat < 1:
+        parser.error("--repeat는 1 이상이어야 합니다")
+
+    if args.record:
+        record_pages(args.fixtures)
+
+    pages = fixture_pages(args.fixtures) if args.fixtures.exists() else []
+    pages += [(str(path), path.read_text(encoding="utf-8", errors="replace")) for path in args.html]
+    if not pages:
+        print(f"📄 녹화된 HTML 페이지 없음 → 합성 페이지 (일정 {args.synthetic_rows}행)")
+        pages = [
+            ("synthetic", synthetic_page(args.synthetic_rows)),
+            (
+                "synthetic-omitted-end-tags",
+                synthetic_page(min(args.synthetic_rows, OMITTED_END_TAG_ROWS), omit_end_tags=True),
+            ),
+        ]
+
+    results = run(pages, backends, args.repeat)
+    print_report(results, backends, len(pages))
+
+    if not args.no_save:
+        from benchmarks.load_test import RESULTS_DIR, git_commit, save
+
+        path = save({
+            "label": args.label,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_commit": git_commit(),
+            "config": {"backends": backends, "repeat": args.repeat, "pages": [name for name, _ in pages]},
+            "scrapers": results,
+        }, RESULTS_DIR)
+        print(f"\n💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
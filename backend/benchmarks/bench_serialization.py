@@ -0,0 +1,177 @@
+"""
+응답 직렬화 벤치마크 — 기존 경로(Pydantic 검증) vs 고속 경로(dict + orjson)
+
+  기존: 행마다 CertificationResponse.model_validate → PaginatedResponse
+        → FastAPI response_model 재검증 + jsonable_encoder → json.dumps
+  고속: certification_item(행) → dict → services.serialization.dumps (orjson)
+
+DB 없이 합성 ORM 행으로 직렬화 구간만 측정하며, 워커 1개가 초당 만들 수 있는
+응답 수(resp/s)를 비교합니다. 두 경로의 출력이 같은 JSON인지도 함께 확인합니다.
+
+사용법 (backend 디렉터리에서):
+  python -m benchmarks.bench_serialization
+  python -m benchmarks.bench_serialization --size 500 --events 3000 --repeat 200
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from schemas import CalendarEvent, CertificationResponse, PaginatedResponse
+from services.serialization import backend_name, calendar_event_item, certification_item, dumps, loads
+
+LEVELS = ("Basic", "Intermediate", "Advanced", "Master")
+TAGS = ("Cloud", "AI", "Data", "Security", "Network", "Finance")
+
+
+# ============================================================
+# 합성 데이터
+# ============================================================
+
+def make_certifications(n: int) -> List[SimpleNamespace]:
+    """Certification ORM 행과 같은 속성을 가진 객체 n개"""
+    now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            name_ko=f"합성 자격증 {i:05d}",
+            name_en=f"Synthetic Certification {i:05d}",
+            tag=TAGS[i % len(TAGS)],
+            sub_tag="Vendor" if i % 3 else "",
+            level=LEVELS[i % len(LEVELS)],
+            official_url=f"https://example.com/certs/{i}" if i % 2 else None,
+            created_at=now - timedelta(days=i),
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def make_events(n: int) -> List[Dict]:
+    """services.calendar_events.to_event_dict() 결과와 같은 dict n개"""
+    events = []
+    base = date(2026, 1, 1)
+    for i in range(n):
+        day = base + timedelta(days=i % 365)
+        kind = ("registration", "exam", "result")[i % 3]
+        event = {
+            "title": f"합성 자격증 {i // 3:05d} {i // 3 % 10 + 1}회 {kind}",
+            "start": day.isoformat(),
+            "color": "#93c5fd",
+            "type": kind,
+            "cert_id": str(uuid.uuid4()),
+        }
+        if kind == "registration":
+            event["end"] = (day + timedelta(days=5)).isoformat()
+            event["textColor"] = "#1e40af"
+        events.append(event)
+    return events
+
+
+# ============================================================
+# 직렬화 경로
+# ============================================================
+
+_page_adapter = TypeAdapter(PaginatedResponse)
+_events_adapter = TypeAdapter(List[CalendarEvent])
+
+
+def _fastapi_render(adapter: TypeAdapter, content) -> bytes:
+    """FastAPI response_model 처리(재검증 + jsonable_encoder) + JSONResponse.render와 같은 단계"""
+    validated = adapter.validate_python(content, from_attributes=True)
+    encoded = jsonable_encoder(adapter.dump_python(validated, mode="json"))
+    return json.dumps(encoded, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def list_baseline(rows) -> bytes:
+    page = PaginatedResponse(
+        items=[CertificationResponse.model_validate(row) for row in rows],
+        total=len(rows),
+        page=1,
+        size=len(rows),
+        next_cursor=None,
+    )
+    return _fastapi_render(_page_adapter, page)
+
+
+def list_fast(rows) -> bytes:
+    return dumps({
+        "items": [certification_item(row) for row in rows],
+        "total": len(rows),
+        "page": 1,
+        "size": len(rows),
+        "next_cursor": None,
+    })
+
+
+def calendar_baseline(events) -> bytes:
+    return _fastapi_render(_events_adapter, [CalendarEvent(**event) for event in events])
+
+
+def calendar_fast(events) -> bytes:
+    return dumps([calendar_event_item(event) for event in events])
+
+
+# ============================================================
+# 측정
+# ============================================================
+
+def measure(fn: Callable[[], bytes], repeat: int) -> Dict[str, float]:
+    fn()  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    return {
+        "mean_ms": mean * 1000,
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p95_ms": samples[int(len(samples) * 0.95) - 1] * 1000,
+        "resp_per_sec": 1 / mean if mean else 0.0,
+    }
+
+
+def compare(name: str, baseline: Callable[[], bytes], fast: Callable[[], bytes], repeat: int):
+    if loads(baseline()) != loads(fast()):
+        raise SystemExit(f"❌ {name}: 두 경로의 JSON 출력이 다릅니다")
+
+    before = measure(baseline, repeat)
+    after = measure(fast, repeat)
+    speedup = before["mean_ms"] / after["mean_ms"] if after["mean_ms"] else float("inf")
+
+    print(f"\n[{name}] 응답 크기 {len(fast()):,} bytes")
+    print(f"  {'경로':<10}{'mean':>10}{'p50':>10}{'p95':>10}{'resp/s':>12}")
+    for label, stat in (("baseline", before), ("fast", after)):
+        print(
+            f"  {label:<10}{stat['mean_ms']:>9.2f}ms{stat['p50_ms']:>8.2f}ms"
+            f"{stat['p95_ms']:>8.2f}ms{stat['resp_per_sec']:>12.1f}"
+        )
+    print(f"  → {speedup:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 벤치마크")
+    parser.add_argument("--size", type=int, default=500, help="목록 페이지 크기 (size 최대값 500)")
+    parser.add_argument("--events", type=int, default=3000, help="캘린더 이벤트 수 (1년치 ≈ 일정 1000건 × 3)")
+    parser.add_argument("--repeat", type=int, default=100, help="반복 횟수")
+    args = parser.parse_args()
+
+    print(f"직렬화 백엔드: {backend_name()}")
+    rows = make_certifications(args.size)
+    events = make_events(args.events)
+
+    compare(f"GET /api/certifications size={args.size}", lambda: list_baseline(rows), lambda: list_fast(rows), args.repeat)
+    compare(f"GET /api/schedules/calendar events={args.events}", lambda: calendar_baseline(events), lambda: calendar_fast(events), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
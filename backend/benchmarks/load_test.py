@@ -0,0 +1,414 @@
+"""
+읽기 경로 부하 테스트 — 실제 트래픽 비율로 API를 호출하고 엔드포인트별 지연 분포 기록
+
+실행 중인 API(uvicorn)에 HTTP로 요청하므로 미들웨어 / 캐시 / DB 풀 / 직렬화까지 모두 포함한 값입니다.
+routers/certifications.py, routers/schedules.py 변경 전후로 같은 조건에서 실행해 비교합니다.
+
+시나리오 (--mix 비율로 선택, 가상 사용자 --concurrency명이 쉬지 않고 반복):
+  - list:         목록 + 필터 조합 (없음 / tag / tag+level / sub_tag / 검색어) → next_cursor로 다음 페이지 0~2회
+  - autocomplete: 자동완성 키 입력 스트림 — 이름 앞부분을 한 글자씩 늘려 /search 연속 호출
+  - calendar:     캘린더 월 이동 — 범위 모드(start/end, 6주) 또는 year/month
+  - detail:       상세 페이지 — 자격증 1건 + 그 자격증 일정
+
+결과:
+  - 엔드포인트(라우트 템플릿)별 요청 수 / 오류 수 / p50·p95·p99 / 평균 / req/s
+    (+ Server-Timing 헤더가 있으면 서버 측 db / serialize 평균 — 그 구간이 보고된 요청만으로 평균)
+  - benchmarks/results/<시각>-<label>.json 저장, --compare로 이전 결과와 비교
+
+사용법 (backend 디렉터리에서, 데이터는 benchmarks.synthetic_data로 준비):
+  python -m benchmarks.load_test --duration 60 --concurrency 32 --label baseline
+  python -m benchmarks.load_test --duration 60 --concurrency 32 --label keyset \\
+      --compare benchmarks/results/20261018-120000-baseline.json
+  python -m benchmarks.load_test --mix list=50,autocomplete=50 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.synthetic_data import LEVELS, TAG_SUB_TAGS, YEARS_DEFAULT, parse_years
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_MIX = "list=40,autocomplete=30,calendar=20,detail=10"
+
+# 결과 키 — 라우트 템플릿 (캐시/직렬화 경로가 같은 요청끼리 묶음)
+LIST = "GET /api/certifications"
+SEARCH = "GET /api/certifications/search"
+DETAIL = "GET /api/certifications/{cert_id}"
+SCHEDULES = "GET /api/schedules?cert_id="
+CALENDAR_WINDOW = "GET /api/schedules/calendar?start&end"
+CALENDAR_MONTH = "GET /api/schedules/calendar?year&month"
+
+_SERVER_TIMING = re.compile(r"(\w+);dur=([\d.]+)")
+
+
+# ============================================================
+# 측정값 집계
+# ============================================================
+
+class EndpointStats:
+    __slots__ = ("latencies_ms", "errors", "statuses", "server_ms", "server_counts")
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self.server_ms: Dict[str, float] = {}
+        self.server_counts: Dict[str, int] = {}  # 구간이 Server-Timing에 있던 요청 수 (serialize는 측정된 요청만)
+
+    def record(self, elapsed_ms: float, status: int, server_timing: Optional[str]):
+        self.latencies_ms.append(elapsed_ms)
+        key = str(status)
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if status >= 400:
+            self.errors += 1
+        if server_timing:
+            for name, dur in _SERVER_TIMING.findall(server_timing):
+                if name in ("db", "serialize"):
+                    self.server_ms[name] = self.server_ms.get(name, 0.0) + float(dur)
+                    self.server_counts[name] = self.server_counts.get(name, 0) + 1
+
+    def _server_mean(self, name: str) -> Optional[float]:
+        """구간이 보고된 요청들의 평균 (ms) — 보고된 요청이 없으면 None"""
+        count = self.server_counts.get(name, 0)
+        return round(self.server_ms[name] / count, 2) if count else None
+
+    def summary(self, wall_sec: float) -> Dict:
+        samples = sorted(self.latencies_ms)
+        count = len(samples)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "req_per_sec": round(count / wall_sec, 1) if wall_sec else 0.0,
+            "mean_ms": round(sum(samples) / count, 2) if count else None,
+            "p50_ms": percentile(samples, 50),
+            "p95_ms": percentile(samples, 95),
+            "p99_ms": percentile(samples, 99),
+            "max_ms": round(samples[-1], 2) if count else None,
+            "server_db_mean_ms": self._server_mean("db"),
+            "server_serialize_mean_ms": self._server_mean("serialize"),
+        }
+
+
+def percentile(sorted_samples: List[float], pct: float) -> Optional[float]:
+    """nearest-rank 분위수 (ms)"""
+    if not sorted_samples:
+        return None
+    rank = max(math.ceil(pct / 100 * len(sorted_samples)), 1)
+    return round(sorted_samples[rank - 1], 2)
+
+
+# ============================================================
+# 시나리오
+# ============================================================
+
+class Dataset:
+    """API에서 수집한 자격증 표본 (상세 / 자동완성 대상)"""
+
+    def __init__(self, ids: List[str], names: List[str], total: Optional[int], years: Tuple[int, int]):
+        self.ids = ids
+        self.names = names
+        self.total = total
+        self.years = years
+
+
+class Runner:
+    def __init__(self, client: httpx.AsyncClient, dataset: Dataset, stats: Dict[str, EndpointStats], rng: random.Random, think_ms: float):
+        self.client = client
+        self.dataset = dataset
+        self.stats = stats
+        self.rng = rng
+        self.think_ms = think_ms
+        self.recording = False
+
+    async def get(self, label: str, path: str, params: Optional[dict] = None) -> Optional[httpx.Response]:
+        t0 = time.perf_counter()
+        try:
+            response = await self.client.get(path, params=params)
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, 599  # 연결 실패 / 타임아웃
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        if self.recording:
+            self.stats.setdefault(label, EndpointStats()).record(
+                elapsed_ms, status, response.headers.get("server-timing") if response is not None else None
+            )
+        return response
+
+    async def think(self):
+        if self.think_ms:
+            await asyncio.sleep(self.rng.uniform(0.5, 1.5) * self.think_ms / 1000)
+
+    async def scenario_list(self):
+        rng = self.rng
+        params: Dict = {"size": rng.choice((20, 50, 100))}
+        kind = rng.random()
+        if kind < 0.25:
+            pass
+        elif kind < 0.55:
+            params["tag"] = rng.choice(list(TAG_SUB_TAGS))
+        elif kind < 0.75:
+            params["tag"] = rng.choice(list(TAG_SUB_TAGS))
+            params["level"] = rng.choice(LEVELS)
+        elif kind < 0.85:
+            tag = rng.choice(list(TAG_SUB_TAGS))
+            params["sub_tag"] = rng.choice([s for s in TAG_SUB_TAGS[tag] if s] or [""])
+        else:
+            params["query"] = self._prefix(rng.randint(2, 4))
+
+        response = await self.get(LIST, "/api/certifications", params)
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            cursor = _json(response, {}).get("next_cursor") if response is not None else None
+            if not cursor:
+                break
+            await self.think()
+            response = await self.get(LIST, "/api/certifications", {**params, "cursor": cursor})
+
+    async def scenario_autocomplete(self):
+        name = self.rng.choice(self.dataset.names)
+        typed = name[: self.rng.randint(2, min(len(name), 8))]
+        for length in range(1, len(typed) + 1):
+            await self.get(SEARCH, "/api/certifications/search", {"q": typed[:length]})
+            await self.think()
+
+    async def scenario_calendar(self):
+        rng = self.rng
+        year = rng.randint(*self.dataset.years)
+        month = rng.randint(1, 12)
+        if rng.random() < 0.7:
+            # FullCalendar 월 보기: 그 달 1일이 속한 주의 일요일부터 6주
+            first = date(year, month, 1)
+            start = first - timedelta(days=(first.weekday() + 1) % 7)
+            await self.get(CALENDAR_WINDOW, "/api/schedules/calendar", {
+                "start": start.isoformat(), "end": (start + timedelta(weeks=6)).isoformat(),
+            })
+        else:
+            await self.get(CALENDAR_MONTH, "/api/schedules/calendar", {"year": year, "month": month})
+
+    async def scenario_detail(self):
+        cert_id = self.rng.choice(self.dataset.ids)
+        await self.get(DETAIL, f"/api/certifications/{cert_id}")
+        await self.get(SCHEDULES, "/api/schedules", {"cert_id": cert_id})
+
+    def _prefix(self, length: int) -> str:
+        return self.rng.choice(self.dataset.names)[:length]
+
+
+SCENARIOS = {
+    "list": Runner.scenario_list,
+    "autocomplete": Runner.scenario_autocomplete,
+    "calendar": Runner.scenario_calendar,
+    "detail": Runner.scenario_detail,
+}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """'list=40,autocomplete=30' → {"list": 40.0, "autocomplete": 30.0}"""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("비율 합이 0입니다")
+    return mix
+
+
+def _json(response: Optional[httpx.Response], default):
+    try:
+        return response.json()
+    except Exception:
+        return default
+
+
+# ============================================================
+# 실행
+# ============================================================
+
+async def discover(client: httpx.AsyncClient, sample: int, years: Tuple[int, int]) -> Dataset:
+    """목록 API를 커서로 따라가며 자격증 표본 수집 (id, 국문명)"""
+    ids, names, total, cursor = [], [], None, None
+    while len(ids) < sample:
+        params = {"size": 500, "include_total": "true" if cursor is None else "false"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/certifications", params=params)
+        response.raise_for_status()
+        body = response.json()
+        if total is None:
+            total = body.get("total")
+        for item in body["items"]:
+            ids.append(item["id"])
+            names.append(item["name_ko"])
+        cursor = body.get("next_cursor")
+        if not cursor:
+            break
+    if not ids:
+        raise SystemExit("❌ 자격증이 없습니다 — python -m benchmarks.synthetic_data 로 데이터를 먼저 채우세요")
+    return Dataset(ids[:sample], names[:sample], total, years)
+
+
+async def run(args) -> Dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        dataset = await discover(client, args.sample, args.years)
+        print(f"대상: {args.base_url} (자격증 {dataset.total or '?'}건 중 표본 {len(dataset.ids):,}건)")
+
+        stats: Dict[str, EndpointStats] = {}
+        names = list(args.mix)
+        weights = [args.mix[n] for n in names]
+        runners = [
+            Runner(client, dataset, stats, random.Random(args.seed + i), args.think_ms)
+            for i in range(args.concurrency)
+        ]
+        phase = {"deadline": 0.0}
+
+        async def user(runner: Runner):
+            while time.perf_counter() < phase["deadline"]:
+                scenario = runner.rng.choices(names, weights)[0]
+                await SCENARIOS[scenario](runner)
+                await runner.think()
+
+        if args.warmup > 0:
+            print(f"워밍업 {args.warmup:.0f}s ...")
+            phase["deadline"] = time.perf_counter() + args.warmup
+            await asyncio.gather(*(user(r) for r in runners))
+
+        print(f"측정 {args.duration:.0f}s (동시 사용자 {args.concurrency}명, mix={args.mix_text}) ...")
+        for runner in runners:
+            runner.recording = True
+        started = time.perf_counter()
+        phase["deadline"] = started + args.duration
+        await asyncio.gather(*(user(r) for r in runners))
+        wall_sec = time.perf_counter() - started
+
+    endpoints = {label: s.summary(wall_sec) for label, s in sorted(stats.items())}
+    total = EndpointStats()
+    for s in stats.values():
+        total.latencies_ms.extend(s.latencies_ms)
+        total.errors += s.errors
+    return {
+        "label": args.label,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "config": {
+            "base_url": args.base_url,
+            "duration_sec": args.duration,
+            "warmup_sec": args.warmup,
+            "concurrency": args.concurrency,
+            "mix": args.mix,
+            "think_ms": args.think_ms,
+            "seed": args.seed,
+            "years": list(args.years),
+        },
+        "dataset": {"certifications": dataset.total, "sampled": len(dataset.ids)},
+        "wall_sec": round(wall_sec, 2),
+        "total": {k: v for k, v in total.summary(wall_sec).items() if not k.startswith("server_") and k != "statuses"},
+        "endpoints": endpoints,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+# ============================================================
+# 출력 / 비교
+# ============================================================
+
+def print_report(result: Dict):
+    print(f"\n{'엔드포인트':<44}{'요청':>8}{'오류':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'db':>8}")
+    rows = [*result["endpoints"].items(), ("(전체)", result["total"])]
+    for label, s in rows:
+        print(
+            f"{label:<44}{s['requests']:>8}{s['errors']:>6}{s['req_per_sec']:>9.1f}"
+            f"{_ms(s['p50_ms']):>9}{_ms(s['p95_ms']):>9}{_ms(s['p99_ms']):>9}{_ms(s.get('server_db_mean_ms')):>8}"
+        )
+
+
+def print_comparison(result: Dict, baseline: Dict):
+    print(f"\n비교: {baseline.get('label')} ({baseline.get('git_commit')}) → {result.get('label')} ({result.get('git_commit')})")
+    print(f"{'엔드포인트':<44}{'p50':>16}{'p95':>16}{'p99':>16}{'req/s':>16}")
+    before_endpoints = {**baseline.get("endpoints", {}), "(전체)": baseline.get("total", {})}
+    for label, after in [*result["endpoints"].items(), ("(전체)", result["total"])]:
+        before = before_endpoints.get(label)
+        if not before:
+            continue
+        cells = [_delta(before.get(k), after.get(k)) for k in ("p50_ms", "p95_ms", "p99_ms", "req_per_sec")]
+        print(f"{label:<44}" + "".join(f"{c:>16}" for c in cells))
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _delta(before: Optional[float], after: Optional[float]) -> str:
+    if before is None or after is None:
+        return "-"
+    change = (after - before) / before * 100 if before else 0.0
+    return f"{after:.1f} ({change:+.0f}%)"
+
+
+def save(result: Dict, output_dir: Path) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    safe_label = re.sub(r"[^A-Za-z0-9_.-]+", "_", result["label"]) or "run"
+    path = output_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{safe_label}.json"
+    path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="읽기 경로 부하 테스트 (합성 데이터 + 트래픽 비율 재현)")
+    parser.add_argument("--base-url", default=os.getenv("BENCH_BASE_URL", "http://localhost:8000"), help="API 주소")
+    parser.add_argument("--duration", type=float, default=60, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=10, help="워밍업 시간 (초, 측정 제외 — 캐시/커넥션 준비)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 가상 사용자 수")
+    parser.add_argument("--mix", dest="mix_text", default=DEFAULT_MIX, help=f"시나리오 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--think-ms", type=float, default=0, help="요청 사이 대기 시간 평균 (ms, 0이면 쉬지 않음)")
+    parser.add_argument("--sample", type=int, default=5000, help="상세/자동완성 대상 자격증 표본 수")
+    parser.add_argument("--years", type=parse_years, default=parse_years(YEARS_DEFAULT), help="캘린더 조회 연도 범위 (synthetic_data와 동일하게)")
+    parser.add_argument("--timeout", type=float, default=30, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=1, help="트래픽 난수 시드")
+    parser.add_argument("--label", default="run", help="결과 이름 (파일명에 포함)")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR, help="결과 저장 디렉터리")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--no-save", action="store_true", help="결과 파일 저장 안 함")
+    args = parser.parse_args()
+
+    try:
+        args.mix = parse_mix(args.mix_text)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if args.concurrency < 1:
+        parser.error("--concurrency는 1 이상이어야 합니다")
+
+    result = asyncio.run(run(args))
+    print_report(result)
+
+    if args.compare:
+        print_comparison(result, json.loads(args.compare.read_text(encoding="utf-8")))
+    if not args.no_save:
+        print(f"\n💾 결과 저장: {save(result, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+부하 테스트용 합성 데이터 생성기 — certifications / exam_schedules / calendar_events
+
+로컬 Postgres에 운영보다 큰 규모(기본 자격증 10만 건, 일정 200만 건)의 데이터를 채워
+목록 필터 / 자동완성 / 캘린더 / 상세 조회가 데이터 규모에 따라 어떻게 느려지는지 측정합니다.
+
+  - 이름: 실제 자격증과 비슷한 어간(정보처리, 빅데이터분석, AWS Solutions ...) + 등급 접미사 + 번호
+          → 자동완성 키 입력 스트림(정 → 정보 → 정보처 ...)이 실제처럼 여러 건에 매칭됨
+  - 일정: 자격증마다 회차 1..k, 시험일은 --years 범위에 고르게 분포 (접수/발표일 일부 누락)
+  - 적재: psycopg2 COPY (INSERT 대비 수십 배 빠름) → calendar_events 일괄 채우기 → ANALYZE
+  - 같은 --seed면 같은 데이터 (이름/날짜/분포 — UUID 포함)
+
+기존 데이터가 있으면 중단합니다. --reset을 주면 세 테이블을 비우고 다시 채웁니다 (운영 DB 금지).
+적재 후 캐시 무효화 NOTIFY를 보내므로 실행 중인 API 워커도 새 데이터를 바로 반영합니다.
+
+사용법 (backend 디렉터리에서, DATABASE_URL_SYNC / DATABASE_URL 대상):
+  python -m benchmarks.synthetic_data --reset
+  python -m benchmarks.synthetic_data --reset --certs 10000 --schedules 200000 --years 2025-2027
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator, List, Sequence, Tuple
+
+from sqlalchemy import text
+
+from config import get_settings
+
+settings = get_settings()
+
+LEVELS = ("Basic", "Intermediate", "Advanced", "Master")
+
+# 대분류 → 소분류 (seed.sql 분포와 비슷하게)
+TAG_SUB_TAGS = {
+    "Cloud": ("Amazon", "Google", "Microsoft", "Naver", "Oracle"),
+    "AI": ("Google", "Microsoft", "Nvidia", ""),
+    "Data": ("국가기술", "Oracle", "Databricks", "Snowflake"),
+    "Security": ("국가기술", "ISC2", "ISACA", "CompTIA"),
+    "Network": ("Cisco", "Juniper", "국가기술"),
+    "Finance": ("금융투자협회", "한국금융연수원", "생명보험협회"),
+    "Dev": ("국가기술", "Oracle", "Linux Foundation"),
+    "PM": ("PMI", "Scrum Alliance", ""),
+}
+
+# 자동완성 키 입력 스트림의 대상이 되는 이름 어간
+NAME_STEMS = (
+    "정보처리", "정보보안", "빅데이터분석", "데이터분석", "데이터아키텍처", "SQL개발", "리눅스마스터",
+    "네트워크관리", "정보통신", "전자계산기조직응용", "컴퓨터활용능력", "사무자동화",
+    "투자자산운용", "금융투자분석", "신용분석", "외환전문역", "자산관리", "보험계리",
+    "AWS Solutions", "AWS Developer", "Azure Administrator", "Google Cloud Engineer",
+    "Kubernetes Administrator", "Terraform Associate", "TensorFlow Developer", "Oracle Database",
+    "Cisco Network", "CompTIA Security", "CISSP", "PMP", "Scrum Master", "Data Engineer",
+)
+GRADE_SUFFIXES = ("기사", "산업기사", "기능사", "1급", "2급", "전문가", " Associate", " Professional")
+
+YEARS_DEFAULT = f"{date.today().year - 1}-{date.today().year + 1}"
+
+COPY_CHUNK_ROWS = 100_000
+CALENDAR_BATCH = 50_000
+
+
+def parse_years(value: str) -> Tuple[int, int]:
+    """'2025-2027' → (2025, 2027), '2026' → (2026, 2026)"""
+    first, _, last = value.partition("-")
+    start, end = int(first), int(last or first)
+    if end < start:
+        raise argparse.ArgumentTypeError(f"잘못된 연도 범위: {value}")
+    return start, end
+
+
+# ============================================================
+# 행 생성 (COPY text 포맷)
+# ============================================================
+
+def _copy_value(value) -> str:
+    if value is None:
+        return r"\N"
+    return str(value).replace("\\", "\\\\").replace("\t", " ").replace("\n", " ")
+
+
+def _copy_line(values: Sequence) -> str:
+    return "\t".join(_copy_value(v) for v in values) + "\n"
+
+
+def certification_rows(n: int, rng: random.Random) -> Iterator[Tuple]:
+    """(id, name_ko, name_en, tag, sub_tag, level, official_url, created_at, updated_at)"""
+    now = datetime.now(timezone.utc)
+    tags = list(TAG_SUB_TAGS)
+    for i in range(n):
+        stem = NAME_STEMS[rng.randrange(len(NAME_STEMS))]
+        suffix = GRADE_SUFFIXES[rng.randrange(len(GRADE_SUFFIXES))]
+        tag = tags[rng.randrange(len(tags))]
+        sub_tags = TAG_SUB_TAGS[tag]
+        yield (
+            uuid.UUID(int=rng.getrandbits(128), version=4),
+            f"{stem}{suffix} {i:06d}",
+            f"Synthetic {stem} {i:06d}",
+            tag,
+            sub_tags[rng.randrange(len(sub_tags))],
+            LEVELS[rng.randrange(len(LEVELS))],
+            f"https://example.com/certs/{i}" if rng.random() < 0.7 else None,
+            now,
+            now,
+        )
+
+
+def schedule_rows(cert_ids: List[uuid.UUID], total: int, years: Tuple[int, int], rng: random.Random) -> Iterator[Tuple]:
+    """
+    (cert_id, round, reg_start, reg_end, exam_date, result_date, created_at, updated_at)
+    자격증마다 total / len(cert_ids)회 (나머지는 앞쪽 자격증에 1회씩 더) — (cert_id, round) 유일
+    """
+    now = datetime.now(timezone.utc)
+    first = date(years[0], 1, 1)
+    span_days = (date(years[1], 12, 31) - first).days + 1
+    per_cert, extra = divmod(total, len(cert_ids))
+
+    for index, cert_id in enumerate(cert_ids):
+        rounds = per_cert + (1 if index < extra else 0)
+        for round_no in range(1, rounds + 1):
+            exam_date = first + timedelta(days=rng.randrange(span_days))
+            reg_start = reg_end = result_date = None
+            if rng.random() < 0.9:
+                reg_start = datetime.combine(exam_date - timedelta(days=rng.randint(25, 45)), datetime.min.time())
+                reg_end = reg_start + timedelta(days=rng.randint(3, 7))
+            if rng.random() < 0.85:
+                result_date = exam_date + timedelta(days=rng.randint(14, 45))
+            yield (cert_id, round_no, reg_start, reg_end, exam_date, result_date, now, now)
+
+
+# ============================================================
+# 적재
+# ============================================================
+
+def _copy(raw_conn, table: str, columns: Sequence[str], rows: Iterator[Tuple]) -> int:
+    """rows를 COPY_CHUNK_ROWS개씩 COPY FROM STDIN"""
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    count = 0
+    buffer = io.StringIO()
+    with raw_conn.cursor() as cur:
+        for row in rows:
+            buffer.write(_copy_line(row))
+            count += 1
+            if count % COPY_CHUNK_ROWS == 0:
+                buffer.seek(0)
+                cur.copy_expert(sql, buffer)
+                buffer = io.StringIO()
+                print(f"  {table}: {count:,}행", flush=True)
+        if buffer.tell():
+            buffer.seek(0)
+            cur.copy_expert(sql, buffer)
+    return count
+
+
+def _ensure_schema():
+    """테이블/인덱스/스키마 보강 DDL 적용 (API 기동 시와 같은 init_db)"""
+    from database import engine, init_db
+
+    async def _run():
+        try:
+            await init_db()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(_run())
+
+
+def load(certs: int, schedules: int, years: Tuple[int, int], seed: int, reset: bool):
+    from crawlers.base import get_sync_engine
+    from services.calendar_events import INSERT_EVENTS_SQL
+
+    _ensure_schema()
+    engine = get_sync_engine()
+
+    with engine.begin() as conn:
+        existing = conn.execute(text("SELECT COUNT(*) FROM certifications")).scalar() or 0
+        if existing and not reset:
+            raise SystemExit(f"❌ certifications에 이미 {existing:,}건이 있습니다 — 비우고 다시 채우려면 --reset")
+        if reset:
+            conn.execute(text("TRUNCATE calendar_events, exam_schedules, certifications RESTART IDENTITY CASCADE"))
+            print("🧹 기존 데이터 삭제")
+
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+
+    raw = engine.raw_connection()
+    try:
+        cert_rows = list(certification_rows(certs, rng))
+        _copy(raw, "certifications",
+              ("id", "name_ko", "name_en", "tag", "sub_tag", "level", "official_url", "created_at", "updated_at"),
+              iter(cert_rows))
+        print(f"✅ certifications {certs:,}건 ({time.perf_counter() - t0:.1f}s)")
+
+        t1 = time.perf_counter()
+        cert_ids = [row[0] for row in cert_rows]
+        del cert_rows
+        loaded = _copy(raw, "exam_schedules",
+                       ("cert_id", "round", "reg_start", "reg_end", "exam_date", "result_date", "created_at", "updated_at"),
+                       schedule_rows(cert_ids, schedules, years, rng))
+        raw.commit()
+        print(f"✅ exam_schedules {loaded:,}건 ({time.perf_counter() - t1:.1f}s)")
+    finally:
+        raw.close()
+
+    # calendar_events: 비어 있으므로 삭제 없이 일정 id 구간별 INSERT (services.calendar_events와 같은 SQL)
+    t2 = time.perf_counter()
+    with engine.connect() as conn:
+        ids = [row[0] for row in conn.execute(text("SELECT id FROM exam_schedules ORDER BY id"))]
+    for offset in range(0, len(ids), CALENDAR_BATCH):
+        with engine.begin() as conn:
+            conn.execute(INSERT_EVENTS_SQL, {"ids": ids[offset:offset + CALENDAR_BATCH]})
+        print(f"  calendar_events: 일정 {min(offset + CALENDAR_BATCH, len(ids)):,}/{len(ids):,}", flush=True)
+
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+            text("ANALYZE certifications, exam_schedules, calendar_events")
+        )
+        events = conn.execute(text("SELECT COUNT(*) FROM calendar_events")).scalar()
+    print(f"✅ calendar_events {events:,}건 ({time.perf_counter() - t2:.1f}s)")
+
+    _notify_api()
+    print(f"\n완료: 총 {time.perf_counter() - t0:.1f}s (seed={seed}, years={years[0]}-{years[1]})")
+
+
+def _notify_api():
+    """실행 중인 API 워커의 카탈로그 캐시 / 자동완성 인덱스 무효화 (services.invalidation 메시지 형식)"""
+    from crawlers.base import get_sync_engine
+
+    payload = json.dumps({"origin": "synthetic-data", "scopes": ["autocomplete", "catalog"], "reason": "synthetic-data"})
+    try:
+        with get_sync_engine().begin() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": settings.INVALIDATION_CHANNEL, "payload": payload},
+            )
+    except Exception as e:
+        print(f"⚠️ 캐시 무효화 알림 실패 (API 재시작 필요): {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 데이터 생성")
+    parser.add_argument("--certs", type=int, default=100_000, help="자격증 수")
+    parser.add_argument("--schedules", type=int, default=2_000_000, help="시험 일정 수 (자격증당 회차로 분배)")
+    parser.add_argument("--years", type=parse_years, default=parse_years(YEARS_DEFAULT), help="시험일 연도 범위 (예: 2025-2027)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 시드 = 같은 데이터)")
+    parser.add_argument("--reset", action="store_true", help="기존 certifications/exam_schedules/calendar_events 삭제 후 적재")
+    args = parser.parse_args()
+
+    if args.certs < 1 or args.schedules < 0:
+        parser.error("--certs는 1 이상, --schedules는 0 이상이어야 합니다")
+    load(args.certs, args.schedules, args.years, args.seed, args.reset)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+비동기 HTTP 크롤러 베이스 클래스
+
+한 소스가 여러 기관 사이트를 조회하는 크롤러(ITDomestic, Finance 등)는
+엔드포인트를 순차로 호출하면 응답 없는 사이트 하나가 timeout(30s)만큼 전체를 지연시킵니다.
+AsyncBaseScraper는 httpx.AsyncClient로 엔드포인트를 동시에 조회(fan-out)하고
+결과를 입력 순서대로 병합합니다. 3단계 Fallback 흐름과 DB 저장은 BaseScraper와 동일합니다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, TypeVar
+
+import httpx
+
+from crawlers.base import BaseScraper
+from crawlers.http_client import build_async_client
+
+T = TypeVar("T")
+
+# 엔드포인트 조회 함수: AsyncClient를 받아 파싱된 일정 목록을 반환
+Fetcher = Callable[[httpx.AsyncClient], Awaitable[List[Dict]]]
+
+
+def run_coroutine(coro_factory: Callable[[], Awaitable[T]]) -> T:
+    """
+    코루틴을 실행하고 결과를 반환 (동기 컨텍스트에서 호출)
+    크롤러는 run_in_executor 스레드에서 실행되므로 보통 새 이벤트 루프에서 실행되며,
+    이미 이벤트 루프가 돌고 있는 스레드라면 별도 스레드에서 실행합니다.
+    AsyncBaseScraper.run_async와 http_cache의 단계 메모 재검증이 함께 씁니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro_factory())
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(lambda: asyncio.run(coro_factory())).result()
+
+
+class AsyncBaseScraper(BaseScraper):
+    """
+    httpx.AsyncClient 기반 BaseScraper 변형
+    서브클래스는 try_official_api / try_web_scraping 안에서
+    self.fan_out([...])으로 여러 엔드포인트를 병렬 조회합니다.
+    """
+
+    request_timeout: float = 30.0
+    request_headers: Dict[str, str] | None = None  # None이면 BROWSER_HEADERS
+
+    def build_async_client(self) -> httpx.AsyncClient:
+        return build_async_client(timeout=self.request_timeout, headers=self.request_headers)
+
+    def fan_out(self, fetchers: List[Fetcher]) -> List[Dict]:
+        """여러 엔드포인트를 동시에 조회하고 결과를 병합 (동기 컨텍스트에서 호출)"""
+        if not fetchers:
+            return []
+        return self.run_async(lambda: self._fan_out(fetchers))
+
+    def run_async(self, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """코루틴을 실행하고 결과를 반환 (동기 컨텍스트에서 호출 — run_coroutine 참고)"""
+        return run_coroutine(coro_factory)
+
+    async def _fan_out(self, fetchers: List[Fetcher]) -> List[Dict]:
+        async with self.build_async_client() as client:
+            results = await asyncio.gather(
+                *(fetcher(client) for fetcher in fetchers),
+                return_exceptions=True,
+            )
+
+        schedules: List[Dict] = []
+        for fetcher, result in zip(fetchers, results):
+            if isinstance(result, BaseException):
+                name = getattr(fetcher, "__name__", repr(fetcher))
+                self.logger.warning(f"{name} 조회 에러: {result}")
+                continue
+            schedules.extend(result)
+        return schedules
+
+    def close(self):
+        """AsyncClient는 fan_out 호출마다 열고 닫으므로 정리할 리소스 없음"""
+        pass
@@ -1,6 +1,6 @@
 """
 크롤러 베이스 클래스 + DB 업서트 + 캐시 유틸리티
-guide.md 4.3: Conflict Resolution - 기존 데이터와 중복 시 updated_at만 갱신
+guide.md 4.3: Conflict Resolution - 기존 데이터와 중복 시 바뀐 값만 갱신 (같으면 updated_at 유지)
 
 3단계 Fallback 전략:
   1단계: 공식 API 호출 (가장 정확)
@@ -8,6 +8,7 @@ guide.md 4.3: Conflict Resolution - 기존 데이터와 중복 시 updated_at만
   3단계: 캐시 데이터 (마지막 성공 데이터)
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -15,11 +16,16 @@ from abc import ABC, abstractmethod
 from datetime import datetime, date
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
+from crawlers import dates
+
+if TYPE_CHECKING:
+    from crawlers.cert_resolver import CertResolver
+
 logger = logging.getLogger("crawlers.base")
 
 # 캐시 디렉토리
@@ -56,124 +62,207 @@ def get_sync_engine():
     
     logger.info(f"🔗 동기 DB 연결: {url.split('@')[-1] if '@' in url else '(default)'}")
     
-    return create_engine(
+    # 커넥션 획득 대기 시간 메트릭 + SQL 문장 통계 (설정 로드 실패 시 기본 풀 / 통계 없음)
+    try:
+        from services.metrics import TimedQueuePool, instrument_pool
+        from services.query_stats import instrument_engine as instrument_query_stats
+    except Exception:
+        TimedQueuePool, instrument_pool, instrument_query_stats = None, None, None
+
+    engine = create_engine(
         url,
         echo=False,
         pool_size=5,
         max_overflow=3,
         pool_recycle=1800,
         pool_pre_ping=True,
+        **({"poolclass": TimedQueuePool} if TimedQueuePool else {}),
     )
-
-
-def find_cert_id(session: Session, name_ko: str) -> Optional[str]:
-    """자격증 이름(한글)으로 cert_id 조회"""
-    result = session.execute(
-        text("SELECT id FROM certifications WHERE name_ko = :name"),
-        {"name": name_ko},
+    if instrument_pool:
+        instrument_pool(engine, "crawler")
+        instrument_query_stats(engine)
+    return engine
+
+
+# bulk upsert 1회당 최대 행 수 (파라미터 배열 크기 제한)
+BULK_UPSERT_CHUNK = 1000
+
+BULK_UPSERT_SQL = text("""
+    INSERT INTO exam_schedules (cert_id, round, reg_start, reg_end, exam_date, result_date)
+    SELECT * FROM unnest(
+        CAST(:cids AS uuid[]),
+        CAST(:rounds AS integer[]),
+        CAST(:rs AS date[]),
+        CAST(:re AS date[]),
+        CAST(:ed AS date[]),
+        CAST(:rd AS date[])
     )
-    row = result.fetchone()
-    return str(row[0]) if row else None
+    ON CONFLICT (cert_id, round) DO UPDATE
+    SET reg_start = COALESCE(EXCLUDED.reg_start, exam_schedules.reg_start),
+        reg_end = COALESCE(EXCLUDED.reg_end, exam_schedules.reg_end),
+        exam_date = COALESCE(EXCLUDED.exam_date, exam_schedules.exam_date),
+        result_date = COALESCE(EXCLUDED.result_date, exam_schedules.result_date),
+        updated_at = NOW()
+    -- 값이 실제로 바뀌는 행만 갱신 (같으면 updated_at / 트리거 / calendar_events 갱신 대상에서 제외)
+    WHERE (exam_schedules.reg_start, exam_schedules.reg_end, exam_schedules.exam_date, exam_schedules.result_date)
+          IS DISTINCT FROM
+          (COALESCE(EXCLUDED.reg_start, exam_schedules.reg_start),
+           COALESCE(EXCLUDED.reg_end, exam_schedules.reg_end),
+           COALESCE(EXCLUDED.exam_date, exam_schedules.exam_date),
+           COALESCE(EXCLUDED.result_date, exam_schedules.result_date))
+    RETURNING (xmax = 0) AS inserted
+""")
+
+# 일정 날짜 컬럼 (merge_schedule_rows 병합 / save_to_db 열 단위 파싱 공용)
+SCHEDULE_DATE_FIELDS = ("reg_start", "reg_end", "exam_date", "result_date")
+
+
+def merge_schedule_rows(rows: List[Dict]) -> List[Dict]:
+    """
+    같은 (cert_id, round)가 여러 번 나오면 순서대로 병합 (뒤쪽의 NULL이 아닌 값이 우선)
+    — 건별 upsert를 순서대로 실행한 것과 동일한 결과
+    """
+    merged: Dict[tuple, Dict] = {}
+    for row in rows:
+        key = (str(row["cert_id"]), row["round"])
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = dict(row)
+        else:
+            for field in SCHEDULE_DATE_FIELDS:
+                if row.get(field) is not None:
+                    existing[field] = row[field]
+    return list(merged.values())
+
+
+def bulk_upsert_schedules(session: Session, rows: List[Dict]) -> Dict[str, int]:
+    """
+    시험 일정 일괄 업서트 — (cert_id, round) 기준 업서트(guide.md 4.3 Conflict Resolution)를 INSERT ... ON CONFLICT 한 번으로 처리
+    - (cert_id, round) 충돌 시 NULL이 아닌 값만 COALESCE로 갱신 + updated_at 갱신 (값이 바뀌는 행만)
+    - 갱신 결과가 기존 값과 같은 행은 건드리지 않음 (updated_at 유지)
+    - 한 배치 안의 중복 (cert_id, round)는 merge_schedule_rows로 먼저 병합
 
+    Args:
+        rows: {"cert_id", "round", "reg_start", "reg_end", "exam_date", "result_date"} 목록
 
-def find_cert_id_like(session: Session, keyword: str) -> Optional[str]:
-    """자격증 이름 부분일치로 cert_id 조회"""
-    result = session.execute(
-        text("SELECT id FROM certifications WHERE name_ko ILIKE :kw OR name_en ILIKE :kw LIMIT 1"),
-        {"kw": f"%{keyword}%"},
-    )
-    row = result.fetchone()
-    return str(row[0]) if row else None
-
-
-def upsert_schedule(
-    session: Session,
-    cert_id: str,
-    round_no: int,
-    reg_start: Optional[date],
-    reg_end: Optional[date],
-    exam_date: Optional[date],
-    result_date: Optional[date],
-) -> str:
-    """
-    시험 일정 업서트 (guide.md 4.3 Conflict Resolution)
-    - cert_id + round 조합으로 기존 데이터 확인
-    - 기존 데이터 있으면 updated_at만 갱신
-    - 없으면 새로 INSERT
+    Returns:
+        {"inserted": N, "updated": M, "unchanged": K} — 병합 후 행 기준
     """
-    existing = session.execute(
-        text("SELECT id FROM exam_schedules WHERE cert_id = :cid AND round = :r"),
-        {"cid": cert_id, "r": round_no},
-    ).fetchone()
+    items = merge_schedule_rows(rows)
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
 
-    if existing:
-        session.execute(
-            text("""
-                UPDATE exam_schedules
-                SET reg_start = COALESCE(:rs, reg_start),
-                    reg_end = COALESCE(:re, reg_end),
-                    exam_date = COALESCE(:ed, exam_date),
-                    result_date = COALESCE(:rd, result_date),
-                    updated_at = NOW()
-                WHERE cert_id = :cid AND round = :r
-            """),
+    for i in range(0, len(items), BULK_UPSERT_CHUNK):
+        chunk = items[i:i + BULK_UPSERT_CHUNK]
+        result = session.execute(
+            BULK_UPSERT_SQL,
             {
-                "rs": reg_start,
-                "re": reg_end,
-                "ed": exam_date,
-                "rd": result_date,
-                "cid": cert_id,
-                "r": round_no,
+                "cids": [str(r["cert_id"]) for r in chunk],
+                "rounds": [r["round"] for r in chunk],
+                "rs": [r.get("reg_start") for r in chunk],
+                "re": [r.get("reg_end") for r in chunk],
+                "ed": [r.get("exam_date") for r in chunk],
+                "rd": [r.get("result_date") for r in chunk],
             },
         )
-        return "updated"
-    else:
-        session.execute(
-            text("""
-                INSERT INTO exam_schedules (cert_id, round, reg_start, reg_end, exam_date, result_date)
-                VALUES (:cid, :r, :rs, :re, :ed, :rd)
-            """),
-            {
-                "cid": cert_id,
-                "r": round_no,
-                "rs": reg_start,
-                "re": reg_end,
-                "ed": exam_date,
-                "rd": result_date,
-            },
+        written = result.fetchall()
+        for (inserted,) in written:
+            counts["inserted" if inserted else "updated"] += 1
+        counts["unchanged"] += len(chunk) - len(written)
+
+    return counts
+
+
+# bulk URL 갱신 — 상시접수 자격증(Cloud / Intl Cert)의 certifications.official_url
+BULK_URL_UPDATE_SQL = text("""
+    UPDATE certifications AS c
+    SET official_url = v.url, updated_at = NOW()
+    FROM unnest(CAST(:cids AS uuid[]), CAST(:urls AS text[])) AS v(id, url)
+    WHERE c.id = v.id AND c.official_url IS DISTINCT FROM v.url
+    RETURNING c.id
+""")
+
+
+def bulk_update_official_urls(session: Session, rows: List[Dict]) -> Dict[str, int]:
+    """
+    certifications.official_url 일괄 갱신 — URL이 실제로 바뀌는 자격증만 UPDATE (updated_at 포함)
+
+    Args:
+        rows: {"cert_id", "official_url"} 목록 (같은 cert_id는 뒤쪽이 우선)
+
+    Returns:
+        {"updated": N, "unchanged": M}
+    """
+    latest = {str(r["cert_id"]): r["official_url"] for r in rows}
+    items = list(latest.items())
+    counts = {"updated": 0, "unchanged": 0}
+
+    for i in range(0, len(items), BULK_UPSERT_CHUNK):
+        chunk = items[i:i + BULK_UPSERT_CHUNK]
+        result = session.execute(
+            BULK_URL_UPDATE_SQL,
+            {"cids": [cid for cid, _ in chunk], "urls": [url for _, url in chunk]},
         )
-        return "inserted"
+        written = len(result.fetchall())
+        counts["updated"] += written
+        counts["unchanged"] += len(chunk) - written
+
+    return counts
 
 
 # ============================================================
-# 날짜 파싱
+# 변경 감지 (소스별 정규화 행 집합 지문)
 # ============================================================
 
-def parse_date(date_str: str) -> Optional[date]:
-    """다양한 날짜 형식 파싱"""
-    if not date_str or not date_str.strip():
-        return None
+def rows_fingerprint(rows: List[Dict]) -> str:
+    """정규화된 행 집합의 SHA-256 — 행 순서와 무관"""
+    lines = sorted(json.dumps(row, sort_keys=True, default=str, ensure_ascii=False) for row in rows)
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
 
-    date_str = date_str.strip().replace(".", "-").replace("/", "-")
 
-    for fmt in ["%Y-%m-%d", "%Y-%m-%d(%a)", "%Y-%m-%d(%A)", "%m-%d"]:
-        try:
-            parsed = datetime.strptime(date_str, fmt)
-            if fmt == "%m-%d":
-                parsed = parsed.replace(year=datetime.now().year)
-            return parsed.date()
-        except ValueError:
-            continue
-
-    # 숫자만 추출 시도 (20260315 형태)
-    digits = "".join(c for c in date_str if c.isdigit())
-    if len(digits) == 8:
-        try:
-            return datetime.strptime(digits, "%Y%m%d").date()
-        except ValueError:
-            pass
+def load_fingerprint(session: Session, source: str, max_age_hours: Optional[float] = None) -> Optional[str]:
+    """
+    마지막으로 저장한 행 집합 지문 (crawl_fingerprints)
+    max_age_hours보다 오래된 지문은 None — 지문은 DB가 아닌 지난 크롤링 결과와의 비교이므로,
+    수동 SQL 수정 / 부분 복구 / 수동 삭제된 행도 주기적으로 다시 써서 맞춤
+    """
+    if max_age_hours is None:
+        from crawlers.http_client import get_crawl_setting
+        max_age_hours = float(get_crawl_setting("CRAWL_FINGERPRINT_MAX_AGE_HOURS", 168.0))
+    row = session.execute(
+        text("""
+            SELECT fingerprint FROM crawl_fingerprints
+            WHERE source = :s AND updated_at > NOW() - make_interval(secs => :age)
+        """),
+        {"s": source, "age": max_age_hours * 3600},
+    ).fetchone()
+    return row[0] if row else None
+
+
+def save_fingerprint(session: Session, source: str, fingerprint: str, row_count: int):
+    """행 집합 지문 저장 — DB 쓰기와 같은 트랜잭션에서 호출"""
+    session.execute(
+        text("""
+            INSERT INTO crawl_fingerprints (source, fingerprint, row_count, updated_at)
+            VALUES (:s, :f, :n, NOW())
+            ON CONFLICT (source) DO UPDATE
+            SET fingerprint = EXCLUDED.fingerprint, row_count = EXCLUDED.row_count, updated_at = NOW()
+        """),
+        {"s": source, "f": fingerprint, "n": row_count},
+    )
 
-    return None
+
+# ============================================================
+# 날짜 파싱
+# ============================================================
+
+# 정규식 빠른 경로 + 메모 캐시 구현은 crawlers.dates — 기존 호출부 호환용
+def parse_date(date_str: str) -> Optional[date]:
+    """다양한 날짜 형식 파싱 (2026.03.15 / 2026-03-15(토) / 20260315 / 03/15)"""
+    return dates.parse_date(date_str)
 
 
 # ============================================================
@@ -240,8 +329,26 @@ class BaseScraper(ABC):
 
     def __init__(self):
         self.logger = logging.getLogger(self.source_name)
-        self.stats = {"found": 0, "inserted": 0, "updated": 0, "skipped": 0}
+        self.stats = {"found": 0, "inserted": 0, "updated": 0, "skipped": 0, "unchanged": 0}
         self.method_used = "none"  # 어떤 단계에서 데이터를 가져왔는지 기록
+        # 1·2단계 원본 응답이 지난 실행과 모두 같아 이전 파싱 결과를 재사용했는지 (crawlers.http_cache)
+        self.http_unchanged = False
+        # 자격증 이름 해석기 — 배치 실행 시 호출자가 한 번 로드해 주입, 없으면 저장 시 로드
+        self.resolver: Optional["CertResolver"] = None
+
+    def stage_inputs(self) -> Dict:
+        """
+        요청 URL/본문이나 파싱 필터에 들어가는 값 (crawlers.http_cache 단계 메모 키)
+        기본은 조회 연도 — 연도 외 입력을 쓰는 스크래퍼는 재정의
+        """
+        return {"year": getattr(self, "year", None)}
+
+    def get_resolver(self, session: Session) -> "CertResolver":
+        """주입된 해석기 반환 (없으면 certifications를 한 번 읽어 생성)"""
+        if self.resolver is None:
+            from crawlers.cert_resolver import CertResolver
+            self.resolver = CertResolver.load(session)
+        return self.resolver
 
     def fetch_schedules(self) -> List[Dict]:
         """
@@ -251,23 +358,23 @@ class BaseScraper(ABC):
             수집된 일정 목록 (어떤 단계에서든 성공하면 반환)
         """
 
+        from crawlers.http_cache import run_stage
+
         # === 1단계: 공식 API ===
         self.logger.info("📡 [1단계] 공식 API 호출 시도...")
-        schedules = self.try_official_api()
+        schedules, self.http_unchanged = run_stage(self, "api", self.try_official_api)
         if schedules:
             self.method_used = "api"
-            self.logger.info(f"✅ [1단계 성공] API에서 {len(schedules)}건 수집")
-            save_cache(self.source_name, schedules)
+            self._log_stage_success("1단계", "API", schedules)
             return schedules
         self.logger.info("⚠️  [1단계 실패] API에서 데이터를 가져오지 못함")
 
         # === 2단계: 웹 크롤링 ===
         self.logger.info("🕷️  [2단계] 웹 크롤링 시도...")
-        schedules = self.try_web_scraping()
+        schedules, self.http_unchanged = run_stage(self, "scraping", self.try_web_scraping)
         if schedules:
             self.method_used = "scraping"
-            self.logger.info(f"✅ [2단계 성공] 크롤링에서 {len(schedules)}건 수집")
-            save_cache(self.source_name, schedules)
+            self._log_stage_success("2단계", "크롤링", schedules)
             return schedules
         self.logger.info("⚠️  [2단계 실패] 크롤링에서 데이터를 가져오지 못함")
 
@@ -283,6 +390,50 @@ class BaseScraper(ABC):
         self.method_used = "failed"
         return []
 
+    def _log_stage_success(self, stage: str, label: str, schedules: List[Dict]):
+        if self.http_unchanged:
+            # 응답이 그대로면 fallback 캐시 파일도 이미 같은 내용
+            self.logger.info(f"♻️ [{stage} 성공] {label} 응답 변경 없음 → 이전 파싱 결과 {len(schedules)}건 재사용")
+            return
+        self.logger.info(f"✅ [{stage} 성공] {label}에서 {len(schedules)}건 수집")
+        save_cache(self.source_name, schedules)
+
+    def write_changes(
+        self,
+        session: Session,
+        rows: List[Dict],
+        write: Callable[[Session, List[Dict]], Dict[str, int]],
+    ):
+        """
+        정규화된 행 집합 저장 (save_to_db 공통)
+        - 지문이 지난 저장과 같으면 쓰기 단계 전체 생략 → 전부 unchanged
+          (지문이 CRAWL_FINGERPRINT_MAX_AGE_HOURS보다 오래됐거나 CRAWL_FORCE_WRITE면 생략하지 않음)
+        - 다르면 write()로 바뀐 행만 쓰고 지문 갱신 (같은 트랜잭션 — 커밋은 호출자)
+        """
+        from crawlers.http_client import get_crawl_setting
+
+        fingerprint = rows_fingerprint(rows)
+        force = get_crawl_setting("CRAWL_FORCE_WRITE", False)
+        if not force and fingerprint == load_fingerprint(session, self.source_name):
+            self.stats["unchanged"] += len(rows)
+            self.logger.info(f"♻️ {self.source_name}: 일정 집합 변경 없음 → DB 쓰기 생략 ({len(rows)}건)")
+            return
+
+        counts = write(session, rows) if rows else {}
+        for key, value in counts.items():
+            self.stats[key] = self.stats.get(key, 0) + value
+        save_fingerprint(session, self.source_name, fingerprint, len(rows))
+
+    def log_summary(self):
+        self.logger.info(
+            f"📊 {self.source_name} 완료 [방법: {self.method_used}]: "
+            f"매칭 {self.stats['found']}건, "
+            f"신규 {self.stats['inserted']}건, "
+            f"업데이트 {self.stats['updated']}건, "
+            f"변경 없음 {self.stats['unchanged']}건, "
+            f"건너뜀 {self.stats['skipped']}건"
+        )
+
     @abstractmethod
     def try_official_api(self) -> List[Dict]:
         """1단계: 공식 API 호출 (서브클래스에서 구현)"""
@@ -303,14 +454,14 @@ class BaseScraper(ABC):
             return self.stats
 
         with Session(engine) as session:
+            resolver = self.get_resolver(session)
+            matched = []
             for sch in schedules:
                 cert_name = sch.get("cert_name", "")
                 if not cert_name:
                     continue
 
-                cert_id = find_cert_id(session, cert_name)
-                if not cert_id:
-                    cert_id = find_cert_id_like(session, cert_name)
+                cert_id = resolver.resolve(cert_name)
 
                 if not cert_id:
                     self.logger.warning(f"DB에서 '{cert_name}' 자격증을 찾을 수 없음 → 건너뜀")
@@ -318,26 +469,27 @@ class BaseScraper(ABC):
                     continue
 
                 self.stats["found"] += 1
-                result = upsert_schedule(
-                    session=session,
-                    cert_id=cert_id,
-                    round_no=sch.get("round", 1),
-                    reg_start=parse_date(str(sch.get("reg_start", ""))),
-                    reg_end=parse_date(str(sch.get("reg_end", ""))),
-                    exam_date=parse_date(str(sch.get("exam_date", ""))),
-                    result_date=parse_date(str(sch.get("result_date", ""))),
-                )
-                self.stats[result] = self.stats.get(result, 0) + 1
-
+                matched.append((cert_id, sch))
+
+            # 날짜는 열 단위로 정규화 (열 안에서 같은 값은 한 번만 파싱)
+            columns = {
+                field: dates.parse_dates(sch.get(field) for _, sch in matched)
+                for field in SCHEDULE_DATE_FIELDS
+            }
+            rows = [
+                {
+                    "cert_id": cert_id,
+                    "round": sch.get("round", 1),
+                    **{field: columns[field][i] for field in SCHEDULE_DATE_FIELDS},
+                }
+                for i, (cert_id, sch) in enumerate(matched)
+            ]
+
+            # 지난 저장과 다르면 소스 전체 일정을 INSERT ... ON CONFLICT 한 번으로 저장 (바뀐 행만 갱신)
+            self.write_changes(session, merge_schedule_rows(rows), bulk_upsert_schedules)
             session.commit()
 
-        self.logger.info(
-            f"📊 {self.source_name} 완료 [방법: {self.method_used}]: "
-            f"매칭 {self.stats['found']}건, "
-            f"신규 {self.stats['inserted']}건, "
-            f"업데이트 {self.stats['updated']}건, "
-            f"건너뜀 {self.stats['skipped']}건"
-        )
+        self.log_summary()
         return self.stats
 
     @abstractmethod
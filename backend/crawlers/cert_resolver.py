@@ -0,0 +1,203 @@
+"""
+자격증 이름 → cert_id 메모리 해석기 (크롤링 1회당 1번 로드)
+
+기존에는 크롤링한 행마다 정확일치 → 부분일치(ILIKE '%kw%' LIMIT 1) 쿼리를 실행했습니다. ILIKE 부분일치는 인덱스를 못 타고, 여러 건이 걸리면 어떤 행이
+선택될지 보장되지 않습니다. CertResolver는 certifications 테이블을 한 번 읽어
+정규화 인덱스를 만든 뒤 아래 순서로 메모리에서 해석합니다.
+
+  1. 정확일치      name_ko == name
+  2. 정규화 일치   대소문자/공백/기호 무시 (name_ko, name_en)
+  3. 별칭 일치     괄호 안/밖 표기 ("SQLD (SQL개발자)" → "SQLD", "SQL개발자")
+  4. 토큰 접두사   모든 검색 토큰이 어떤 이름 토큰의 접두사
+  5. 부분일치      정규화 이름에 정규화 검색어 포함 (기존 ILIKE 의미)
+  6. 유사도        difflib 최고 점수 (동점 시 결정적 순서)
+
+동일 단계에서 후보가 여러 개면 (이름 길이, name_ko, id) 순으로 하나를 고릅니다.
+결과는 검색어별로 메모이제이션되어 반복 조회는 dict 조회 1회입니다.
+"""
+
+import bisect
+import difflib
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+_NON_WORD = re.compile(r"[\W_]+")
+_PAREN = re.compile(r"[(\[]([^)\]]*)[)\]]")
+
+# 별칭이 여러 자격증에 걸리는 경우 표시 (모호한 별칭은 해석에 사용하지 않음)
+_AMBIGUOUS = object()
+
+
+def fold(name: str) -> str:
+    """대소문자/공백/기호를 제거한 비교용 키"""
+    return _NON_WORD.sub("", (name or "").casefold())
+
+
+def tokenize(name: str) -> List[str]:
+    """비교용 토큰 목록 (기호/공백 기준 분리 후 fold)"""
+    return [t for t in _NON_WORD.split((name or "").casefold()) if t]
+
+
+def aliases_of(name: str) -> Set[str]:
+    """
+    괄호 표기에서 별칭 추출
+    "SQLD (SQL개발자)" → {"SQLD", "SQL개발자"}
+    "재무위험관리사 (국내FRM)" → {"재무위험관리사", "국내FRM"}
+    """
+    if not name:
+        return set()
+    aliases = {m.strip() for m in _PAREN.findall(name)}
+    outside = _PAREN.sub(" ", name).strip()
+    if outside and outside != name:
+        aliases.add(outside)
+    return {a for a in aliases if fold(a)}
+
+
+class CertResolver:
+    """certifications 전체를 메모리에 올린 이름 해석기 (읽기 전용, 스레드 안전)"""
+
+    FUZZY_CUTOFF = 0.85
+
+    def __init__(self, rows: Iterable[Tuple[str, str, str]]):
+        """
+        Args:
+            rows: (id, name_ko, name_en) 목록
+        """
+        self._exact: Dict[str, str] = {}
+        self._folded: Dict[str, object] = {}
+        self._alias: Dict[str, object] = {}
+        self._token_ids: Dict[str, Set[str]] = {}
+        self._sort_key: Dict[str, Tuple[int, str, str]] = {}
+        self._searchable: List[Tuple[str, str]] = []  # (정규화 이름, id) — 부분일치/유사도용
+        self._memo: Dict[str, Optional[str]] = {}
+
+        for cert_id, name_ko, name_en in rows:
+            cert_id = str(cert_id)
+            name_ko = name_ko or ""
+            name_en = name_en or ""
+            self._sort_key[cert_id] = (len(name_ko), name_ko, cert_id)
+            self._exact.setdefault(name_ko, cert_id)
+
+            for name in (name_ko, name_en):
+                key = fold(name)
+                if not key:
+                    continue
+                self._add_unique(self._folded, key, cert_id)
+                self._searchable.append((key, cert_id))
+                for token in tokenize(name):
+                    self._token_ids.setdefault(token, set()).add(cert_id)
+                for alias in aliases_of(name):
+                    self._add_unique(self._alias, fold(alias), cert_id)
+
+        self._tokens: List[str] = sorted(self._token_ids)
+        # 부분일치/유사도 결과가 항상 같도록 정렬
+        self._searchable.sort(key=lambda item: (len(item[0]), item[0], item[1]))
+        self._searchable_keys: List[str] = list(dict.fromkeys(k for k, _ in self._searchable))
+        self._first_id_by_key: Dict[str, str] = {}
+        for key, cert_id in self._searchable:
+            self._first_id_by_key.setdefault(key, cert_id)
+
+    @classmethod
+    def load(cls, session: Session) -> "CertResolver":
+        """certifications 테이블 전체를 한 번 읽어 해석기 생성"""
+        result = session.execute(text("SELECT id, name_ko, name_en FROM certifications"))
+        return cls(result.fetchall())
+
+    def __len__(self) -> int:
+        return len(self._sort_key)
+
+    @staticmethod
+    def _add_unique(index: Dict[str, object], key: str, cert_id: str):
+        existing = index.get(key)
+        if existing is None:
+            index[key] = cert_id
+        elif existing != cert_id:
+            index[key] = _AMBIGUOUS
+
+    def _pick(self, candidates: Iterable[str]) -> Optional[str]:
+        """후보 중 결정적으로 하나 선택 (짧은 이름 → name_ko → id 순)"""
+        return min(candidates, key=self._sort_key.__getitem__, default=None)
+
+    # ------------------------------------------------------------
+    # 해석
+    # ------------------------------------------------------------
+
+    def resolve(self, name: str) -> Optional[str]:
+        """이름 → cert_id (못 찾으면 None)"""
+        if not name:
+            return None
+        if name in self._memo:
+            return self._memo[name]
+        cert_id = self._resolve(name)
+        self._memo[name] = cert_id
+        return cert_id
+
+    def _resolve(self, name: str) -> Optional[str]:
+        # 1. 정확일치 (기존 name_ko = :name 쿼리)
+        cert_id = self._exact.get(name) or self._exact.get(name.strip())
+        if cert_id:
+            return cert_id
+
+        key = fold(name)
+        if not key:
+            return None
+
+        # 2~3. 정규화 이름 / 별칭 (모호하면 다음 단계로)
+        for index in (self._folded, self._alias):
+            hit = index.get(key)
+            if isinstance(hit, str):
+                return hit
+
+        # 4. 토큰 접두사
+        cert_id = self._pick(self._token_prefix_candidates(name))
+        if cert_id:
+            return cert_id
+
+        # 5. 부분일치 (기존 ILIKE '%kw%' 쿼리)
+        for searchable_key, cert_id in self._searchable:
+            if key in searchable_key:
+                return cert_id
+
+        # 6. 유사도
+        matches = difflib.get_close_matches(key, self._searchable_keys, n=1, cutoff=self.FUZZY_CUTOFF)
+        if matches:
+            return self._first_id_by_key[matches[0]]
+
+        return None
+
+    def _token_prefix_candidates(self, name: str) -> Set[str]:
+        """모든 검색 토큰이 어떤 이름 토큰의 접두사인 자격증 집합"""
+        candidates: Optional[Set[str]] = None
+        for query_token in tokenize(name):
+            ids: Set[str] = set()
+            i = bisect.bisect_left(self._tokens, query_token)
+            while i < len(self._tokens) and self._tokens[i].startswith(query_token):
+                ids |= self._token_ids[self._tokens[i]]
+                i += 1
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return candidates or set()
+
+
+def load_resolver(engine=None) -> Optional[CertResolver]:
+    """
+    배치 크롤링용 해석기 1회 로드
+    실패 시 None 반환 → 각 스크래퍼가 save_to_db에서 직접 로드 (소스별 실패 격리 유지)
+    """
+    import logging
+
+    from crawlers.base import get_sync_engine
+
+    logger = logging.getLogger("crawlers.cert_resolver")
+    try:
+        with Session(engine or get_sync_engine()) as session:
+            resolver = CertResolver.load(session)
+        logger.info(f"🔎 자격증 이름 해석기 로드: {len(resolver)}건")
+        return resolver
+    except Exception as e:
+        logger.warning(f"⚠️ 자격증 이름 해석기 로드 실패 (소스별로 재시도): {e}")
+        return None
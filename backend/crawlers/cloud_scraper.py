@@ -12,19 +12,16 @@ Note: 클라우드 자격증은 상시접수 형태가 많아
 """
 
 import httpx
-from datetime import datetime
-from typing import List, Dict, Optional
-
-from crawlers.base import (
-    BaseScraper,
-    get_sync_engine,
-    find_cert_id_like,
-)
-from sqlalchemy import text
+from typing import List, Dict
+
+from crawlers.async_base import AsyncBaseScraper
+from crawlers.base import bulk_update_official_urls, get_sync_engine
+from crawlers.http_client import USER_AGENT
+from crawlers.liveness import check_liveness
 from sqlalchemy.orm import Session
 
 
-class CloudScraper(BaseScraper):
+class CloudScraper(AsyncBaseScraper):
     """클라우드 벤더 자격증 크롤러 — 3단계 Fallback"""
 
     source_name = "cloud"
@@ -120,17 +117,8 @@ class CloudScraper(BaseScraper):
         },
     ]
 
-    def __init__(self):
-        super().__init__()
-        self.client = httpx.Client(
-            timeout=20.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-            },
-        )
+    request_timeout = 20.0
+    request_headers = {"User-Agent": USER_AGENT}
 
     # ============================================================
     # 1단계: 벤더 공식 API 시도
@@ -138,27 +126,21 @@ class CloudScraper(BaseScraper):
 
     def try_official_api(self) -> List[Dict]:
         """
-        AWS/Azure 공식 Certification API 호출
+        AWS/Azure 공식 Certification API 호출 (동시 조회)
         - AWS: certification directory API
         - Azure: Microsoft Learn certifications API
         - GCP: 공개 API 없음
         """
-        results = []
-
-        # AWS API
-        aws_results = self._try_aws_api()
-        results.extend(aws_results)
-
-        # Azure API
-        azure_results = self._try_azure_api()
-        results.extend(azure_results)
+        results = self.fan_out([self._try_aws_api, self._try_azure_api])
 
         if results:
-            self.logger.info(f"API에서 {len(results)}건 정보 수집 (AWS: {len(aws_results)}, Azure: {len(azure_results)})")
+            aws_count = sum(1 for r in results if r["vendor"] == "AWS")
+            azure_count = len(results) - aws_count
+            self.logger.info(f"API에서 {len(results)}건 정보 수집 (AWS: {aws_count}, Azure: {azure_count})")
 
         return results
 
-    def _try_aws_api(self) -> List[Dict]:
+    async def _try_aws_api(self, client: httpx.AsyncClient) -> List[Dict]:
         """AWS Certification Directory API 호출"""
         try:
             api_entry = next(
@@ -168,7 +150,7 @@ class CloudScraper(BaseScraper):
             if not api_entry:
                 return []
 
-            response = self.client.get(api_entry["api_url"])
+            response = await client.get(api_entry["api_url"])
             response.raise_for_status()
 
             data = response.json()
@@ -201,7 +183,7 @@ class CloudScraper(BaseScraper):
             self.logger.warning(f"AWS API 에러: {e}")
             return []
 
-    def _try_azure_api(self) -> List[Dict]:
+    async def _try_azure_api(self, client: httpx.AsyncClient) -> List[Dict]:
         """Azure/Microsoft Learn Certification API 호출"""
         try:
             api_entry = next(
@@ -211,7 +193,7 @@ class CloudScraper(BaseScraper):
             if not api_entry:
                 return []
 
-            response = self.client.get(api_entry["api_url"])
+            response = await client.get(api_entry["api_url"])
             response.raise_for_status()
 
             data = response.json()
@@ -251,45 +233,9 @@ class CloudScraper(BaseScraper):
         각 벤더의 공식 자격증 페이지 URL 유효성 확인
         - 상시접수 자격증이므로 특정 일정보다는 URL 유효성 + 업데이트 확인
         - 페이지가 200 응답이면 'active', 아니면 'inactive' 처리
+        - liveness 엔진으로 중복 제거 후 병렬 HEAD 요청
         """
-        results = []
-
-        for cert_info in self.CLOUD_CERTS:
-            try:
-                response = self.client.head(cert_info["web_url"])
-                is_active = response.status_code < 400
-
-                results.append({
-                    "cert_name": cert_info["keyword"],
-                    "vendor": cert_info["vendor"],
-                    "status": "active" if is_active else "inactive",
-                    "cert_type": cert_info["cert_type"],
-                    "web_url": cert_info["web_url"],
-                    "round": 0,
-                    "reg_start": "",
-                    "reg_end": "",
-                    "exam_date": "",
-                    "result_date": "",
-                })
-
-                status_emoji = "✅" if is_active else "⚠️"
-                self.logger.info(f"  {status_emoji} {cert_info['keyword']}: {response.status_code}")
-
-            except Exception as e:
-                self.logger.warning(f"  ❌ {cert_info['keyword']}: 연결 실패 ({e})")
-                results.append({
-                    "cert_name": cert_info["keyword"],
-                    "vendor": cert_info["vendor"],
-                    "status": "error",
-                    "cert_type": cert_info["cert_type"],
-                    "web_url": cert_info["web_url"],
-                    "round": 0,
-                    "reg_start": "",
-                    "reg_end": "",
-                    "exam_date": "",
-                    "result_date": "",
-                })
-
+        results = check_liveness(self, self.CLOUD_CERTS)
         return results if results else []
 
     # ============================================================
@@ -309,12 +255,14 @@ class CloudScraper(BaseScraper):
             return self.stats
 
         with Session(engine) as session:
+            resolver = self.get_resolver(session)
+            rows = []
             for sch in schedules:
                 keyword = sch.get("cert_name", "")
                 if not keyword:
                     continue
 
-                cert_id = find_cert_id_like(session, keyword)
+                cert_id = resolver.resolve(keyword)
                 if not cert_id:
                     self.logger.warning(f"DB에서 '{keyword}' 자격증 못찾음 → 건너뜀")
                     self.stats["skipped"] += 1
@@ -324,33 +272,18 @@ class CloudScraper(BaseScraper):
                 status = sch.get("status", "active")
                 web_url = sch.get("web_url", "")
 
-                # official_url 업데이트 + updated_at 갱신
                 if status == "active" and web_url:
-                    session.execute(
-                        text("""
-                            UPDATE certifications
-                            SET official_url = :url, updated_at = NOW()
-                            WHERE id = :cid
-                        """),
-                        {"url": web_url, "cid": cert_id},
-                    )
-                    self.stats["updated"] = self.stats.get("updated", 0) + 1
+                    rows.append({"cert_id": cert_id, "official_url": web_url})
                 else:
                     self.stats["skipped"] += 1
 
+            # official_url이 실제로 바뀐 자격증만 UPDATE (+ updated_at 갱신)
+            self.write_changes(session, rows, bulk_update_official_urls)
             session.commit()
 
-        self.logger.info(
-            f"📊 {self.source_name} 완료 [방법: {self.method_used}]: "
-            f"매칭 {self.stats['found']}건, "
-            f"업데이트 {self.stats['updated']}건, "
-            f"건너뜀 {self.stats['skipped']}건"
-        )
+        self.log_summary()
         return self.stats
 
-    def close(self):
-        self.client.close()
-
 
 def run():
     """Cloud 크롤러 메인 실행 함수"""
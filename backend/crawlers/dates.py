@@ -0,0 +1,158 @@
+"""
+크롤러 날짜 정규화 (정규식 빠른 경로 + 메모 캐시 + 열 단위 일괄 처리)
+
+기존 base.parse_date는 값마다 strptime 형식 4개를 차례로 시도(실패마다 ValueError)한 뒤
+숫자만 뽑아 다시 strptime을 호출했습니다. 시험일정 열은 같은 날짜가 반복되고
+형식도 몇 가지뿐이라, 여기서는 결과가 같은 더 싼 경로를 먼저 탑니다.
+
+  빠른 경로 1 — 정규식 한 번: 2026.03.15 / 2026-3-5 / 2026/03/15 / 03/15 (→ 올해)
+  빠른 경로 2 — 숫자가 정확히 8개: 20260315 / 2026-03-15(토) / "접수 2026.03.15" → 자리로 잘라 date()
+  그 밖       — 기존 구현 그대로 (_parse_legacy: 영문 요일 + 한 자리 월/일, 전각 숫자 등)
+
+결과는 기존 parse_date와 같습니다 (잘못된 날짜 → None, 02-29 처럼 1900년 기준으로
+없는 월-일 → None, 월-일 형식 → 올해). benchmarks.bench_dates가 기존 구현과 결과를 비교합니다.
+
+같은 문자열은 lru_cache로 한 번만 파싱합니다. 월-일 형식은 올해에 따라 결과가 바뀌므로
+연도를 캐시 키에 포함합니다.
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+# 메모 캐시 크기 — 한 크롤 사이클의 서로 다른 날짜 문자열 수보다 넉넉하게
+MEMO_SIZE = 4096
+
+# strip()된 문자열 전체와 일치 — 구분자는 기존 구현의 "." / "/" → "-" 치환과 같은 집합
+_DATE_RE = re.compile(
+    r"(?:(?P<y>[0-9]{4})[-./](?P<m>[0-9]{1,2})[-./](?P<d>[0-9]{1,2})"  # 연-월-일
+    r"|(?P<md_m>[0-9]{1,2})[-./](?P<md_d>[0-9]{1,2}))"                # 월-일 (→ 올해)
+)
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
+
+# ============================================================
+# 기존 구현 (느린 경로 / 벤치마크 기준)
+# ============================================================
+
+def _parse_legacy(date_str: str, year: Optional[int] = None) -> Optional[date]:
+    """이전 base.parse_date 그대로 — year는 월-일 형식에 쓸 연도 (기본 올해)"""
+    if not date_str or not date_str.strip():
+        return None
+
+    date_str = date_str.strip().replace(".", "-").replace("/", "-")
+
+    for fmt in ["%Y-%m-%d", "%Y-%m-%d(%a)", "%Y-%m-%d(%A)", "%m-%d"]:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+            if fmt == "%m-%d":
+                parsed = parsed.replace(year=year or datetime.now().year)
+            return parsed.date()
+        except ValueError:
+            continue
+
+    # 숫자만 추출 시도 (20260315 형태)
+    digits = "".join(c for c in date_str if c.isdigit())
+    if len(digits) == 8:
+        try:
+            return datetime.strptime(digits, "%Y%m%d").date()
+        except ValueError:
+            pass
+
+    return None
+
+
+# ============================================================
+# 빠른 경로
+# ============================================================
+
+def _make_date(y: int, m: int, d: int) -> Optional[date]:
+    try:
+        return date(y, m, d)
+    except ValueError:
+        return None
+
+
+def _parse(text: str, year: int) -> Optional[date]:
+    s = text.strip()
+    if not s:
+        return None
+
+    match = _DATE_RE.fullmatch(s)
+    if match:
+        if match.group("y"):
+            # 잘못된 날짜면 strptime 형식도, 숫자 8개 재시도도 모두 실패 → None
+            return _make_date(int(match.group("y")), int(match.group("m")), int(match.group("d")))
+        m, d = int(match.group("md_m")), int(match.group("md_d"))
+        # strptime("%m-%d")은 1900년 기준으로 검증 (02-29 → 실패 → None)
+        if _make_date(1900, m, d) is None:
+            return None
+        return date(year, m, d)
+
+    # 숫자가 정확히 8개면 strptime 형식이 맞더라도 같은 연/월/일 → 자리로 잘라 만든 날짜와 같음
+    digits = "".join(c for c in s if c.isdigit()) if not s.isascii() else _NON_DIGIT_RE.sub("", s)
+    if len(digits) == 8 and digits.isascii():
+        return _make_date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+
+    return _parse_legacy(s, year)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _parse_cached(text: str, year: int) -> Optional[date]:
+    return _parse(text, year)
+
+
+# ============================================================
+# 공개 API
+# ============================================================
+
+def _as_text(value) -> Optional[str]:
+    """None → None, 그 밖은 기존 호출부의 str(value)와 같은 문자열"""
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def parse_date(value, year: Optional[int] = None) -> Optional[date]:
+    """
+    날짜 문자열 → date (형식 불명 / 빈 값 / None → None)
+
+    Args:
+        value: "2026.03.15", "2026-03-15(토)", "20260315", "03/15" 등 (str이 아니면 str(value))
+        year: 월-일 형식에 쓸 연도 (기본 올해)
+    """
+    text = _as_text(value)
+    if text is None:
+        return None
+    return _parse_cached(text, year or datetime.now().year)
+
+
+def parse_dates(values: Iterable, year: Optional[int] = None) -> List[Optional[date]]:
+    """
+    날짜 열 전체를 한 번에 정규화 — 열 안에서 같은 값은 한 번만 파싱
+
+    Returns:
+        values와 같은 순서 / 길이의 date 또는 None 목록
+    """
+    year = year or datetime.now().year
+    seen: Dict[str, Optional[date]] = {}
+    result = []
+    for value in values:
+        text = _as_text(value)
+        if text is None:
+            result.append(None)
+            continue
+        if text not in seen:
+            seen[text] = _parse_cached(text, year)
+        result.append(seen[text])
+    return result
+
+
+def cache_info():
+    """메모 캐시 통계 (hits / misses / currsize)"""
+    return _parse_cached.cache_info()
+
+
+def clear_cache():
+    _parse_cached.cache_clear()
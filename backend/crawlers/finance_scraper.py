@@ -9,21 +9,20 @@
   - FPKOREA: AFPK, CFP
 
 3단계 Fallback 전략:
-  1단계: 공식 사이트 API/AJAX 호출
+  1단계: 공식 사이트 API/AJAX 호출 (AsyncClient로 기관별 동시 조회)
   2단계: 웹 크롤링 (HTML 파싱)
   3단계: 캐시 데이터 (마지막 성공 데이터)
 """
 
-import re
 import httpx
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Optional
 
-from crawlers.base import BaseScraper
+from crawlers.async_base import AsyncBaseScraper
+from crawlers.html_tables import DATE_RE, ROUND_RE, table_rows
 
 
-class FinanceScraper(BaseScraper):
+class FinanceScraper(AsyncBaseScraper):
     """금융 자격증 시험 일정 크롤러 — 3단계 Fallback"""
 
     source_name = "finance"
@@ -38,17 +37,6 @@ class FinanceScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.year = datetime.now().year
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            },
-        )
 
     # ============================================================
     # 1단계: 공식 API / AJAX 엔드포인트
@@ -58,12 +46,21 @@ class FinanceScraper(BaseScraper):
         """
         금융투자협회(KOFIA) AJAX 엔드포인트 호출
         - license.kofia.or.kr는 AJAX 기반으로 시험일정 데이터 반환
+        - KOFIA / KBI / FPKOREA 3개 기관을 동시에 조회
         """
-        schedules = []
+        schedules = self.fan_out([
+            self._fetch_kofia_api,
+            self._fetch_kbi_api,
+            self._fetch_fpkorea,
+        ])
+
+        return schedules if schedules else []
 
-        # KOFIA AJAX
+    async def _fetch_kofia_api(self, client: httpx.AsyncClient) -> List[Dict]:
+        """KOFIA AJAX (JSON 실패 시 HTML 파싱)"""
+        schedules = []
         try:
-            response = self.client.post(
+            response = await client.post(
                 self.KOFIA_URL,
                 data={"year": str(self.year)},
                 headers={
@@ -94,25 +91,27 @@ class FinanceScraper(BaseScraper):
         except Exception as e:
             self.logger.warning(f"KOFIA API 에러: {e}")
 
-        # KBI AJAX
+        return schedules
+
+    async def _fetch_kbi_api(self, client: httpx.AsyncClient) -> List[Dict]:
+        """KBI AJAX"""
         try:
-            response = self.client.get(self.KBI_URL, params={"year": str(self.year)})
+            response = await client.get(self.KBI_URL, params={"year": str(self.year)})
             response.raise_for_status()
-            parsed = self._parse_html_table(response.text, "kbi")
-            schedules.extend(parsed)
+            return self._parse_html_table(response.text, "kbi")
         except Exception as e:
             self.logger.warning(f"KBI API 에러: {e}")
+            return []
 
-        # FPKOREA
+    async def _fetch_fpkorea(self, client: httpx.AsyncClient) -> List[Dict]:
+        """FPKOREA"""
         try:
-            response = self.client.get(self.FPKOREA_URL)
+            response = await client.get(self.FPKOREA_URL)
             response.raise_for_status()
-            parsed = self._parse_html_table(response.text, "fpkorea")
-            schedules.extend(parsed)
+            return self._parse_html_table(response.text, "fpkorea")
         except Exception as e:
             self.logger.warning(f"FPKOREA API 에러: {e}")
-
-        return schedules if schedules else []
+            return []
 
     def _parse_kofia_item(self, item: Dict) -> Optional[Dict]:
         """KOFIA JSON 응답 항목 파싱"""
@@ -148,87 +147,82 @@ class FinanceScraper(BaseScraper):
         - 1단계에서 못 가져온 것들을 보완
         - 크롤링도 실패 시 known 일정 데이터 사용
         """
-        schedules = []
+        schedules = self.fan_out([
+            self._fetch_kofia_web,
+            self._fetch_kbi_web,
+        ])
 
-        # KOFIA 웹 크롤링
+        if schedules:
+            return schedules
+
+        # 크롤링 실패 → known 데이터
+        self.logger.info("웹 크롤링 실패 → known 일정 데이터 사용")
+        return self._get_known_schedules()
+
+    async def _fetch_kofia_web(self, client: httpx.AsyncClient) -> List[Dict]:
+        """KOFIA 웹 크롤링"""
         try:
-            response = self.client.get("https://license.kofia.or.kr/examSchedule/examScheduleList.do")
+            response = await client.get(self.KOFIA_URL)
             response.raise_for_status()
-            parsed = self._parse_html_table(response.text, "kofia")
-            schedules.extend(parsed)
+            return self._parse_html_table(response.text, "kofia")
         except Exception as e:
             self.logger.warning(f"KOFIA 웹 크롤링 에러: {e}")
+            return []
 
-        # KBI 웹 크롤링
+    async def _fetch_kbi_web(self, client: httpx.AsyncClient) -> List[Dict]:
+        """KBI 웹 크롤링"""
         try:
-            response = self.client.get("https://www.kbi.or.kr/exam/schedule.do")
+            response = await client.get(self.KBI_URL)
             response.raise_for_status()
-            parsed = self._parse_html_table(response.text, "kbi")
-            schedules.extend(parsed)
+            return self._parse_html_table(response.text, "kbi")
         except Exception as e:
             self.logger.warning(f"KBI 웹 크롤링 에러: {e}")
-
-        if schedules:
-            return schedules
-
-        # 크롤링 실패 → known 데이터
-        self.logger.info("웹 크롤링 실패 → known 일정 데이터 사용")
-        return self._get_known_schedules()
+            return []
 
     def _parse_html_table(self, html: str, source: str) -> List[Dict]:
         """HTML에서 시험 일정 테이블 파싱"""
-        soup = BeautifulSoup(html, "html.parser")
         schedules = []
 
-        tables = soup.select("table")
-        for table in tables:
-            rows = table.select("tbody tr")
-            for row in rows:
-                cols = row.select("td")
-                if len(cols) < 3:
-                    continue
-
-                texts = [c.get_text(strip=True) for c in cols]
-
-                # 자격증 이름 탐지
-                cert_name = ""
-                for t in texts:
-                    normalized = self._normalize_cert_name(t)
-                    if normalized != t or any(kw in t for kw in [
-                        "펀드", "증권", "파생", "투자", "외환", "금융",
-                        "여신", "신용", "컴플라이언스", "AFPK", "CFP", "FRM"
-                    ]):
-                        cert_name = normalized
-                        break
-
-                if not cert_name:
-                    continue
-
-                # 회차 추출
-                round_no = 1
-                for t in texts:
-                    match = re.search(r"(\d+)\s*회", t)
-                    if match:
-                        round_no = int(match.group(1))
-                        break
-
-                # 날짜 추출
-                dates = []
-                for t in texts:
-                    if "~" in t:
-                        parts = t.split("~")
-                        dates.extend([p.strip() for p in parts])
-                    elif re.search(r"\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2}", t):
-                        dates.append(t.strip())
-
-                schedules.append({
-                    "cert_name": cert_name,
-                    "round": round_no,
-                    "reg_start": dates[0] if len(dates) > 0 else "",
-                    "reg_end": dates[1] if len(dates) > 1 else "",
-                    "exam_date": dates[2] if len(dates) > 2 else "",
-                    "result_date": dates[3] if len(dates) > 3 else "",
-                })
+        for texts in table_rows(html, min_cells=3):
+            # 자격증 이름 탐지
+            cert_name = ""
+            for t in texts:
+                normalized = self._normalize_cert_name(t)
+                if normalized != t or any(kw in t for kw in [
+                    "펀드", "증권", "파생", "투자", "외환", "금융",
+                    "여신", "신용", "컴플라이언스", "AFPK", "CFP", "FRM"
+                ]):
+                    cert_name = normalized
+                    break
+
+            if not cert_name:
+                continue
+
+            # 회차 추출
+            round_no = 1
+            for t in texts:
+                match = ROUND_RE.search(t)
+                if match:
+                    round_no = int(match.group(1))
+                    break
+
+            # 날짜 추출
+            dates = []
+            for t in texts:
+                if "~" in t:
+                    parts = t.split("~")
+                    dates.extend([p.strip() for p in parts])
+                elif DATE_RE.search(t):
+                    dates.append(t.strip())
+
+            schedules.append({
+                "cert_name": cert_name,
+                "round": round_no,
+                "reg_start": dates[0] if len(dates) > 0 else "",
+                "reg_end": dates[1] if len(dates) > 1 else "",
+                "exam_date": dates[2] if len(dates) > 2 else "",
+                "result_date": dates[3] if len(dates) > 3 else "",
+            })
 
         return schedules
 
@@ -292,9 +286,6 @@ class FinanceScraper(BaseScraper):
             {"cert_name": "CFP", "round": 1, "reg_start": "2026-03-09", "reg_end": "2026-03-20", "exam_date": "2026-04-18", "result_date": "2026-05-08"},
         ]
 
-    def close(self):
-        self.client.close()
-
 
 def run():
     """금융 자격증 크롤러 메인 실행 함수"""
@@ -0,0 +1,162 @@
+"""
+크롤러 HTML 테이블 파서 (테이블만 파싱 + 백엔드 교체 가능)
+
+스크래퍼가 HTML에서 필요한 것은 <table>의 행/셀 텍스트뿐인데, 기존 코드는 문서 전체를
+BeautifulSoup(html, "html.parser") 트리로 만든 뒤 table / tr / td를 CSS 선택자로 다시 찾았습니다.
+이 모듈은 같은 결과(셀 텍스트 = get_text(strip=True))를 더 싸게 만듭니다.
+
+백엔드 (CRAWL_HTML_BACKEND):
+  auto (기본) — bs4 (이전 html.parser와 같은 레코드). lxml은 실제 페이지에서 동일성이 확인될 때까지 명시 선택
+  lxml        — libxml2 HTML 파서 (C 구현). script/style/template 제거 후 XPath로 행/셀 추출
+  bs4         — html.parser + SoupStrainer("table"): 테이블 밖 태그는 트리를 만들지 않음
+  html.parser — 문서 전체를 BeautifulSoup 트리로 (이전 동작 — 벤치마크 / 결과 비교 기준)
+
+선택자 의미는 기존 코드(soupsieve)와 같게 맞춤:
+  rows("tbody") = table.select("tbody tr")  → 테이블 안의 tr 중 조상에 tbody가 있는 것
+  rows("all")   = table.select("tbody tr, tr") → 테이블 안의 모든 tr
+  셀            = row.select("td")          → tr 안의 모든 td (중첩 테이블 포함, 문서 순서)
+백엔드 간 결과가 달라지는 경우 (lxml을 고르면 이전 html.parser 동작과 달라지는 점):
+  - 닫는 태그 생략 (<tr><td>제1회<td>2026.03.15<tr>…) — HTML에서 유효하고 오래된 기관 페이지에 흔함.
+    lxml은 명세대로 셀/행을 나누고(['제1회', '2026.03.15']), html.parser / bs4는 다음 셀을 앞 셀 안에
+    중첩시켜 앞 셀 텍스트가 뒤 셀들을 포함합니다 (이전 동작). 이런 페이지에서는 lxml 결과가 바뀝니다.
+  - 테이블 밖의 <tbody> — bs4(SoupStrainer)는 테이블 밖 태그를 버림
+benchmarks.bench_parse --record로 실제 페이지를 녹화해 백엔드 간 결과를 비교한 뒤 백엔드를 바꾸세요.
+
+셀 텍스트에서 회차/날짜를 뽑는 정규식도 여기서 한 번만 컴파일합니다.
+"""
+
+import logging
+import re
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from crawlers.http_client import get_crawl_setting
+
+try:
+    # requirements.txt에 포함 — 미설치 로컬 환경 대비
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+logger = logging.getLogger("crawlers.html_tables")
+
+BACKENDS = ("lxml", "bs4", "html.parser")
+
+# ============================================================
+# 셀 텍스트 정규식 (스크래퍼 공용)
+# ============================================================
+
+ROUND_RE = re.compile(r"(\d+)\s*회")                     # "제3회", "3 회" → 3
+NUMBER_RE = re.compile(r"(\d+)")                         # 첫 번째 숫자
+DATE_RE = re.compile(r"\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2}")  # 2026.03.15 / 2026-3-5 / 2026/03/15
+
+
+# ============================================================
+# 테이블 뷰
+# ============================================================
+
+_ROW_XPATH = {"tbody": ".//tr[ancestor::tbody]", "all": ".//tr"}
+_ROW_SELECTOR = {"tbody": "tbody tr", "all": "tbody tr, tr"}
+# bs4 get_text()가 건너뛰는 문자열 (Script / Stylesheet / TemplateString)
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+
+class LxmlTable:
+    def __init__(self, element):
+        self._el = element
+
+    def rows(self, scope: str = "tbody") -> List[List[str]]:
+        """행별 셀 텍스트 목록"""
+        return [
+            ["".join(s.strip() for s in td.itertext()) for td in tr.iter("td")]
+            for tr in self._el.xpath(_ROW_XPATH[scope])
+        ]
+
+    def text(self) -> str:
+        return "".join(self._el.itertext())
+
+    def has_heading(self) -> bool:
+        """<caption> 또는 <thead> 안의 <th>가 있는지"""
+        return bool(self._el.xpath(".//caption | .//th[ancestor::thead]"))
+
+
+class SoupTable:
+    def __init__(self, tag):
+        self._tag = tag
+
+    def rows(self, scope: str = "tbody") -> List[List[str]]:
+        return [
+            [td.get_text(strip=True) for td in tr.select("td")]
+            for tr in self._tag.select(_ROW_SELECTOR[scope])
+        ]
+
+    def text(self) -> str:
+        return self._tag.get_text()
+
+    def has_heading(self) -> bool:
+        return self._tag.select_one("caption, thead th") is not None
+
+
+# ============================================================
+# 파싱
+# ============================================================
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    name = (backend or str(get_crawl_setting("CRAWL_HTML_BACKEND", "auto"))).strip().lower()
+    if name == "auto":
+        # 닫는 태그 생략 페이지에서 lxml 레코드가 달라지므로, 녹화된 실제 페이지로
+        # bench_parse --record 동일성이 확인되기 전까지는 이전 출력과 같은 bs4
+        return "bs4"
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 HTML 백엔드: {name} (사용 가능: auto, {', '.join(BACKENDS)})")
+    if name == "lxml" and lxml is None:
+        logger.warning("⚠️ lxml 미설치 → bs4 백엔드 사용")
+        return "bs4"
+    return name
+
+
+def _lxml_tables(html: str) -> List[LxmlTable]:
+    try:
+        root = lxml.html.document_fromstring(html)
+    except ValueError:
+        # 인코딩 선언이 붙은 XML 형식 문서는 str로 파싱할 수 없음 → 바이트로
+        root = lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return []
+    etree.strip_elements(root, *_NON_TEXT_TAGS, with_tail=False)
+    return [LxmlTable(el) for el in root.iter("table")]
+
+
+def _soup_tables(html: str, table_only: bool = True) -> List[SoupTable]:
+    if table_only:
+        soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("table"))
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+    return [SoupTable(tag) for tag in soup.select("table")]
+
+
+def parse_tables(html: str, backend: Optional[str] = None) -> List:
+    """
+    HTML의 모든 <table> (중첩 테이블 포함, 문서 순서)
+
+    Returns:
+        rows(scope) / text() / has_heading()을 가진 테이블 뷰 목록
+    """
+    if not html or not html.strip():
+        return []
+    name = resolve_backend(backend)
+    if name == "lxml":
+        return _lxml_tables(html)
+    return _soup_tables(html, table_only=(name == "bs4"))
+
+
+def table_rows(html: str, scope: str = "tbody", min_cells: int = 0, backend: Optional[str] = None) -> List[List[str]]:
+    """모든 테이블의 행별 셀 텍스트 (셀이 min_cells개 미만인 행 제외)"""
+    return [
+        cells
+        for table in parse_tables(html, backend)
+        for cells in table.rows(scope)
+        if len(cells) >= min_cells
+    ]
@@ -0,0 +1,455 @@
+"""
+크롤러 조건부 요청 캐시 (ETag / Last-Modified + 본문 해시)
+
+기관 시험 일정은 1년에 몇 번만 바뀌는데, 매일 밤 크롤링은 모든 페이지를 새로 받아 다시 파싱하고
+DB에 씁니다. 이 모듈은 두 단계로 그 반복을 줄입니다.
+
+1) 응답 캐시 (ConditionalCacheTransport — 모든 크롤러 httpx 클라이언트에 적용)
+   - 요청별로 마지막 200 응답의 검증자(ETag, Last-Modified)와 본문, 본문 해시를 디스크에 저장
+   - 다음 GET/HEAD 요청에 If-None-Match / If-Modified-Since를 붙이고, 304면 저장된 본문으로 응답
+   - 응답마다 변경 여부를 response.extensions["crawl_cache"]에 표시
+       not_modified(304) / unchanged(본문 해시 동일) / changed / new
+
+2) 수집 단계 메모 (run_stage — BaseScraper.fetch_schedules의 1·2단계)
+   - 단계가 성공하면 그 단계가 보낸 요청 목록 + 응답 해시 + 파싱 결과를 저장
+   - 다음 실행은 단계를 돌리기 전에 저장된 요청만 조건부로 다시 보내고,
+     모두 304 / 동일 본문이면 파싱 없이 저장된 결과를 반환 → 스크래퍼는 DB 쓰기도 생략
+   - 하나라도 바뀌면 단계를 그대로 실행 (재검증에서 받은 응답을 재사용하므로 다시 다운로드하지 않음)
+   - 인증 파라미터(serviceKey 등)가 붙은 요청이나 실패한 요청이 있던 단계는 메모하지 않음
+   - 스크래퍼 코드나 공용 테이블 파서(html_tables / CRAWL_HTML_BACKEND)가 바뀌었거나
+     CRAWL_HTTP_CACHE_MAX_AGE_HOURS가 지나면 메모를 버리고 전체 실행
+   - 요청 입력(BaseScraper.stage_inputs — 조회 연도 등)이 바뀌어도 메모를 버림
+     (새해 첫 실행이 지난해 요청을 재검증해 지난해 일정을 돌려주지 않도록)
+
+저장 위치: CRAWL_HTTP_CACHE_DIR (기본 CACHE_DIR/http — 크롤링 캐시 파일과 같은 볼륨)
+"""
+
+import asyncio
+import base64
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from crawlers.http_client import get_crawl_setting
+from crawlers.replay import SECRET_PARAMS, redacted_url, request_key
+
+logger = logging.getLogger("crawlers.http_cache")
+
+# 저장하지 않는 응답 헤더 (본문은 디코딩된 상태로 저장)
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+# 재검증 시 다시 보내지 않는 요청 헤더 (클라이언트 기본값 / 조건부 헤더는 새로 붙음)
+_DROP_REQUEST_HEADERS = {
+    "host", "content-length", "cookie", "authorization", "connection",
+    "accept-encoding", "user-agent", "if-none-match", "if-modified-since",
+}
+_CONDITIONAL_METHODS = {"GET", "HEAD"}
+
+NOT_MODIFIED = "not_modified"
+UNCHANGED = "unchanged"
+CHANGED = "changed"
+NEW = "new"
+
+
+def cache_enabled() -> bool:
+    return bool(get_crawl_setting("CRAWL_HTTP_CACHE_ENABLED", True))
+
+
+def cache_dir() -> Path:
+    configured = str(get_crawl_setting("CRAWL_HTTP_CACHE_DIR", "")).strip()
+    if configured:
+        return Path(configured)
+    from crawlers.base import CACHE_DIR
+
+    return CACHE_DIR / "http"
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _has_secret(url: httpx.URL) -> bool:
+    return any(k.lower() in SECRET_PARAMS for k in url.params.keys())
+
+
+# ============================================================
+# 응답 캐시 저장소
+# ============================================================
+
+class ResponseCache:
+    """요청 키 → 마지막 200 응답 (검증자 + 본문 + 해시)"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def _path(self, request: httpx.Request) -> Path:
+        return self.directory / "responses" / (request.url.host or "unknown") / f"{request_key(request)}.json"
+
+    def get(self, request: httpx.Request) -> Optional[dict]:
+        try:
+            return json.loads(self._path(request).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 응답 캐시 읽기 실패: {request.url.host} — {e}")
+            return None
+
+    def put(self, request: httpx.Request, response: httpx.Response, digest: str):
+        entry = _snapshot(response)
+        del entry["state"]
+        entry.update({
+            "url": redacted_url(request.url),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "sha256": digest,
+            "stored_at": time.time(),
+        })
+        path = self._path(request)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"⚠️ 응답 캐시 저장 실패: {request.url.host} — {e}")
+
+
+def _snapshot(response: httpx.Response) -> dict:
+    """읽은 응답 → 캐시 항목과 같은 형식의 dict"""
+    return {
+        "status": response.status_code,
+        "headers": [[k, v] for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS],
+        "body": base64.b64encode(response.content).decode("ascii"),
+        "state": response.extensions.get("crawl_cache", CHANGED),
+    }
+
+
+def _response_from(entry: dict, request: httpx.Request, state: str) -> httpx.Response:
+    response = httpx.Response(
+        entry["status"],
+        headers=entry["headers"],
+        content=base64.b64decode(entry["body"]),
+        request=request,
+    )
+    response.extensions["crawl_cache"] = state
+    return response
+
+
+# ============================================================
+# 단계 실행 기록 (contextvar — fan-out 태스크에도 복사됨)
+# ============================================================
+
+class StageLog:
+    """수집 단계 1회에서 오간 요청/응답 요약 + 재검증에서 미리 받은 응답"""
+
+    def __init__(self, prefetched: Optional[Dict[str, dict]] = None):
+        self.requests: List[dict] = []
+        self.memoizable = True
+        self.prefetched = prefetched or {}
+        self._lock = threading.Lock()
+
+    def observe(self, request: httpx.Request, response: httpx.Response, digest: str):
+        with self._lock:
+            if _has_secret(request.url):
+                self.memoizable = False
+                return
+            self.requests.append({
+                "method": request.method,
+                "url": str(request.url),
+                "headers": [[k, v] for k, v in request.headers.items() if k.lower() not in _DROP_REQUEST_HEADERS],
+                "body": base64.b64encode(request.content or b"").decode("ascii"),
+                "status": response.status_code,
+                "sha256": digest,
+            })
+
+    def failed(self):
+        with self._lock:
+            self.memoizable = False
+
+    def take_prefetched(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """재검증에서 받은 응답 — 동기/비동기 클라이언트 어느 쪽에서도 읽히도록 본문으로 다시 생성"""
+        with self._lock:
+            entry = self.prefetched.pop(request_key(request), None)
+        if entry is None:
+            return None
+        return _response_from(entry, request, entry["state"])
+
+
+_stage_log: ContextVar[Optional[StageLog]] = ContextVar("crawl_stage_log", default=None)
+
+
+# ============================================================
+# transport
+# ============================================================
+
+class _ConditionalMixin:
+    _cache: ResponseCache
+
+    def _prepare(self, request: httpx.Request) -> Optional[dict]:
+        """캐시 항목 조회 + 조건부 헤더 추가"""
+        entry = self._cache.get(request)
+        if entry and request.method in _CONDITIONAL_METHODS:
+            if entry.get("etag") and "if-none-match" not in request.headers:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified") and "if-modified-since" not in request.headers:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+        return entry
+
+    def _finish(self, request: httpx.Request, response: httpx.Response, entry: Optional[dict]) -> httpx.Response:
+        if response.status_code == 304 and entry:
+            response = _response_from(entry, request, NOT_MODIFIED)
+            digest = entry["sha256"]
+        else:
+            digest = body_hash(response.content)
+            if response.status_code == 200:
+                if entry is None:
+                    state = NEW
+                elif entry["sha256"] == digest and entry["status"] == 200:
+                    state = UNCHANGED
+                else:
+                    state = CHANGED
+                # 본문이 같아도 검증자가 바뀌었으면 갱신 (다음 요청부터 304를 받을 수 있도록)
+                if state != UNCHANGED or (entry.get("etag"), entry.get("last_modified")) != (
+                    response.headers.get("etag"), response.headers.get("last-modified")
+                ):
+                    self._cache.put(request, response, digest)
+            else:
+                state = CHANGED
+            response.extensions["crawl_cache"] = state
+
+        log = _stage_log.get()
+        if log is not None:
+            log.observe(request, response, digest)
+        return response
+
+
+class ConditionalCacheTransport(_ConditionalMixin, httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache):
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        log = _stage_log.get()
+        prefetched = log.take_prefetched(request) if log is not None else None
+        if prefetched is not None:
+            log.observe(request, prefetched, body_hash(prefetched.content))
+            return prefetched
+
+        entry = self._prepare(request)
+        try:
+            response = self._transport.handle_request(request)
+            response.read()
+        except Exception:
+            if log is not None:
+                log.failed()
+            raise
+        return self._finish(request, response, entry)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncConditionalCacheTransport(_ConditionalMixin, httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        log = _stage_log.get()
+        prefetched = log.take_prefetched(request) if log is not None else None
+        if prefetched is not None:
+            log.observe(request, prefetched, body_hash(prefetched.content))
+            return prefetched
+
+        entry = self._prepare(request)
+        try:
+            response = await self._transport.handle_async_request(request)
+            await response.aread()
+        except Exception:
+            if log is not None:
+                log.failed()
+            raise
+        return self._finish(request, response, entry)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def wrap_transport(transport: httpx.BaseTransport) -> httpx.BaseTransport:
+    """CRAWL_HTTP_CACHE_ENABLED면 조건부 캐시 transport로 감쌈 (http_client.build_client)"""
+    if not cache_enabled():
+        return transport
+    return ConditionalCacheTransport(transport, ResponseCache(cache_dir()))
+
+
+def wrap_async_transport(transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    if not cache_enabled():
+        return transport
+    return AsyncConditionalCacheTransport(transport, ResponseCache(cache_dir()))
+
+
+# ============================================================
+# 수집 단계 메모
+# ============================================================
+
+@lru_cache(maxsize=64)
+def _code_version(module_file: str, mtime_ns: int) -> str:
+    try:
+        return hashlib.sha256(Path(module_file).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return f"mtime:{mtime_ns}"
+
+
+def _module_version(module_or_class) -> str:
+    try:
+        module_file = inspect.getsourcefile(module_or_class) or ""
+        return _code_version(module_file, os.stat(module_file).st_mtime_ns)
+    except (TypeError, OSError):
+        return "unknown"
+
+
+def scraper_code_version(scraper) -> str:
+    """
+    파싱 코드 버전 — 스크래퍼 모듈 + 공용 테이블 파서(html_tables) 소스 해시 + 선택된 HTML 백엔드
+
+    html_tables를 고치거나 CRAWL_HTML_BACKEND를 바꾸면 같은 페이지에서도 레코드가 달라질 수 있으므로 메모 무효
+    """
+    from crawlers import html_tables
+
+    try:
+        backend = html_tables.resolve_backend()
+    except ValueError:
+        backend = "invalid"
+    return "-".join((_module_version(type(scraper)), _module_version(html_tables), backend))
+
+
+def scraper_inputs(scraper) -> str:
+    """스크래퍼 요청 입력(연도 등) — 지난 실행과 다르면 메모된 요청이 이번 실행의 요청이 아니므로 메모 무효"""
+    inputs = getattr(scraper, "stage_inputs", lambda: {})()
+    return json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _memo_path(source: str, stage: str) -> Path:
+    return cache_dir() / "stages" / f"{source}-{stage}.json"
+
+
+def _load_memo(source: str, stage: str, code: str, inputs: str) -> Optional[dict]:
+    path = _memo_path(source, stage)
+    try:
+        memo = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ 단계 메모 읽기 실패: {path.name} — {e}")
+        return None
+
+    max_age = float(get_crawl_setting("CRAWL_HTTP_CACHE_MAX_AGE_HOURS", 168.0)) * 3600
+    if memo.get("code") != code or memo.get("inputs") != inputs:
+        return None
+    if time.time() - memo.get("saved_at", 0) > max_age or not memo.get("requests"):
+        return None
+    return memo
+
+
+def _save_memo(source: str, stage: str, code: str, inputs: str, log: StageLog, schedules: List[Dict]):
+    path = _memo_path(source, stage)
+    memo = {
+        "saved_at": time.time(), "code": code, "inputs": inputs,
+        "requests": log.requests, "schedules": schedules,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+        tmp.write_text(json.dumps(memo, ensure_ascii=False, default=str), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        logger.warning(f"⚠️ 단계 메모 저장 실패: {path.name} — {e}")
+
+
+async def _revalidate(memo: dict, timeout: float) -> Tuple[bool, Dict[str, dict]]:
+    """
+    메모된 요청을 조건부로 다시 보냄 → (모두 그대로인지, 받은 응답 {요청 키: 응답})
+    재검증 중에는 단계 기록을 끔 (받은 응답은 단계 실행 시 prefetched로 재사용)
+    """
+    from crawlers.http_client import build_async_client
+
+    token = _stage_log.set(None)
+    try:
+        async with build_async_client(timeout=timeout) as client:
+            async def _one(item: dict):
+                request = client.build_request(
+                    item["method"],
+                    item["url"],
+                    headers=dict(item["headers"]),
+                    content=base64.b64decode(item["body"]) or None,
+                )
+                response = await client.send(request)
+                same = (
+                    response.status_code == item["status"]
+                    and response.extensions.get("crawl_cache") in (NOT_MODIFIED, UNCHANGED)
+                )
+                return request, response, same
+
+            results = await asyncio.gather(*(_one(item) for item in memo["requests"]), return_exceptions=True)
+    finally:
+        _stage_log.reset(token)
+
+    prefetched: Dict[str, dict] = {}
+    unchanged = True
+    for result in results:
+        if isinstance(result, BaseException):
+            unchanged = False
+            continue
+        request, response, same = result
+        prefetched[request_key(request)] = _snapshot(response)
+        unchanged = unchanged and same
+    return unchanged, prefetched
+
+
+def run_stage(scraper, stage: str, fetch: Callable[[], List[Dict]], timeout: float = 30.0) -> Tuple[List[Dict], bool]:
+    """
+    수집 단계 실행 (BaseScraper.fetch_schedules에서 호출)
+
+    Returns:
+        (일정 목록, 원본 응답이 지난 실행과 모두 같아 메모를 재사용했는지)
+    """
+    if not cache_enabled():
+        return fetch(), False
+
+    source = scraper.source_name
+    code = scraper_code_version(scraper)
+    inputs = scraper_inputs(scraper)
+    memo = _load_memo(source, stage, code, inputs)
+    prefetched: Dict[str, dict] = {}
+
+    if memo is not None:
+        from crawlers.async_base import run_coroutine
+
+        try:
+            unchanged, prefetched = run_coroutine(lambda: _revalidate(memo, timeout))
+        except Exception as e:
+            logger.warning(f"⚠️ {source}/{stage} 재검증 실패 → 전체 실행: {e}")
+            unchanged = False
+        if unchanged:
+            return memo["schedules"], True
+
+    log = StageLog(prefetched)
+    token = _stage_log.set(log)
+    try:
+        schedules = fetch()
+    finally:
+        _stage_log.reset(token)
+
+    if schedules and log.memoizable and log.requests:
+        _save_memo(source, stage, code, inputs, log, schedules)
+    return schedules, False
@@ -0,0 +1,242 @@
+"""
+크롤러 공용 HTTP 클라이언트 팩토리 + 호스트별 동시 요청 제한
+
+여러 소스를 병렬로 크롤링하면 서로 다른 크롤러가 같은 기관 서버
+(예: education.oracle.com, www.irca.org)에 동시에 요청할 수 있습니다.
+모든 크롤러의 httpx 클라이언트가 이 모듈의 transport를 거치도록 하여
+프로세스 전역에서 호스트별 동시 요청 수를 CRAWL_PER_HOST_LIMIT 이하로 제한합니다.
+
+가장 안쪽 transport는 CRAWL_HTTP_MODE(live / record / replay)에 따라 정해집니다 (crawlers.replay).
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+import httpx
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# HTML 페이지 크롤링용 기본 헤더
+BROWSER_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+
+def get_crawl_setting(name: str, default):
+    """
+    크롤러 설정값 조회 (get_sync_engine과 동일한 우선순위)
+    1. 환경변수  2. config.py Settings  3. 기본값
+    """
+    raw = os.getenv(name, "").strip()
+    if raw:
+        if isinstance(default, bool):
+            return raw.lower() in ("1", "true", "yes", "on")
+        try:
+            return type(default)(raw)
+        except (TypeError, ValueError):
+            return default
+    try:
+        from config import get_settings
+        return getattr(get_settings(), name, default)
+    except Exception:
+        return default
+
+
+class HostLimiter:
+    """
+    호스트별 동시 요청 수 제한 (스레드 안전)
+    크롤러는 run_in_executor 스레드에서 실행되므로 threading 세마포어 사용
+    """
+
+    def __init__(self, per_host: int):
+        self.per_host = max(per_host, 1)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    def semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = sem
+            return sem
+
+
+_host_limiter: Optional[HostLimiter] = None
+_host_limiter_lock = threading.Lock()
+
+
+def get_host_limiter() -> HostLimiter:
+    """프로세스 전역 HostLimiter 싱글턴"""
+    global _host_limiter
+    with _host_limiter_lock:
+        if _host_limiter is None:
+            _host_limiter = HostLimiter(get_crawl_setting("CRAWL_PER_HOST_LIMIT", 2))
+        return _host_limiter
+
+
+class FetchClock:
+    """
+    HTTP 요청이 하나 이상 진행 중이던 시간 합계 (벤치마크의 fetch 구간 측정)
+    fan-out으로 요청이 겹쳐도 겹친 구간은 한 번만 셈 → 수집 전체 시간 - fetch = 파싱 등 나머지
+    """
+
+    def __init__(self):
+        self.busy_ns = 0
+        self.requests = 0
+        self._in_flight = 0
+        self._since = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.requests += 1
+            if self._in_flight == 0:
+                self._since = time.perf_counter_ns()
+            self._in_flight += 1
+
+    def exit(self):
+        with self._lock:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self.busy_ns += time.perf_counter_ns() - self._since
+
+
+_fetch_clock: ContextVar[Optional[FetchClock]] = ContextVar("crawl_fetch_clock", default=None)
+
+
+@contextmanager
+def fetch_clock() -> Iterator[FetchClock]:
+    """
+    블록 안의 크롤러 HTTP 요청 시간 측정
+    asyncio.run으로 만든 태스크에도 컨텍스트가 복사되므로 fan-out 요청까지 집계됨
+    """
+    clock = FetchClock()
+    token = _fetch_clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _fetch_clock.reset(token)
+
+
+class HostLimitedTransport(httpx.BaseTransport):
+    """요청 대상 호스트의 세마포어를 잡은 동안에만 실제 요청을 보내는 transport"""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: HostLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        clock = _fetch_clock.get()
+        if clock is not None:
+            clock.enter()
+        try:
+            sem = self._limiter.semaphore(request.url.host)
+            with sem:
+                response = self._transport.handle_request(request)
+                # 본문을 세마포어 안에서 읽어야 연결 점유 시간까지 제한에 포함됨
+                response.read()
+        finally:
+            if clock is not None:
+                clock.exit()
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    HostLimitedTransport의 비동기 버전
+    - 같은 이벤트 루프(이 클라이언트) 안의 요청은 호스트별 asyncio 세마포어에서 먼저 대기 (스레드 없이 깨어남)
+    - 그다음 프로세스 전역 threading 세마포어 획득 — 비어 있으면 바로, 아니면 스레드에서 블로킹 획득
+      (다른 크롤러 스레드가 반납하는 즉시 깨어나며, 루프 하나가 묶어 두는 스레드는 호스트당 per_host개 이하)
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: HostLimiter):
+        self._transport = transport
+        self._limiter = limiter
+        self._local: Dict[str, asyncio.Semaphore] = {}
+
+    def _local_semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._local.get(host)
+        if sem is None:
+            sem = self._local[host] = asyncio.Semaphore(self._limiter.per_host)
+        return sem
+
+    @staticmethod
+    async def _acquire(sem: threading.BoundedSemaphore):
+        if sem.acquire(blocking=False):
+            return
+        acquiring = asyncio.ensure_future(asyncio.to_thread(sem.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # 스레드의 acquire는 취소되지 않으므로 잡히는 대로 반납 (슬롯 누수 방지)
+            acquiring.add_done_callback(lambda _: sem.release())
+            raise
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        clock = _fetch_clock.get()
+        if clock is not None:
+            clock.enter()
+        try:
+            host = request.url.host
+            sem = self._limiter.semaphore(host)
+            async with self._local_semaphore(host):
+                await self._acquire(sem)
+                try:
+                    response = await self._transport.handle_async_request(request)
+                    await response.aread()
+                finally:
+                    sem.release()
+        finally:
+            if clock is not None:
+                clock.exit()
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def build_client(timeout: float, headers: Optional[Dict[str, str]] = None) -> httpx.Client:
+    """
+    크롤러용 httpx.Client 생성
+    - 리다이렉트 추적
+    - 호스트별 동시 요청 제한 transport 적용
+    - CRAWL_HTTP_MODE=record/replay면 fixture 녹화/재생 (crawlers.replay)
+    - CRAWL_HTTP_CACHE_ENABLED면 ETag/Last-Modified 조건부 요청 + 응답 캐시 (crawlers.http_cache)
+    """
+    from crawlers.http_cache import wrap_transport
+    from crawlers.replay import base_transport
+
+    return httpx.Client(
+        timeout=timeout,
+        follow_redirects=True,
+        headers=headers if headers is not None else BROWSER_HEADERS,
+        transport=wrap_transport(HostLimitedTransport(base_transport(), get_host_limiter())),
+    )
+
+
+def build_async_client(timeout: float, headers: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+    """크롤러용 httpx.AsyncClient 생성 (build_client의 비동기 버전)"""
+    from crawlers.http_cache import wrap_async_transport
+    from crawlers.replay import async_base_transport
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers=headers if headers is not None else BROWSER_HEADERS,
+        transport=wrap_async_transport(AsyncHostLimitedTransport(async_base_transport(), get_host_limiter())),
+    )
@@ -20,19 +20,16 @@ ISC2, ISACA, Cisco, Oracle, Red Hat, LPI, PMI, SAP, SAS, GARP 등
   3단계: 캐시 데이터
 """
 
-import httpx
 from typing import List, Dict
 
-from crawlers.base import (
-    BaseScraper,
-    get_sync_engine,
-    find_cert_id_like,
-)
-from sqlalchemy import text
+from crawlers.async_base import AsyncBaseScraper
+from crawlers.base import bulk_update_official_urls, get_sync_engine
+from crawlers.http_client import USER_AGENT
+from crawlers.liveness import check_liveness
 from sqlalchemy.orm import Session
 
 
-class IntlCertScraper(BaseScraper):
+class IntlCertScraper(AsyncBaseScraper):
     """국제 CBT 자격증 URL 유효성 확인 크롤러 — 3단계 Fallback"""
 
     source_name = "intl_cert"
@@ -111,17 +108,8 @@ class IntlCertScraper(BaseScraper):
         {"keyword": "정보시스템감리사", "vendor": "IITP", "web_url": "https://www.iitp.kr"},
     ]
 
-    def __init__(self):
-        super().__init__()
-        self.client = httpx.Client(
-            timeout=15.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-            },
-        )
+    request_timeout = 15.0
+    request_headers = {"User-Agent": USER_AGENT}
 
     # ============================================================
     # 1단계: 벤더 API (해당되는 경우)
@@ -145,64 +133,10 @@ class IntlCertScraper(BaseScraper):
         각 자격증의 공식 페이지 URL 유효성 확인
         - HEAD 요청으로 응답 코드 확인
         - active/inactive 상태 분류
+        - 같은 URL을 공유하는 항목(education.oracle.com 등)은 한 번만 요청하고
+          성공/실패 결과 모두 재사용 (liveness 엔진)
         """
-        results = []
-        checked_urls = set()  # 중복 URL 방지
-
-        for cert_info in self.INTL_CERTS:
-            url = cert_info["web_url"]
-
-            # 이미 확인한 URL은 같은 결과 재사용
-            if url in checked_urls:
-                results.append({
-                    "cert_name": cert_info["keyword"],
-                    "vendor": cert_info["vendor"],
-                    "status": "active",  # 이전에 확인 성공
-                    "web_url": url,
-                    "round": 0,
-                    "reg_start": "",
-                    "reg_end": "",
-                    "exam_date": "",
-                    "result_date": "",
-                })
-                continue
-
-            try:
-                response = self.client.head(url)
-                is_active = response.status_code < 400
-
-                results.append({
-                    "cert_name": cert_info["keyword"],
-                    "vendor": cert_info["vendor"],
-                    "status": "active" if is_active else "inactive",
-                    "web_url": url,
-                    "round": 0,
-                    "reg_start": "",
-                    "reg_end": "",
-                    "exam_date": "",
-                    "result_date": "",
-                })
-
-                if is_active:
-                    checked_urls.add(url)
-
-                status_emoji = "✅" if is_active else "⚠️"
-                self.logger.info(f"  {status_emoji} {cert_info['keyword']} ({cert_info['vendor']}): {response.status_code}")
-
-            except Exception as e:
-                self.logger.warning(f"  ❌ {cert_info['keyword']}: 연결 실패 ({e})")
-                results.append({
-                    "cert_name": cert_info["keyword"],
-                    "vendor": cert_info["vendor"],
-                    "status": "error",
-                    "web_url": url,
-                    "round": 0,
-                    "reg_start": "",
-                    "reg_end": "",
-                    "exam_date": "",
-                    "result_date": "",
-                })
-
+        results = check_liveness(self, self.INTL_CERTS)
         return results if results else []
 
     # ============================================================
@@ -222,12 +156,14 @@ class IntlCertScraper(BaseScraper):
             return self.stats
 
         with Session(engine) as session:
+            resolver = self.get_resolver(session)
+            rows = []
             for sch in schedules:
                 keyword = sch.get("cert_name", "")
                 if not keyword:
                     continue
 
-                cert_id = find_cert_id_like(session, keyword)
+                cert_id = resolver.resolve(keyword)
                 if not cert_id:
                     self.stats["skipped"] += 1
                     continue
@@ -236,33 +172,18 @@ class IntlCertScraper(BaseScraper):
                 status = sch.get("status", "active")
                 web_url = sch.get("web_url", "")
 
-                # official_url 업데이트 + updated_at 갱신
                 if status == "active" and web_url:
-                    session.execute(
-                        text("""
-                            UPDATE certifications
-                            SET official_url = :url, updated_at = NOW()
-                            WHERE id = :cid
-                        """),
-                        {"url": web_url, "cid": cert_id},
-                    )
-                    self.stats["updated"] = self.stats.get("updated", 0) + 1
+                    rows.append({"cert_id": cert_id, "official_url": web_url})
                 else:
                     self.stats["skipped"] += 1
 
+            # official_url이 실제로 바뀐 자격증만 UPDATE (+ updated_at 갱신)
+            self.write_changes(session, rows, bulk_update_official_urls)
             session.commit()
 
-        self.logger.info(
-            f"📊 {self.source_name} 완료 [방법: {self.method_used}]: "
-            f"매칭 {self.stats['found']}건, "
-            f"업데이트 {self.stats['updated']}건, "
-            f"건너뜀 {self.stats['skipped']}건"
-        )
+        self.log_summary()
         return self.stats
 
-    def close(self):
-        self.client.close()
-
 
 def run():
     """국제 CBT 자격증 크롤러 메인 실행 함수"""
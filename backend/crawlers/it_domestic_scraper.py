@@ -10,21 +10,21 @@ ICQA, IHD, KSTQB, 대한상공회의소, 한국세무사회 시험 일정 수집
   - 한국세무사회: 전산회계 1급
 
 3단계 Fallback 전략:
-  1단계: 각 기관 API/AJAX 엔드포인트
+  1단계: 각 기관 API/AJAX 엔드포인트 (AsyncClient로 동시 조회)
   2단계: 웹 크롤링 (HTML 파싱)
   3단계: 캐시 데이터 (마지막 성공 데이터)
 """
 
-import re
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Optional
 
-from crawlers.base import BaseScraper
+from crawlers.async_base import AsyncBaseScraper
+from crawlers.html_tables import DATE_RE, ROUND_RE, table_rows
 
 
-class ITDomesticScraper(BaseScraper):
+class ITDomesticScraper(AsyncBaseScraper):
     """국내 IT 자격증 크롤러 (Q-Net/KData 외) — 3단계 Fallback"""
 
     source_name = "it_domestic"
@@ -39,17 +39,6 @@ class ITDomesticScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.year = datetime.now().year
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            },
-        )
 
     # ============================================================
     # 1단계: 각 기관 API/AJAX 엔드포인트
@@ -59,30 +48,22 @@ class ITDomesticScraper(BaseScraper):
         """
         각 기관의 AJAX/API 엔드포인트 호출
         - 대부분 HTML 반환이므로 직접 파싱
+        - 5개 기관을 동시에 조회 → 응답 없는 기관이 있어도 전체 지연은 timeout 1회분
         """
-        schedules = []
-
-        # ICQA
-        schedules.extend(self._fetch_icqa())
-
-        # IHD (리눅스마스터)
-        schedules.extend(self._fetch_ihd())
-
-        # KSTQB
-        schedules.extend(self._fetch_kstqb())
-
-        # 대한상공회의소
-        schedules.extend(self._fetch_korcham())
-
-        # 한국세무사회
-        schedules.extend(self._fetch_kacpta())
+        schedules = self.fan_out([
+            self._fetch_icqa,      # ICQA
+            self._fetch_ihd,       # IHD (리눅스마스터)
+            self._fetch_kstqb,     # KSTQB
+            self._fetch_korcham,   # 대한상공회의소
+            self._fetch_kacpta,    # 한국세무사회
+        ])
 
         return schedules if schedules else []
 
-    def _fetch_icqa(self) -> List[Dict]:
+    async def _fetch_icqa(self, client: httpx.AsyncClient) -> List[Dict]:
         """ICQA 시험일정 조회"""
         try:
-            response = self.client.get(self.ICQA_URL)
+            response = await client.get(self.ICQA_URL)
             response.raise_for_status()
             return self._parse_generic_table(
                 response.text,
@@ -93,10 +74,10 @@ class ITDomesticScraper(BaseScraper):
             self.logger.warning(f"ICQA 조회 에러: {e}")
             return []
 
-    def _fetch_ihd(self) -> List[Dict]:
+    async def _fetch_ihd(self, client: httpx.AsyncClient) -> List[Dict]:
         """IHD 리눅스마스터 시험일정 조회"""
         try:
-            response = self.client.get(self.IHD_URL)
+            response = await client.get(self.IHD_URL)
             response.raise_for_status()
             return self._parse_generic_table(
                 response.text,
@@ -107,19 +88,19 @@ class ITDomesticScraper(BaseScraper):
             self.logger.warning(f"IHD 조회 에러: {e}")
             return []
 
-    def _fetch_kstqb(self) -> List[Dict]:
-        """KSTQB 시험일정 조회"""
+    async def _fetch_kstqb(self, client: httpx.AsyncClient) -> List[Dict]:
+        """KSTQB 시험일정 조회 (ISTQB / CSTS 게시판 동시 조회)"""
         try:
-            # ISTQB
-            response = self.client.get(self.KSTQB_URL, params={"bbs_code": "5"})
+            response, response2 = await asyncio.gather(
+                client.get(self.KSTQB_URL, params={"bbs_code": "5"}),  # ISTQB
+                client.get(self.KSTQB_URL, params={"bbs_code": "6"}),  # CSTS
+            )
             response.raise_for_status()
             schedules = self._parse_generic_table(
                 response.text,
                 ["ISTQB", "CSTS"],
                 "kstqb"
             )
-            # CSTS
-            response2 = self.client.get(self.KSTQB_URL, params={"bbs_code": "6"})
             response2.raise_for_status()
             schedules.extend(self._parse_generic_table(
                 response2.text,
@@ -131,10 +112,10 @@ class ITDomesticScraper(BaseScraper):
             self.logger.warning(f"KSTQB 조회 에러: {e}")
             return []
 
-    def _fetch_korcham(self) -> List[Dict]:
+    async def _fetch_korcham(self, client: httpx.AsyncClient) -> List[Dict]:
         """대한상공회의소 시험일정 조회"""
         try:
-            response = self.client.get(self.KORCHAM_URL)
+            response = await client.get(self.KORCHAM_URL)
             response.raise_for_status()
             return self._parse_generic_table(
                 response.text,
@@ -145,10 +126,10 @@ class ITDomesticScraper(BaseScraper):
             self.logger.warning(f"대한상공회의소 조회 에러: {e}")
             return []
 
-    def _fetch_kacpta(self) -> List[Dict]:
+    async def _fetch_kacpta(self, client: httpx.AsyncClient) -> List[Dict]:
         """한국세무사회 시험일정 조회"""
         try:
-            response = self.client.get(self.KACPTA_URL)
+            response = await client.get(self.KACPTA_URL)
             response.raise_for_status()
             return self._parse_generic_table(
                 response.text,
@@ -177,52 +158,43 @@ class ITDomesticScraper(BaseScraper):
 
     def _parse_generic_table(self, html: str, keywords: List[str], source: str) -> List[Dict]:
         """HTML 테이블에서 시험 일정 파싱 (범용)"""
-        soup = BeautifulSoup(html, "html.parser")
         schedules = []
 
-        tables = soup.select("table")
-        for table in tables:
-            rows = table.select("tbody tr, tr")
-            for row in rows:
-                cols = row.select("td")
-                if len(cols) < 3:
-                    continue
-
-                texts = [c.get_text(strip=True) for c in cols]
-                row_text = " ".join(texts)
-
-                # 키워드 매칭
-                cert_name = ""
-                for kw in keywords:
-                    if kw in row_text:
-                        cert_name = self._normalize_cert_name(kw, row_text)
-                        break
-
-                if not cert_name:
-                    continue
-
-                # 회차 추출
-                round_no = 1
-                for t in texts:
-                    match = re.search(r"(\d+)\s*회", t)
-                    if match:
-                        round_no = int(match.group(1))
-                        break
-
-                # 날짜 추출
-                dates = []
-                for t in texts:
-                    found = re.findall(r"\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2}", t)
-                    dates.extend(found)
-
-                schedules.append({
-                    "cert_name": cert_name,
-                    "round": round_no,
-                    "reg_start": dates[0] if len(dates) > 0 else "",
-                    "reg_end": dates[1] if len(dates) > 1 else "",
-                    "exam_date": dates[2] if len(dates) > 2 else "",
-                    "result_date": dates[3] if len(dates) > 3 else "",
-                })
+        for texts in table_rows(html, scope="all", min_cells=3):
+            row_text = " ".join(texts)
+
+            # 키워드 매칭
+            cert_name = ""
+            for kw in keywords:
+                if kw in row_text:
+                    cert_name = self._normalize_cert_name(kw, row_text)
+                    break
+
+            if not cert_name:
+                continue
+
+            # 회차 추출
+            round_no = 1
+            for t in texts:
+                match = ROUND_RE.search(t)
+                if match:
+                    round_no = int(match.group(1))
+                    break
+
+            # 날짜 추출
+            dates = []
+            for t in texts:
+                found = DATE_RE.findall(t)
+                dates.extend(found)
+
+            schedules.append({
+                "cert_name": cert_name,
+                "round": round_no,
+                "reg_start": dates[0] if len(dates) > 0 else "",
+                "reg_end": dates[1] if len(dates) > 1 else "",
+                "exam_date": dates[2] if len(dates) > 2 else "",
+                "result_date": dates[3] if len(dates) > 3 else "",
+            })
 
         return schedules
 
@@ -293,9 +265,6 @@ class ITDomesticScraper(BaseScraper):
             {"cert_name": "전산회계 1급", "round": 3, "reg_start": "2026-09-07", "reg_end": "2026-09-18", "exam_date": "2026-10-10", "result_date": "2026-10-23"},
         ]
 
-    def close(self):
-        self.client.close()
-
 
 def run():
     """국내 IT 자격증 크롤러 메인 실행 함수"""
@@ -9,13 +9,13 @@ KData 크롤러 (guide.md 4.3 Scraper Logic #2)
 """
 
 import os
-import re
 import httpx
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Optional
 
 from crawlers.base import BaseScraper
+from crawlers.html_tables import NUMBER_RE, parse_tables
+from crawlers.http_client import build_client
 
 
 class KDataScraper(BaseScraper):
@@ -32,17 +32,7 @@ class KDataScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.year = datetime.now().year
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            },
-        )
+        self.client = build_client(timeout=30.0)
 
     # ============================================================
     # 1단계: dataq.or.kr JSON API 시도
@@ -157,31 +147,24 @@ class KDataScraper(BaseScraper):
 
     def _parse_html_schedules(self, html: str) -> List[Dict]:
         """HTML에서 시험 일정 테이블 파싱"""
-        soup = BeautifulSoup(html, "html.parser")
         schedules = []
+        year = str(self.year)
 
-        tables = soup.select("table.table, table.tbl_type, table")
-        for table in tables:
+        for table in parse_tables(html):
             # 연도가 포함된 캡션/제목이 있는 테이블만
-            caption = table.select_one("caption, thead th")
-            table_text = table.get_text()
-
-            if str(self.year) not in table_text and not caption:
+            if not table.has_heading() and year not in table.text():
                 continue
 
-            rows = table.select("tbody tr")
-            for row in rows:
-                cols = row.select("td")
-                sch = self._parse_table_row(cols)
+            for texts in table.rows("tbody"):
+                sch = self._parse_table_row(texts)
                 if sch:
                     schedules.append(sch)
 
         return schedules
 
-    def _parse_table_row(self, cols) -> Optional[Dict]:
-        """테이블 행에서 일정 정보 추출"""
+    def _parse_table_row(self, texts: List[str]) -> Optional[Dict]:
+        """테이블 행(셀 텍스트)에서 일정 정보 추출"""
         try:
-            texts = [c.get_text(strip=True) for c in cols]
             if len(texts) < 4:
                 return None
 
@@ -193,8 +176,8 @@ class KDataScraper(BaseScraper):
             for t in texts[:2]:
                 if any(kw in t for kw in ["SQL", "AD", "DA", "빅데이터"]):
                     cert_name = self._normalize_cert_name(t)
-                elif re.search(r"\d+", t):
-                    match = re.search(r"(\d+)", t)
+                else:
+                    match = NUMBER_RE.search(t)
                     if match:
                         round_no = int(match.group(1))
 
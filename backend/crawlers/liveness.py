@@ -0,0 +1,115 @@
+"""
+URL 유효성(liveness) 확인 엔진 — Cloud / Intl Cert 크롤러 공용
+
+상시접수 자격증은 공식 페이지 URL이 살아있는지 HEAD 요청으로 확인합니다.
+  - 동일 URL은 한 번만 요청 (성공/실패 모두 결과 재사용)
+  - 여러 URL을 동시에 요청 (전역 한도 CRAWL_LIVENESS_CONCURRENCY)
+  - 호스트별 동시 요청 수는 http_client의 HostLimiter(CRAWL_PER_HOST_LIMIT)가 제한
+결과 레코드 형식은 기존 크롤러가 만들던 active/inactive/error 레코드와 동일합니다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+from crawlers.async_base import AsyncBaseScraper
+from crawlers.http_client import get_crawl_setting
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """URL 1건의 HEAD 요청 결과"""
+
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.error is not None or self.status_code is None:
+            return "error"
+        return "active" if self.status_code < 400 else "inactive"
+
+
+async def probe_urls(
+    client: httpx.AsyncClient,
+    urls: Iterable[str],
+    max_concurrency: Optional[int] = None,
+) -> Dict[str, ProbeResult]:
+    """
+    URL 목록을 중복 제거 후 동시에 HEAD 요청
+
+    Returns:
+        {url: ProbeResult}
+    """
+    unique_urls = list(dict.fromkeys(u for u in urls if u))
+    if max_concurrency is None:
+        max_concurrency = get_crawl_setting("CRAWL_LIVENESS_CONCURRENCY", 16)
+    limiter = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def _probe(url: str):
+        async with limiter:
+            try:
+                response = await client.head(url)
+                return url, ProbeResult(status_code=response.status_code)
+            except Exception as e:
+                return url, ProbeResult(error=str(e) or type(e).__name__)
+
+    return dict(await asyncio.gather(*(_probe(url) for url in unique_urls)))
+
+
+def build_liveness_records(
+    entries: List[Dict],
+    results: Dict[str, ProbeResult],
+    logger: logging.Logger,
+) -> List[Dict]:
+    """
+    CLOUD_CERTS / INTL_CERTS 항목 + 확인 결과 → 크롤러 결과 레코드
+    항목에 cert_type이 있으면 레코드에도 포함 (Cloud)
+    """
+    records = []
+    for entry in entries:
+        url = entry["web_url"]
+        result = results.get(url, ProbeResult(error="not probed"))
+        label = f"{entry['keyword']} ({entry['vendor']})"
+
+        if result.status == "error":
+            logger.warning(f"  ❌ {label}: 연결 실패 ({result.error})")
+        else:
+            status_emoji = "✅" if result.status == "active" else "⚠️"
+            logger.info(f"  {status_emoji} {label}: {result.status_code}")
+
+        record = {
+            "cert_name": entry["keyword"],
+            "vendor": entry["vendor"],
+            "status": result.status,
+        }
+        if "cert_type" in entry:
+            record["cert_type"] = entry["cert_type"]
+        record.update({
+            "web_url": url,
+            "round": 0,
+            "reg_start": "",
+            "reg_end": "",
+            "exam_date": "",
+            "result_date": "",
+        })
+        records.append(record)
+
+    return records
+
+
+def check_liveness(scraper: AsyncBaseScraper, entries: List[Dict]) -> List[Dict]:
+    """
+    크롤러의 2단계(try_web_scraping)용 진입점
+    entries의 web_url을 병렬 확인하고 active/inactive/error 레코드 목록을 반환
+    """
+    async def _probe_all() -> Dict[str, ProbeResult]:
+        async with scraper.build_async_client() as client:
+            return await probe_urls(client, (entry["web_url"] for entry in entries))
+
+    results = scraper.run_async(_probe_all)
+    scraper.logger.info(f"🔎 URL 유효성 확인: {len(entries)}개 항목, 고유 URL {len(results)}개")
+    return build_liveness_records(entries, results, scraper.logger)
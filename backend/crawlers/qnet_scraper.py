@@ -9,13 +9,13 @@ Q-Net 크롤러 (guide.md 4.3 Scraper Logic #1)
 """
 
 import os
-import re
 import httpx
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Optional
 
 from crawlers.base import BaseScraper
+from crawlers.html_tables import NUMBER_RE, ROUND_RE, table_rows
+from crawlers.http_client import build_client
 
 
 class QNetScraper(BaseScraper):
@@ -33,17 +33,7 @@ class QNetScraper(BaseScraper):
         super().__init__()
         self.api_key = os.getenv("DATA_GO_KR_API_KEY", "")
         self.year = datetime.now().year
-        self.client = httpx.Client(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            },
-        )
+        self.client = build_client(timeout=30.0)
 
     # ============================================================
     # 1단계: 공공데이터포털 Open API
@@ -152,20 +142,7 @@ class QNetScraper(BaseScraper):
             )
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            schedules = []
-
-            # 시험일정 테이블 파싱
-            tables = soup.select("table")
-            for table in tables:
-                rows = table.select("tbody tr")
-                for row in rows:
-                    cols = row.select("td")
-                    if len(cols) < 4:
-                        continue
-                    schedule = self._parse_table_row(cols)
-                    if schedule:
-                        schedules.append(schedule)
+            schedules = self._parse_html_schedules(response.text)
 
             # 크롤링 성공했지만 파싱된 게 없으면 → known 데이터 반환
             if not schedules:
@@ -185,10 +162,18 @@ class QNetScraper(BaseScraper):
             self.logger.warning(f"Q-Net 크롤링 에러: {e}")
             return self._get_known_schedules()
 
-    def _parse_table_row(self, cols) -> Optional[Dict]:
-        """테이블 행에서 일정 정보 추출"""
+    def _parse_html_schedules(self, html: str) -> List[Dict]:
+        """시험일정 테이블 파싱 (셀 4개 이상인 tbody 행)"""
+        schedules = []
+        for texts in table_rows(html, min_cells=4):
+            schedule = self._parse_table_row(texts)
+            if schedule:
+                schedules.append(schedule)
+        return schedules
+
+    def _parse_table_row(self, texts: List[str]) -> Optional[Dict]:
+        """테이블 행(셀 텍스트)에서 일정 정보 추출"""
         try:
-            texts = [c.get_text(strip=True) for c in cols]
             if len(texts) < 4:
                 return None
 
@@ -205,10 +190,7 @@ class QNetScraper(BaseScraper):
 
     def _extract_round(self, text: str) -> int:
         """회차 번호 추출"""
-        match = re.search(r"(\d+)\s*회", text)
-        if match:
-            return int(match.group(1))
-        match = re.search(r"(\d+)", text)
+        match = ROUND_RE.search(text) or NUMBER_RE.search(text)
         return int(match.group(1)) if match else 1
 
     def _get_known_schedules(self) -> List[Dict]:
@@ -0,0 +1,328 @@
+"""
+크롤러 HTTP 녹화/재생 transport (오프라인 크롤링 / 크롤링 성능 측정용)
+
+모든 크롤러의 httpx 클라이언트는 http_client.build_client / build_async_client를 거치므로,
+그 안쪽 transport만 바꿔 실제 사이트 대신 디스크의 fixture로 응답합니다.
+
+  CRAWL_HTTP_MODE
+    - live   (기본): 실제 요청 — 기존 동작과 동일
+    - record: 실제 요청 + 응답을 fixture로 저장 (같은 요청은 마지막 응답으로 덮어씀)
+    - replay: 네트워크 없이 fixture로 응답, 없는 요청은 ConnectError (크롤러의 기존 Fallback 경로로 처리)
+
+  replay 모드 장애 주입 (같은 CRAWL_REPLAY_SEED + 같은 요청 순서 = 같은 결과):
+    - CRAWL_REPLAY_LATENCY_MS ± CRAWL_REPLAY_JITTER_MS 만큼 응답 지연
+    - CRAWL_REPLAY_FAILURE_RATE 확률로 ReadTimeout 또는 503 응답
+
+fixture: CRAWL_FIXTURE_DIR(기본 benchmarks/fixtures/http)/<호스트>/<METHOD>-<요청 해시>.json
+요청 해시는 메서드 + URL(쿼리 정렬) + 본문으로 만들며, serviceKey 등 인증 파라미터 값은 제외하고 저장합니다.
+
+사용법 (backend 디렉터리에서):
+  CRAWL_HTTP_MODE=record python -m crawlers.run_crawlers      # 녹화
+  CRAWL_HTTP_MODE=replay python -m crawlers.run_crawlers      # 재생 (네트워크 불필요)
+  python -m benchmarks.bench_crawl --latency-ms 80            # 재생 기반 단계별 시간 측정
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from crawlers.http_client import get_crawl_setting
+
+logger = logging.getLogger("crawlers.replay")
+
+MODES = ("live", "record", "replay")
+DEFAULT_FIXTURE_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures" / "http"
+
+# fixture 키/저장 URL에서 값을 지우는 쿼리 파라미터 (소문자 비교)
+SECRET_PARAMS = {"servicekey", "apikey", "api_key", "key", "token", "access_token"}
+
+# 저장하지 않는 응답 헤더 — 본문은 디코딩된 상태로 저장하므로 인코딩/길이 헤더는 재생 시 맞지 않음
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def http_mode() -> str:
+    mode = str(get_crawl_setting("CRAWL_HTTP_MODE", "live")).strip().lower()
+    if mode not in MODES:
+        logger.warning(f"⚠️ 알 수 없는 CRAWL_HTTP_MODE={mode} → live")
+        return "live"
+    return mode
+
+
+def fixture_dir() -> Path:
+    configured = str(get_crawl_setting("CRAWL_FIXTURE_DIR", "")).strip()
+    return Path(configured) if configured else DEFAULT_FIXTURE_DIR
+
+
+# ============================================================
+# fixture 저장소
+# ============================================================
+
+def redacted_url(url: httpx.URL) -> str:
+    """인증 파라미터 값 제거 + 쿼리 정렬 (같은 요청 = 같은 문자열)"""
+    query = sorted(
+        (k, "" if k.lower() in SECRET_PARAMS else v)
+        for k, v in parse_qsl(url.query.decode("ascii", "replace"), keep_blank_values=True)
+    )
+    base = str(url.copy_with(query=None, fragment=None))
+    return f"{base}?{urlencode(query)}" if query else base
+
+
+def request_key(request: httpx.Request) -> str:
+    body = request.content or b""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b"\n")
+    digest.update(redacted_url(request.url).encode())
+    digest.update(b"\n")
+    digest.update(body)
+    return f"{request.method}-{digest.hexdigest()[:24]}"
+
+
+class FixtureStore:
+    """요청 → 응답 fixture (디스크 + 읽은 fixture 메모리 캐시)"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._loaded: Dict[Path, Optional[dict]] = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, request: httpx.Request) -> Path:
+        host = request.url.host or "unknown"
+        return self.directory / host / f"{request_key(request)}.json"
+
+    def save(self, request: httpx.Request, response: httpx.Response):
+        path = self.path_for(request)
+        payload = {
+            "request": {"method": request.method, "url": redacted_url(request.url)},
+            "status": response.status_code,
+            "headers": [[k, v] for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS],
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "elapsed_ms": round(response.elapsed.total_seconds() * 1000, 1) if _has_elapsed(response) else None,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"⚠️ fixture 저장 실패: {path.name} — {e}")
+            return
+        with self._lock:
+            self._loaded[path] = payload
+
+    def load(self, request: httpx.Request) -> httpx.Response:
+        path = self.path_for(request)
+        with self._lock:
+            if path in self._loaded:
+                payload = self._loaded[path]
+            else:
+                payload = self._read(path)
+                self._loaded[path] = payload
+        if payload is None:
+            raise httpx.ConnectError(f"replay fixture 없음: {request.method} {redacted_url(request.url)}", request=request)
+        return httpx.Response(
+            payload["status"],
+            headers=payload["headers"],
+            content=base64.b64decode(payload["body"]),
+            request=request,
+        )
+
+    @staticmethod
+    def _read(path: Path) -> Optional[dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ fixture 읽기 실패: {path.name} — {e}")
+            return None
+
+
+def _has_elapsed(response: httpx.Response) -> bool:
+    try:
+        response.elapsed
+        return True
+    except RuntimeError:
+        return False
+
+
+# ============================================================
+# 장애 주입 (replay)
+# ============================================================
+
+class FaultInjector:
+    """
+    요청별 지연 / 실패 결정 — 요청 키와 그 키의 호출 순번으로 난수를 만들어
+    스레드 실행 순서와 관계없이 같은 요청 순서면 같은 결과
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = max(latency_ms, 0.0)
+        self.jitter_ms = max(jitter_ms, 0.0)
+        self.failure_rate = min(max(failure_rate, 0.0), 1.0)
+        self.seed = seed
+        self._calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "FaultInjector":
+        return cls(
+            latency_ms=float(get_crawl_setting("CRAWL_REPLAY_LATENCY_MS", 0.0)),
+            jitter_ms=float(get_crawl_setting("CRAWL_REPLAY_JITTER_MS", 0.0)),
+            failure_rate=float(get_crawl_setting("CRAWL_REPLAY_FAILURE_RATE", 0.0)),
+            seed=int(get_crawl_setting("CRAWL_REPLAY_SEED", 0)),
+        )
+
+    def decide(self, request: httpx.Request) -> Tuple[float, Optional[str]]:
+        """(지연 초, 실패 종류 — None / "timeout" / "503")"""
+        if not (self.latency_ms or self.jitter_ms or self.failure_rate):
+            return 0.0, None
+        key = request_key(request)
+        with self._lock:
+            count = self._calls.get(key, 0)
+            self._calls[key] = count + 1
+        rng = random.Random(f"{self.seed}:{key}:{count}")
+        delay_ms = max(self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms), 0.0)
+        failure = None
+        if rng.random() < self.failure_rate:
+            failure = "timeout" if rng.random() < 0.5 else "503"
+        return delay_ms / 1000, failure
+
+
+def _failure_response(request: httpx.Request, failure: str) -> httpx.Response:
+    if failure == "timeout":
+        raise httpx.ReadTimeout(f"replay 장애 주입: timeout ({request.url.host})", request=request)
+    return httpx.Response(503, content=b"replay fault injection", request=request)
+
+
+# ============================================================
+# transport
+# ============================================================
+
+class RecordingTransport(httpx.BaseTransport):
+    """실제 요청 후 응답을 fixture로 저장"""
+
+    def __init__(self, transport: httpx.BaseTransport, store: FixtureStore):
+        self._transport = transport
+        self._store = store
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        response.read()
+        self._store.save(request, response)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, store: FixtureStore):
+        self._transport = transport
+        self._store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        await response.aread()
+        self._store.save(request, response)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """fixture로 응답 (네트워크 없음)"""
+
+    def __init__(self, store: FixtureStore, faults: FaultInjector):
+        self._store = store
+        self._faults = faults
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay, failure = self._faults.decide(request)
+        if delay:
+            time.sleep(delay)
+        if failure:
+            return _failure_response(request, failure)
+        return self._store.load(request)
+
+
+class AsyncReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, store: FixtureStore, faults: FaultInjector):
+        self._store = store
+        self._faults = faults
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay, failure = self._faults.decide(request)
+        if delay:
+            await asyncio.sleep(delay)
+        if failure:
+            return _failure_response(request, failure)
+        return self._store.load(request)
+
+
+# ============================================================
+# 팩토리 (http_client.build_client / build_async_client에서 사용)
+# ============================================================
+
+_store: Optional[FixtureStore] = None
+_faults: Optional[FaultInjector] = None
+_state_lock = threading.Lock()
+
+
+def _shared() -> Tuple[FixtureStore, FaultInjector]:
+    """프로세스 전역 fixture 저장소 / 장애 주입기 (설정이 바뀌면 다시 생성)"""
+    global _store, _faults
+    directory = fixture_dir()
+    faults = FaultInjector.from_settings()
+    with _state_lock:
+        if _store is None or _store.directory != directory:
+            _store = FixtureStore(directory)
+        if _faults is None or (
+            (_faults.latency_ms, _faults.jitter_ms, _faults.failure_rate, _faults.seed)
+            != (faults.latency_ms, faults.jitter_ms, faults.failure_rate, faults.seed)
+        ):
+            _faults = faults
+        return _store, _faults
+
+
+def reset_replay_state():
+    """fixture 메모리 캐시 / 장애 주입 순번 초기화 (벤치마크 반복 실행 사이)"""
+    global _store, _faults
+    with _state_lock:
+        _store = None
+        _faults = None
+
+
+def base_transport() -> httpx.BaseTransport:
+    """CRAWL_HTTP_MODE에 맞는 가장 안쪽 transport"""
+    mode = http_mode()
+    if mode == "live":
+        return httpx.HTTPTransport()
+    store, faults = _shared()
+    if mode == "record":
+        return RecordingTransport(httpx.HTTPTransport(), store)
+    return ReplayTransport(store, faults)
+
+
+def async_base_transport() -> httpx.AsyncBaseTransport:
+    """base_transport의 비동기 버전"""
+    mode = http_mode()
+    if mode == "live":
+        return httpx.AsyncHTTPTransport()
+    store, faults = _shared()
+    if mode == "record":
+        return AsyncRecordingTransport(httpx.AsyncHTTPTransport(), store)
+    return AsyncReplayTransport(store, faults)
@@ -1,6 +1,7 @@
 """
 크롤러 오케스트레이터 (guide.md 4.3 자동 업데이트 파이프라인)
-모든 크롤러를 순서대로 실행하고 결과를 요약합니다.
+모든 크롤러를 실행하고 결과를 요약합니다.
+기본은 CRAWL_MAX_CONCURRENCY개 소스를 병렬 실행하며, --concurrency 1이면 순차 실행합니다.
 
 3단계 Fallback 전략 (각 크롤러 공통):
   1단계: 공식 API 호출
@@ -15,14 +16,23 @@
   python -m crawlers.run_crawlers --finance    # 금융 자격증만
   python -m crawlers.run_crawlers --itdomestic # 국내 IT 자격증만
   python -m crawlers.run_crawlers --intl       # 국제 CBT 자격증만
+  python -m crawlers.run_crawlers --concurrency 1  # 순차 실행
+  python -m crawlers.run_crawlers --qnet --profile # 프로파일 저장 (CACHE_DIR/profiles)
+  python -m crawlers.run_crawlers --force        # 지문이 같아도 DB에 씀 (수동 수정 후 재동기화)
 """
 
+import os
 import sys
 import time
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import Callable, List, Optional
+
+from crawlers.http_client import get_crawl_setting
 
 logger = logging.getLogger("crawler_runner")
 
@@ -34,7 +44,7 @@ if __name__ == "__main__":
     )
 
 
-def run_qnet():
+def run_qnet(resolver=None):
     """Q-Net 크롤러 실행"""
     from crawlers.qnet_scraper import QNetScraper
 
@@ -44,6 +54,7 @@ def run_qnet():
     logger.info("=" * 60)
     start = time.time()
     scraper = QNetScraper()
+    scraper.resolver = resolver
     try:
         stats = scraper.save_to_db()
         elapsed = time.time() - start
@@ -58,7 +69,7 @@ def run_qnet():
         scraper.close()
 
 
-def run_kdata():
+def run_kdata(resolver=None):
     """KData 크롤러 실행"""
     from crawlers.kdata_scraper import KDataScraper
 
@@ -68,6 +79,7 @@ def run_kdata():
     logger.info("=" * 60)
     start = time.time()
     scraper = KDataScraper()
+    scraper.resolver = resolver
     try:
         stats = scraper.save_to_db()
         elapsed = time.time() - start
@@ -82,7 +94,7 @@ def run_kdata():
         scraper.close()
 
 
-def run_cloud():
+def run_cloud(resolver=None):
     """Cloud Vendor 크롤러 실행"""
     from crawlers.cloud_scraper import CloudScraper
 
@@ -92,6 +104,7 @@ def run_cloud():
     logger.info("=" * 60)
     start = time.time()
     scraper = CloudScraper()
+    scraper.resolver = resolver
     try:
         stats = scraper.save_to_db()
         elapsed = time.time() - start
@@ -106,7 +119,7 @@ def run_cloud():
         scraper.close()
 
 
-def run_finance():
+def run_finance(resolver=None):
     """금융 자격증 크롤러 실행"""
     from crawlers.finance_scraper import FinanceScraper
 
@@ -116,6 +129,7 @@ def run_finance():
     logger.info("=" * 60)
     start = time.time()
     scraper = FinanceScraper()
+    scraper.resolver = resolver
     try:
         stats = scraper.save_to_db()
         elapsed = time.time() - start
@@ -130,7 +144,7 @@ def run_finance():
         scraper.close()
 
 
-def run_it_domestic():
+def run_it_domestic(resolver=None):
     """국내 IT 자격증 크롤러 실행"""
     from crawlers.it_domestic_scraper import ITDomesticScraper
 
@@ -140,6 +154,7 @@ def run_it_domestic():
     logger.info("=" * 60)
     start = time.time()
     scraper = ITDomesticScraper()
+    scraper.resolver = resolver
     try:
         stats = scraper.save_to_db()
         elapsed = time.time() - start
@@ -154,7 +169,7 @@ def run_it_domestic():
         scraper.close()
 
 
-def run_intl_cert():
+def run_intl_cert(resolver=None):
     """국제 CBT 자격증 크롤러 실행"""
     from crawlers.intl_cert_scraper import IntlCertScraper
 
@@ -164,6 +179,7 @@ def run_intl_cert():
     logger.info("=" * 60)
     start = time.time()
     scraper = IntlCertScraper()
+    scraper.resolver = resolver
     try:
         stats = scraper.save_to_db()
         elapsed = time.time() - start
@@ -188,6 +204,7 @@ def print_summary(results):
     total_inserted = 0
     total_updated = 0
     total_skipped = 0
+    total_unchanged = 0
 
     METHOD_LABELS = {
         "api": "🟢 공식 API",
@@ -212,12 +229,19 @@ def print_summary(results):
             total_inserted += inserted
             total_updated += updated
             total_skipped += skipped
-            logger.info(f"       매칭: {found}, 신규: {inserted}, 업데이트: {updated}, 건너뜀: {skipped}")
+            unchanged = stats.get("unchanged", 0)
+            total_unchanged += unchanged
+            logger.info(
+                f"       매칭: {found}, 신규: {inserted}, 업데이트: {updated}, 변경 없음: {unchanged}, 건너뜀: {skipped}"
+            )
         elif r["status"] == "failed":
             logger.info(f"       에러: {r.get('error', 'unknown')}")
 
     logger.info("-" * 60)
-    logger.info(f"  📈 합계 — 신규: {total_inserted}, 업데이트: {total_updated}, 건너뜀: {total_skipped}")
+    logger.info(
+        f"  📈 합계 — 신규: {total_inserted}, 업데이트: {total_updated}, "
+        f"변경 없음: {total_unchanged}, 건너뜀: {total_skipped}"
+    )
     logger.info("=" * 60)
 
     return results
@@ -242,19 +266,84 @@ def sync_seed_events_ts():
         return {"status": "failed", "error": str(e)}
 
 
-def run_all_crawlers() -> list:
+def _instrumented(runner: Callable[[], dict], name: str, profile: bool = False) -> Callable[[], dict]:
+    """
+    SQL 통계의 호출 위치를 'crawler:<소스>'로 지정 (run_qnet → crawler:qnet)
+    profile=True면 소스 실행 전체를 프로파일링해 speedscope JSON으로 저장 (services.profiling)
+    """
+    source = name.removeprefix("run_")
+
+    def _run():
+        try:
+            from services.profiling import profile_block
+            from services.query_stats import call_site
+        except Exception:
+            return runner()
+        with call_site(f"crawler:{source}"), profile_block(f"crawl-{source}", enabled=profile):
+            return runner()
+
+    return _run
+
+
+def written_rows(results) -> int:
+    """성공한 소스가 DB에 실제로 쓴 행 수 (신규 + 업데이트) — 0이면 캐시 무효화 불필요"""
+    return sum(
+        r["stats"].get("inserted", 0) + r["stats"].get("updated", 0)
+        for r in results if r["status"] == "success" and "stats" in r
+    )
+
+
+def notify_api_workers(results):
+    """
+    일정이 바뀌었으면 API 워커들의 카탈로그 캐시 + 자동완성 인덱스 무효화 (pg_notify)
+    CLI 실행(GitHub Actions cron)은 스케줄러를 거치지 않으므로 여기서 직접 발행
+    """
+    if not written_rows(results):
+        logger.info("♻️ 크롤링 결과 변경 없음 → 캐시 무효화 생략")
+        return
+    from services.invalidation import broadcast_change_sync
+    broadcast_change_sync(reason="crawl")
+
+
+def run_runners(
+    runners: List[Callable[..., dict]],
+    concurrency: Optional[int] = None,
+    profile: bool = False,
+) -> list:
+    """
+    크롤러 실행 함수 목록을 병렬(또는 순차) 실행
+    - 각 run_*() 함수가 자체적으로 예외를 잡아 결과 dict를 반환하므로 소스별 실패가 격리됨
+    - 자격증 이름 해석기는 한 번만 로드해 모든 소스가 공유
+    - 결과는 입력 순서대로 반환
+    - profile=True면 소스별 프로파일 저장 (--profile)
+    """
+    from crawlers.cert_resolver import load_resolver
+
+    resolver = load_resolver()
+    runners = [_instrumented(partial(runner, resolver=resolver), runner.__name__, profile) for runner in runners]
+
+    if concurrency is None:
+        concurrent = get_crawl_setting("CRAWL_CONCURRENT", True)
+        concurrency = get_crawl_setting("CRAWL_MAX_CONCURRENCY", 3) if concurrent else 1
+    concurrency = max(concurrency, 1)
+
+    if concurrency == 1 or len(runners) <= 1:
+        return [runner() for runner in runners]
+
+    logger.info(f"🚀 병렬 크롤링: {len(runners)}개 소스 (동시 {concurrency}개)")
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="crawler") as pool:
+        return list(pool.map(lambda runner: runner(), runners))
+
+
+def run_all_crawlers(concurrency: Optional[int] = None) -> list:
     """
     모든 크롤러 실행 (FastAPI 엔드포인트용 동기 함수)
     크롤링 완료 후 seed-events.ts 자동 동기화
     """
-    results = [
-        run_qnet(),
-        run_kdata(),
-        run_cloud(),
-        run_finance(),
-        run_it_domestic(),
-        run_intl_cert(),
-    ]
+    results = run_runners(
+        [run_qnet, run_kdata, run_cloud, run_finance, run_it_domestic, run_intl_cert],
+        concurrency,
+    )
     print_summary(results)
 
     # 크롤링 완료 후 seed-events.ts 동기화
@@ -271,36 +360,47 @@ def main():
     parser.add_argument("--finance", action="store_true", help="금융 자격증 크롤러만 실행")
     parser.add_argument("--itdomestic", action="store_true", help="국내 IT 자격증 크롤러만 실행")
     parser.add_argument("--intl", action="store_true", help="국제 CBT 자격증 크롤러만 실행")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 실행 소스 수 (1이면 순차 실행)")
+    parser.add_argument("--profile", action="store_true", help="소스별 실행 프로파일 저장 (speedscope JSON)")
+    parser.add_argument("--force", action="store_true", help="일정 집합 지문이 같아도 DB에 씀 (수동 수정/복구 후 재동기화)")
     args = parser.parse_args()
 
+    if args.force:
+        # get_crawl_setting은 환경변수를 먼저 읽으므로 병렬 실행되는 모든 소스에 적용됨
+        os.environ["CRAWL_FORCE_WRITE"] = "true"
+
     # 아무 옵션도 없으면 전체 실행
     run_all = not (args.qnet or args.kdata or args.cloud or args.finance or args.itdomestic or args.intl)
 
-    results = []
+    runners = []
 
     if run_all or args.qnet:
-        results.append(run_qnet())
+        runners.append(run_qnet)
 
     if run_all or args.kdata:
-        results.append(run_kdata())
+        runners.append(run_kdata)
 
     if run_all or args.cloud:
-        results.append(run_cloud())
+        runners.append(run_cloud)
 
     if run_all or args.finance:
-        results.append(run_finance())
+        runners.append(run_finance)
 
     if run_all or args.itdomestic:
-        results.append(run_it_domestic())
+        runners.append(run_it_domestic)
 
     if run_all or args.intl:
-        results.append(run_intl_cert())
+        runners.append(run_intl_cert)
+
+    results = run_runners(runners, args.concurrency, profile=args.profile)
 
     print_summary(results)
 
     # 크롤링 완료 후 seed-events.ts 동기화
     sync_seed_events_ts()
 
+    notify_api_workers(results)
+
     # 하나라도 실패하면 exit code 1
     if any(r["status"] == "failed" for r in results):
         sys.exit(1)
@@ -3,12 +3,20 @@
 guide.md 2절 - PostgreSQL (Supabase 활용 권장)
 """
 
+import logging
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from config import get_settings
+from services.metrics import TimedAsyncAdaptedQueuePool, instrument_pool
 
+logger = logging.getLogger("database")
 settings = get_settings()
 
+# 스키마 초기화 직렬화용 advisory lock 키 (워커 여러 개가 동시에 기동해도 DDL은 하나씩)
+SCHEMA_LOCK_KEY = 7310000
+
 # ===== Async Engine (FastAPI용) =====
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -17,7 +25,9 @@ engine = create_async_engine(
     max_overflow=5,         # 피크 시 최대 15 연결
     pool_recycle=1800,      # 30분마다 커넥션 재생성 (DB timeout 방지)
     pool_pre_ping=True,     # 쿼리 전 커넥션 유효성 검사 (stale connection 방지)
+    poolclass=TimedAsyncAdaptedQueuePool,  # 커넥션 획득 대기 시간 메트릭
 )
+instrument_pool(engine, "api")
 
 # ===== Session Factory =====
 async_session = async_sessionmaker(
@@ -43,10 +53,66 @@ async def get_db() -> AsyncSession:
             await session.rollback()
             raise
         # async with이 자동으로 close 처리하므로 finally 불필요
+        await run_after_commit(session)
+
+
+def after_commit(session: AsyncSession, callback):
+    """
+    커밋 성공 후 실행할 비동기 콜백 등록 (캐시/인덱스 갱신용)
+    같은 콜백은 요청당 한 번만 실행되며, 롤백되면 실행되지 않음
+    """
+    callbacks = session.info.setdefault("after_commit", [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+async def run_after_commit(session: AsyncSession):
+    """등록된 after_commit 콜백 실행 (실패해도 응답에는 영향 없음)"""
+    for callback in session.info.pop("after_commit", []):
+        try:
+            await callback()
+        except Exception as e:
+            logger.warning(f"⚠️ 커밋 후 처리 실패: {getattr(callback, '__name__', callback)} — {e}")
 
 
 # ===== DB 초기화 =====
 async def init_db():
-    """테이블 생성 (개발 환경용)"""
+    """
+    테이블 생성 (개발 환경용) + 스키마 보강 DDL 적용
+    models.SCHEMA_DDL의 각 문장은 SAVEPOINT 안에서 실행하여
+    하나가 실패(권한 부족 등)해도 나머지는 계속 적용
+    """
+    from models import SCHEMA_DDL
+
     async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
         await conn.run_sync(Base.metadata.create_all)
+
+        for ddl in SCHEMA_DDL:
+            try:
+                async with conn.begin_nested():
+                    await conn.exec_driver_sql(ddl)
+            except Exception as e:
+                summary = " ".join(ddl.split())[:80]
+                logger.warning(f"⚠️ 스키마 DDL 적용 실패 (건너뜀): {summary}... — {e}")
+
+        # pg_trgm 확장이 없으면(CREATE EXTENSION 권한 부족 등) similarity() 관련도 정렬 자동 비활성화
+        try:
+            from services.search import set_trgm_available
+            result = await conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+            trgm_installed = result.first() is not None
+            set_trgm_available(trgm_installed)
+            if settings.SEARCH_TRGM_ENABLED and not trgm_installed:
+                logger.warning("⚠️ pg_trgm 확장 미설치 → 검색 관련도에서 similarity() 제외 (정확/접두사 일치만)")
+        except Exception as e:
+            logger.warning(f"⚠️ pg_trgm 설치 여부 확인 실패: {e}")
+
+        # 캘린더 구체화 테이블 초기 채우기 / 누락분 보정 (변경 없으면 대상 0건)
+        try:
+            from services.calendar_events import refresh_calendar_events
+            async with conn.begin_nested():
+                refreshed = await refresh_calendar_events(conn)
+            if refreshed:
+                logger.info(f"📅 calendar_events 갱신: 일정 {refreshed}건")
+        except Exception as e:
+            logger.warning(f"⚠️ calendar_events 초기 갱신 실패: {e}")
@@ -3,7 +3,7 @@ Certi-Hub FastAPI 메인 애플리케이션
 guide.md 2절 - Backend: FastAPI (Python)
 
 확장 기능:
-  - APScheduler: 매일 새벽 3시 자동 크롤링
+  - APScheduler: 매일 새벽 3시 자동 크롤링 (advisory lock 리더 워커만 실행)
   - CrawlLog: 크롤링 이력 DB 관리
   - seed-events.ts: DB → 프론트엔드 fallback 데이터 자동 동기화
   - 구조적 로깅 + 글로벌 에러 핸들링 미들웨어
@@ -15,11 +15,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings
-from database import init_db, async_session
+from database import init_db, async_session, engine
 from logging_config import setup_logging
-from middleware import RequestLoggingMiddleware
+from middleware import ProfilingMiddleware, RequestLoggingMiddleware
 from routers import certifications, schedules
 from routers.crawl import router as crawl_router
+from routers.debug import router as debug_router
+from routers.metrics import router as metrics_router
+from services.query_stats import instrument_engine as instrument_query_stats
+from services.timing import TimedJSONResponse, instrument_engine
 
 # 로깅 초기화 (앱 시작 전에 설정)
 setup_logging()
@@ -27,6 +31,10 @@ setup_logging()
 logger = logging.getLogger("main")
 settings = get_settings()
 
+# 쿼리 실행 시간 측정 (Server-Timing의 db 구간 + 문장별 통계 / 느린 쿼리 로그)
+instrument_engine(engine)
+instrument_query_stats(engine)
+
 
 # ===== Lifespan (DB 초기화 + 스케줄러 시작) =====
 
@@ -36,11 +44,25 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("✅ 데이터베이스 초기화 완료")
 
-    # APScheduler 시작 (정기 크롤링)
+    # 자동완성 메모리 인덱스 로드 (실패 시 /search는 DB 검색으로 동작)
     try:
-        from services.scheduler import start_scheduler, stop_scheduler
-        start_scheduler()
-        logger.info("🕐 APScheduler 정기 크롤링 스케줄러 시작됨")
+        from services.autocomplete import refresh_autocomplete_index
+        await refresh_autocomplete_index()
+    except Exception as e:
+        logger.warning(f"⚠️ 자동완성 인덱스 로드 실패 (DB 검색으로 대체): {e}")
+
+    # 워커 간 캐시 무효화 구독 (LISTEN/NOTIFY)
+    try:
+        from services.invalidation import start_invalidation_listener
+        await start_invalidation_listener()
+    except Exception as e:
+        logger.warning(f"⚠️ 캐시 무효화 구독 시작 실패: {e}")
+
+    # APScheduler 시작 (정기 크롤링) — advisory lock 리더 워커 하나만 실행
+    try:
+        from services.scheduler import start_leader_election
+        await start_leader_election()
+        logger.info("🕐 APScheduler 리더 선출 시작됨 (리더 워커만 정기 크롤링 실행)")
     except ImportError:
         logger.warning("⚠️ APScheduler 미설치 — 정기 크롤링 비활성화 (pip install apscheduler)")
     except Exception as e:
@@ -48,13 +70,23 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # APScheduler 종료
+    # APScheduler 종료 (리더였다면 락 반환 → 다른 워커가 즉시 승계 가능)
+    try:
+        from services.scheduler import stop_leader_election
+        await stop_leader_election()
+    except Exception:
+        pass
+
     try:
-        from services.scheduler import stop_scheduler
-        stop_scheduler()
+        from services.invalidation import stop_invalidation_listener
+        await stop_invalidation_listener()
     except Exception:
         pass
 
+    # 멀티 워커 메트릭: 이 워커의 livesum 게이지 정리
+    from services.metrics import mark_worker_dead
+    mark_worker_dead()
+
     logger.info("🛑 서버 종료")
 
 
@@ -65,6 +97,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="IT 자격증 통합 관리 API - 자격증 정보 조회, 시험 일정 관리, 검색/필터링",
     lifespan=lifespan,
+    # response_model 라우트의 JSON 렌더링도 Server-Timing serialize 구간으로 집계
+    default_response_class=TimedJSONResponse,
 )
 
 # ===== 미들웨어 (순서 중요: 아래서부터 위로 실행) =====
@@ -94,10 +128,15 @@ app.add_middleware(
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
+    allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-Debug-Token", "X-Profile"],
+    expose_headers=["X-Next-Cursor", "Server-Timing", "X-Profile"],  # 크롤링 이력 커서 / 구간별 응답 시간 / 프로파일 파일
 )
 
-# 2. 요청 로깅 + 에러 핸들링
+# 2. 요청 프로파일링 (X-Profile + 진단 토큰인 요청만 — 로깅 미들웨어 안쪽)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# 3. 요청 로깅 + 에러 핸들링 + Server-Timing (순수 ASGI)
 app.add_middleware(RequestLoggingMiddleware)
 
 # ===== 라우터 등록 =====
@@ -105,6 +144,8 @@ app.add_middleware(RequestLoggingMiddleware)
 app.include_router(certifications.router)
 app.include_router(schedules.router)
 app.include_router(crawl_router)
+app.include_router(metrics_router)
+app.include_router(debug_router)
 
 
 # ===== 헬스체크 & 통계 =====
@@ -137,23 +178,27 @@ async def health_check():
 
 @app.get("/api/stats")
 async def get_stats():
-    """통계 정보 (프론트엔드 히어로 섹션용)"""
+    """통계 정보 (프론트엔드 히어로 섹션용, 카탈로그 캐시)"""
     from sqlalchemy import select, func
     from models import Certification, ExamSchedule
+    from services.catalog_cache import cached_response
 
-    async with async_session() as db:
-        total = await db.execute(select(func.count(Certification.id)))
-        tags = await db.execute(
-            select(func.count(func.distinct(Certification.tag)))
-        )
-        schedules = await db.execute(select(func.count(ExamSchedule.id)))
-
-    return {
-        "total_certs": total.scalar() or 0,
-        "total_tags": tags.scalar() or 0,
-        "total_schedules": schedules.scalar() or 0,
-        "total_levels": 4,
-    }
+    async def _query():
+        async with async_session() as db:
+            total = await db.execute(select(func.count(Certification.id)))
+            tags = await db.execute(
+                select(func.count(func.distinct(Certification.tag)))
+            )
+            schedules = await db.execute(select(func.count(ExamSchedule.id)))
+
+        return {
+            "total_certs": total.scalar() or 0,
+            "total_tags": tags.scalar() or 0,
+            "total_schedules": schedules.scalar() or 0,
+            "total_levels": 4,
+        }
+
+    return await cached_response("stats", {}, _query)
 
 
 # ===== 크롤러 수동 실행 엔드포인트 (레거시 호환 — 새 API: /api/crawl/trigger) =====
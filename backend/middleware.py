@@ -1,67 +1,141 @@
 """
 글로벌 미들웨어 (에러 핸들링, 요청 로깅, 응답 시간 측정)
+
+BaseHTTPMiddleware는 요청마다 별도 태스크와 응답 스트림 래핑을 만들기 때문에
+순수 ASGI 미들웨어로 구현합니다 (send만 감싸서 응답 시작 시점에 헤더 추가).
 """
 
-import time
 import logging
 import traceback
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import get_settings
+from services.debug_access import debug_token_ok
+from services.metrics import request_finished, request_started
+from services.profiling import profile_block
+from services.timing import begin_request, end_request, latency_histogram
 
 logger = logging.getLogger("middleware")
+settings = get_settings()
+
+
+def _route_label(scope: Scope) -> str:
+    """히스토그램 라벨 — 실제 경로 대신 라우트 템플릿 (예: /api/certifications/{cert_id})"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path or "unmatched"
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
-    요청/응답 로깅 + 응답 시간 측정 미들웨어
+    요청/응답 로깅 + 응답 시간 측정 미들웨어 (순수 ASGI)
     - 모든 API 요청의 method, path, status, 소요시간을 로깅
-    - 헬스체크 경로는 로깅 제외 (노이즈 방지)
+    - Server-Timing 헤더: db / serialize / app / total 구간별 시간 (ms)
+    - 라우트별 지연 히스토그램 기록 (services.timing.latency_histogram, Prometheus /metrics)
+    - 헬스체크 / 메트릭 수집 경로는 로깅/측정 제외 (노이즈 방지)
     """
 
-    SKIP_PATHS = {"/api/health", "/favicon.ico", "/nginx-health"}
+    SKIP_PATHS = {"/api/health", "/favicon.ico", "/nginx-health", "/metrics"}
 
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in self.SKIP_PATHS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        start = time.time()
-        method = request.method
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        try:
-            response = await call_next(request)
-            elapsed = (time.time() - start) * 1000  # ms
-
-            # 200~399: INFO, 400~499: WARNING, 500+: ERROR
-            status = response.status_code
-            if status >= 500:
-                logger.error(
-                    f"{method} {path} → {status} ({elapsed:.0f}ms)"
-                )
-            elif status >= 400:
-                logger.warning(
-                    f"{method} {path} → {status} ({elapsed:.0f}ms)"
-                )
-            else:
-                logger.info(
-                    f"{method} {path} → {status} ({elapsed:.0f}ms)"
-                )
-
-            # 응답 헤더에 처리 시간 추가
-            response.headers["X-Process-Time"] = f"{elapsed:.0f}ms"
-            return response
+        timing, token = begin_request(scope)
+        request_started()
+        method = scope["method"]
+        path = scope["path"]
+        status = 500
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal status, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status = message["status"]
+                total_ns = timing.elapsed_ns()
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{total_ns / 1e6:.0f}ms".encode()))
+                if settings.SERVER_TIMING_ENABLED:
+                    headers.append((b"server-timing", timing.server_timing(total_ns).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            elapsed = (time.time() - start) * 1000
-            logger.error(
-                f"{method} {path} → 500 ({elapsed:.0f}ms) UNHANDLED: {exc}"
-            )
+            elapsed_ms = timing.elapsed_ns() / 1e6
+            logger.error("%s %s → 500 (%.0fms) UNHANDLED: %s", method, path, elapsed_ms, exc)
             logger.error(traceback.format_exc())
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "detail": "서버 내부 오류가 발생했습니다.",
                     "error": str(exc) if logger.isEnabledFor(logging.DEBUG) else "Internal Server Error",
                 },
             )
+            await response(scope, receive, send_wrapper)
+            return
+        finally:
+            elapsed_ns = timing.elapsed_ns()
+            end_request(token)
+            route = _route_label(scope)
+            latency_histogram.observe(method, route, elapsed_ns)
+            request_finished(method, route, status, elapsed_ns / 1e9)
+
+        # 200~399: INFO, 400~499: WARNING, 500+: ERROR (비활성 레벨이면 포맷 비용 없음)
+        level = logging.ERROR if status >= 500 else logging.WARNING if status >= 400 else logging.INFO
+        if logger.isEnabledFor(level):
+            logger.log(level, "%s %s → %d (%.0fms)", method, path, status, elapsed_ns / 1e6)
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 샘플링 프로파일링 (순수 ASGI, services.profiling)
+    - X-Profile: 1 헤더 또는 ?_profile=1 + 유효한 X-Debug-Token인 요청만 프로파일러 실행
+    - 응답의 X-Profile 헤더로 저장된 speedscope 파일 이름 전달 (GET /api/debug/profiles/{name})
+    - 플래그가 없는 요청은 헤더 확인만 하고 그대로 통과
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    @staticmethod
+    def _flags(scope: Scope):
+        """(프로파일 요청 여부, 진단 토큰)"""
+        requested = b"_profile=1" in scope.get("query_string", b"")
+        token = None
+        for key, value in scope["headers"]:
+            if key == b"x-profile":
+                requested = requested or value not in (b"", b"0", b"false")
+            elif key == b"x-debug-token":
+                token = value.decode("latin-1")
+        return requested, token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        requested, token = self._flags(scope)
+        if not requested or not debug_token_ok(token):
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope['method']}-{scope['path']}"
+        with profile_block(label, async_mode="enabled") as handle:
+
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    value = handle.name or "busy"
+                    message = {**message, "headers": [*message.get("headers", []), (b"x-profile", value.encode())]}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -4,6 +4,7 @@ SQLAlchemy ORM 모델 (guide.md 3절 ERD 매핑)
 3.1 certifications 테이블 (마스터)
 3.2 exam_schedules 테이블 (일정)
 3.3 crawl_logs 테이블 (크롤링 이력)
+crawl_fingerprints 테이블 (소스별 마지막 저장 일정 집합 지문)
 """
 
 import uuid
@@ -19,6 +20,7 @@ from sqlalchemy import (
     ForeignKey,
     Enum as SAEnum,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -53,7 +55,8 @@ class Certification(Base):
     __table_args__ = (
         Index("ix_cert_tag", "tag"),
         Index("ix_cert_level", "level"),
-        Index("ix_cert_name_ko", "name_ko"),
+        # 이름 정렬 목록의 keyset 커서 (name_ko, id) > (…) — 이름 단일 인덱스를 대체
+        Index("ix_cert_name_ko_id", "name_ko", "id"),
     )
 
     def __repr__(self):
@@ -88,13 +91,59 @@ class ExamSchedule(Base):
     # Indexes
     __table_args__ = (
         Index("ix_schedule_cert_id", "cert_id"),
-        Index("ix_schedule_exam_date", "exam_date"),
+        # 캘린더/일정 범위 조회 (exam_date >= :start AND exam_date < :end)
+        Index("ix_schedule_exam_date_cert", "exam_date", "cert_id"),
+        # 접수 시작일 / 발표일 범위 조회 — 값이 있는 행만 색인 (부분 인덱스)
+        Index("ix_schedule_reg_start", "reg_start", "cert_id", postgresql_where=text("reg_start IS NOT NULL")),
+        Index("ix_schedule_result_date", "result_date", "cert_id", postgresql_where=text("result_date IS NOT NULL")),
+        # 크롤러 bulk upsert(INSERT ... ON CONFLICT)의 충돌 대상
+        Index("uq_schedule_cert_round", "cert_id", "round", unique=True),
     )
 
     def __repr__(self):
         return f"<ExamSchedule cert={self.cert_id} date={self.exam_date}>"
 
 
+class CalendarEntry(Base):
+    """
+    캘린더 이벤트 구체화 테이블 (exam_schedules 1행 → 접수/시험/발표 최대 3행)
+    /api/schedules/calendar와 seed-events.ts 동기화가 같은 원본을 읽도록
+    services.calendar_events에서 SQL로 갱신 (크롤링 완료 / 일정 쓰기 시 증분 갱신)
+    """
+
+    __tablename__ = "calendar_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(
+        Integer,
+        ForeignKey("exam_schedules.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="exam_schedules.id 참조 (일정 삭제 시 함께 삭제)",
+    )
+    cert_id = Column(UUID(as_uuid=True), nullable=False, comment="certifications.id")
+    cert_name = Column(String(200), nullable=False, comment="자격증 국문 명칭 (정렬/제목용)")
+    round = Column(Integer, nullable=True, comment="시험 회차")
+    type = Column(String(20), nullable=False, comment="이벤트 유형 (registration, exam, result)")
+    sort_order = Column(Integer, nullable=False, default=0, comment="같은 일정 내 유형 순서 (접수 0, 시험 1, 발표 2)")
+    title = Column(String(260), nullable=False, comment="이벤트 제목 (예: 정보처리기사 55회 접수)")
+    start_date = Column(Date, nullable=False, comment="이벤트 시작일")
+    end_date = Column(Date, nullable=True, comment="이벤트 종료일 (접수 기간만)")
+    last_date = Column(Date, nullable=False, comment="범위 조회용 마지막 날 (end_date 또는 start_date)")
+    exam_date = Column(Date, nullable=True, comment="원본 일정의 시험일 (연/월 모드 조회용)")
+    color = Column(String(20), nullable=False, comment="이벤트 색상")
+    text_color = Column(String(20), nullable=True, comment="글자 색상")
+    refreshed_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment="갱신 시각")
+
+    __table_args__ = (
+        Index("uq_calendar_schedule_type", "schedule_id", "type", unique=True),
+        Index("ix_calendar_exam_date", "exam_date"),
+        Index("ix_calendar_order", "cert_name", "round", "exam_date", "sort_order"),
+    )
+
+    def __repr__(self):
+        return f"<CalendarEntry {self.title} {self.start_date}>"
+
+
 class CrawlLog(Base):
     """
     크롤링 실행 이력 테이블 (3.3)
@@ -116,6 +165,7 @@ class CrawlLog(Base):
     inserted = Column(Integer, default=0, comment="신규 삽입 건수")
     updated = Column(Integer, default=0, comment="업데이트 건수")
     skipped = Column(Integer, default=0, comment="건너뛴 건수")
+    unchanged = Column(Integer, default=0, comment="기존 값과 같아 쓰기를 생략한 건수")
     duration_sec = Column(Float, nullable=True, comment="실행 소요 시간(초)")
     error_message = Column(Text, nullable=True, comment="실패 시 에러 메시지")
     detail = Column(JSONB, nullable=True, comment="상세 결과 JSON")
@@ -126,8 +176,82 @@ class CrawlLog(Base):
     __table_args__ = (
         Index("ix_crawl_source", "source"),
         Index("ix_crawl_status", "status"),
-        Index("ix_crawl_started_at", "started_at"),
+        # 최신순 이력의 keyset 커서 (started_at, id) < (…) — started_at 단일 인덱스를 대체
+        Index("ix_crawl_started_at_id", "started_at", "id"),
     )
 
     def __repr__(self):
         return f"<CrawlLog {self.source} [{self.status}] {self.started_at}>"
+
+
+class CrawlFingerprint(Base):
+    """
+    소스별 마지막으로 저장한 정규화 일정 집합의 지문
+    크롤러가 DB 쓰기와 같은 트랜잭션에서 갱신 — 다음 실행의 집합이 같으면 쓰기 단계를 통째로 생략
+    """
+
+    __tablename__ = "crawl_fingerprints"
+
+    source = Column(String(50), primary_key=True, comment="크롤러 source_name")
+    fingerprint = Column(String(64), nullable=False, comment="정규화된 행 집합 SHA-256")
+    row_count = Column(Integer, nullable=False, default=0, comment="지문 대상 행 수")
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment="마지막 저장 시각")
+
+    def __repr__(self):
+        return f"<CrawlFingerprint {self.source} {self.fingerprint[:12]}>"
+
+
+# ============================================================
+# 스키마 보강 DDL (기존 DB 마이그레이션용)
+# create_all은 이미 존재하는 테이블의 인덱스/제약을 추가하지 않으므로
+# init_db()에서 아래 멱등(idempotent) DDL을 순서대로 실행합니다.
+# ============================================================
+
+SCHEMA_DDL: list[str] = [
+    # exam_schedules (cert_id, round) 유니크 — 기존 중복 행이 있으면 지우지 않고 실패 (중복 목록을 경고 로그로)
+    # 중복 정리는 앱 시작의 부수효과가 아닌 수동 마이그레이션: database/migrations/dedup_exam_schedules.sql
+    """
+    DO $$
+    DECLARE
+        dup_count integer;
+        dup_sample text;
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'uq_schedule_cert_round') THEN
+            SELECT COUNT(*) INTO dup_count FROM (
+                SELECT 1 FROM exam_schedules WHERE round IS NOT NULL
+                GROUP BY cert_id, round HAVING COUNT(*) > 1
+            ) d;
+            IF dup_count > 0 THEN
+                SELECT string_agg(cert_id || '/' || round, ', ') INTO dup_sample FROM (
+                    SELECT cert_id, round FROM exam_schedules WHERE round IS NOT NULL
+                    GROUP BY cert_id, round HAVING COUNT(*) > 1
+                    ORDER BY cert_id, round LIMIT 10
+                ) d;
+                RAISE EXCEPTION 'exam_schedules (cert_id, round) 중복 %쌍 (예: %) → database/migrations/dedup_exam_schedules.sql 실행 후 재시작', dup_count, dup_sample;
+            END IF;
+            CREATE UNIQUE INDEX uq_schedule_cert_round ON exam_schedules (cert_id, round);
+        END IF;
+    END $$;
+    """,
+    # 일정 날짜 범위 인덱스 — (exam_date, cert_id)가 단일 exam_date 인덱스를 대체
+    "CREATE INDEX IF NOT EXISTS ix_schedule_exam_date_cert ON exam_schedules (exam_date, cert_id)",
+    "CREATE INDEX IF NOT EXISTS ix_schedule_reg_start ON exam_schedules (reg_start, cert_id) WHERE reg_start IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS ix_schedule_result_date ON exam_schedules (result_date, cert_id) WHERE result_date IS NOT NULL",
+    "DROP INDEX IF EXISTS ix_schedule_exam_date",
+    # 캘린더 보이는 범위 겹침 조회 (daterange && daterange) — 식 인덱스라 여기서 생성
+    "CREATE INDEX IF NOT EXISTS ix_calendar_span ON calendar_events USING gist (daterange(start_date, last_date, '[]'))",
+    # 검색용 trigram 인덱스 — ILIKE '%q%' / similarity()를 GIN 인덱스로 처리
+    # (pg_trgm 확장이 필요하므로 create_all 대상인 __table_args__가 아닌 여기서 생성)
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_cert_name_ko_trgm ON certifications USING gin (name_ko gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_cert_name_en_trgm ON certifications USING gin (name_en gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_cert_tag_trgm ON certifications USING gin (tag gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_cert_sub_tag_trgm ON certifications USING gin (sub_tag gin_trgm_ops)",
+    # keyset 페이지네이션 복합 인덱스 — 정렬 키 단일 인덱스를 대체
+    "CREATE INDEX IF NOT EXISTS ix_cert_name_ko_id ON certifications (name_ko, id)",
+    "DROP INDEX IF EXISTS ix_cert_name_ko",
+    "CREATE INDEX IF NOT EXISTS ix_crawl_started_at_id ON crawl_logs (started_at, id)",
+    "DROP INDEX IF EXISTS ix_crawl_started_at",
+    # 크롤링 이력 — 변경 없어 쓰기를 생략한 건수
+    "ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS unchanged INTEGER DEFAULT 0",
+]
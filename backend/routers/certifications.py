@@ -6,10 +6,17 @@ from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func
 
 from database import get_db
 from models import Certification
+from services.autocomplete import suggest
+from services.calendar_events import refresh_calendar_events
+from services.catalog_cache import cached_response
+from services.invalidation import AUTOCOMPLETE, CATALOG, notify_change
+from services.pagination import decode_cursor, keyset_condition, next_cursor, order_clauses
+from services.search import AUTOCOMPLETE_COLUMNS, list_sort_keys, order_by_relevance, search_condition
+from services.serialization import certification_item
 from schemas import (
     CertificationResponse,
     CertificationCreate,
@@ -28,11 +35,48 @@ async def list_certifications(
     sub_tag: Optional[str] = Query(None, description="소분류 필터"),
     level: Optional[CertLevel] = Query(None, description="레벨 필터"),
     query: Optional[str] = Query(None, max_length=100, description="검색어"),
-    page: int = Query(1, ge=1),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor 미지정 시 OFFSET 방식)"),
     size: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    include_total: Optional[bool] = Query(None, description="전체 건수 포함 여부 (기본: page 방식 true, cursor 방식 false)"),
     db: AsyncSession = Depends(get_db),
 ):
-    """자격증 목록 조회 (페이징 + 필터링)"""
+    """
+    자격증 목록 조회 (페이징 + 필터링)
+    - 정렬: 이름순(검색어가 있으면 관련도순) + id — 항상 결정적
+    - cursor 지정 시 keyset 방식: 깊은 페이지도 첫 페이지와 같은 비용
+    - 전체 건수(count)는 include_total일 때만 계산
+    - 응답은 카탈로그 버전별로 메모리 캐시 (쓰기/크롤링 시 무효화)
+    """
+    if include_total is None:
+        include_total = cursor is None
+
+    params = {
+        "tag": tag, "sub_tag": sub_tag, "level": level, "query": query,
+        "page": page, "size": size, "cursor": cursor, "include_total": include_total,
+    }
+    return await cached_response(
+        "certifications.list",
+        params,
+        lambda: _query_certifications(db, **params),
+    )
+
+
+async def _query_certifications(
+    db: AsyncSession,
+    tag: Optional[str],
+    sub_tag: Optional[str],
+    level: Optional[CertLevel],
+    query: Optional[str],
+    page: int,
+    size: int,
+    cursor: Optional[str],
+    include_total: bool,
+) -> dict:
+    """
+    자격증 목록 DB 조회 (list_certifications 캐시 미스 시)
+    행마다 CertificationResponse를 만들지 않고 PaginatedResponse와 같은 키의 dict로 반환
+    """
     stmt = select(Certification)
 
     if tag:
@@ -41,34 +85,42 @@ async def list_certifications(
         stmt = stmt.where(Certification.sub_tag == sub_tag)
     if level:
         stmt = stmt.where(Certification.level == level.value)
-    if query:
-        q = f"%{query}%"
-        stmt = stmt.where(
-            or_(
-                Certification.name_ko.ilike(q),
-                Certification.name_en.ilike(q),
-                Certification.tag.ilike(q),
-                Certification.sub_tag.ilike(q),
-            )
-        )
-
-    # Total count
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar() or 0
-
-    # Paginate
-    stmt = stmt.offset((page - 1) * size).limit(size)
-    result = await db.execute(stmt)
-    items = result.scalars().all()
-
-    return PaginatedResponse(
-        items=[CertificationResponse.model_validate(item) for item in items],
-        total=total,
-        page=page,
-        size=size,
+    if query and query.strip():
+        stmt = stmt.where(search_condition(query))
+
+    # Total count (필터 조건만 사용, 커서 조건 적용 전)
+    total = None
+    if include_total:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total_result = await db.execute(count_stmt)
+        total = total_result.scalar() or 0
+
+    scope, sort_keys = list_sort_keys(query)
+    sort_exprs = [expr for expr, _ in sort_keys]
+    stmt = stmt.add_columns(*sort_exprs[:-1]).order_by(*order_clauses(sort_keys))
+
+    if cursor:
+        stmt = stmt.where(keyset_condition(sort_keys, decode_cursor(cursor, scope, len(sort_keys))))
+    else:
+        stmt = stmt.offset((page - 1) * size)
+
+    # size+1건 조회 → 다음 페이지 존재 여부 판단
+    result = await db.execute(stmt.limit(size + 1))
+    rows, cursor_next = next_cursor(
+        scope,
+        result.all(),
+        size,
+        lambda row: [*row[1:], row[0].id],
     )
 
+    return {
+        "items": [certification_item(row[0]) for row in rows],
+        "total": total,
+        "page": None if cursor else page,
+        "size": size,
+        "next_cursor": cursor_next,
+    }
+
 
 @router.get("/search", response_model=list[CertificationResponse])
 async def search_certifications(
@@ -77,18 +129,17 @@ async def search_certifications(
 ):
     """
     자격증 검색 (자동완성) - guide.md 4.1 Auto-complete
-    검색창 입력 시 DB 내 자격증 명칭 실시간 추천
+    검색창 입력 시 자격증 명칭 실시간 추천 (관련도순 상위 10건)
+    메모리 인덱스(접두사 + 초성)에서 응답하고, 인덱스 로드 전에만 DB 검색으로 대체
     """
-    pattern = f"%{q}%"
+    results = suggest(q, limit=10)
+    if results is not None:
+        return results
+
     stmt = (
         select(Certification)
-        .where(
-            or_(
-                Certification.name_ko.ilike(pattern),
-                Certification.name_en.ilike(pattern),
-                Certification.tag.ilike(pattern),
-            )
-        )
+        .where(search_condition(q, AUTOCOMPLETE_COLUMNS))
+        .order_by(*order_by_relevance(q))
         .limit(10)
     )
     result = await db.execute(stmt)
@@ -97,14 +148,18 @@ async def search_certifications(
 
 @router.get("/tags", response_model=list[dict])
 async def get_tags(db: AsyncSession = Depends(get_db)):
-    """태그(분야) 목록 및 개수"""
-    stmt = (
-        select(Certification.tag, func.count(Certification.id).label("count"))
-        .group_by(Certification.tag)
-        .order_by(func.count(Certification.id).desc())
-    )
-    result = await db.execute(stmt)
-    return [{"tag": row.tag, "count": row.count} for row in result.all()]
+    """태그(분야) 목록 및 개수 (카탈로그 캐시)"""
+
+    async def _query():
+        stmt = (
+            select(Certification.tag, func.count(Certification.id).label("count"))
+            .group_by(Certification.tag)
+            .order_by(func.count(Certification.id).desc())
+        )
+        result = await db.execute(stmt)
+        return [{"tag": row.tag, "count": row.count} for row in result.all()]
+
+    return await cached_response("certifications.tags", {}, _query)
 
 
 @router.get("/{cert_id}", response_model=CertificationResponse)
@@ -127,6 +182,7 @@ async def create_certification(
     cert = Certification(**data.model_dump())
     db.add(cert)
     await db.flush()
+    await notify_change(db, CATALOG, AUTOCOMPLETE)
     await db.refresh(cert)
     return CertificationResponse.model_validate(cert)
 
@@ -149,6 +205,10 @@ async def update_certification(
         setattr(cert, key, value)
 
     await db.flush()
+    # 이름이 바뀌면 캘린더 이벤트 제목도 같은 트랜잭션에서 갱신
+    if "name_ko" in update_data:
+        await refresh_calendar_events(db, cert_ids=[cert.id])
+    await notify_change(db, CATALOG, AUTOCOMPLETE)
     await db.refresh(cert)
     return CertificationResponse.model_validate(cert)
 
@@ -162,3 +222,4 @@ async def delete_certification(cert_id: UUID, db: AsyncSession = Depends(get_db)
     if not cert:
         raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다.")
     await db.delete(cert)
+    await notify_change(db, CATALOG, AUTOCOMPLETE)
@@ -7,16 +7,19 @@
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, Query, BackgroundTasks, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 
 from database import get_db
 from models import CrawlLog
 from schemas import CrawlLogResponse, CrawlStatusResponse, SeedSyncResponse
+from services.pagination import decode_cursor, keyset_condition, next_cursor, order_clauses
 
 router = APIRouter(prefix="/api/crawl", tags=["crawl"])
 
+LOG_CURSOR_SCOPE = "crawl_logs"
+
 
 @router.get("/status", response_model=CrawlStatusResponse)
 async def get_crawl_status(db: AsyncSession = Depends(get_db)):
@@ -74,18 +77,16 @@ async def get_crawl_status(db: AsyncSession = Depends(get_db)):
                 "found": src_log.found,
                 "inserted": src_log.inserted,
                 "updated": src_log.updated,
+                "unchanged": src_log.unchanged or 0,
             }
         else:
             sources[source_name] = {"last_success": None, "method": None}
 
     # 다음 스케줄 시간
-    from services.scheduler import get_scheduler
-    scheduler = get_scheduler()
-    next_scheduled = None
-    if scheduler and scheduler.running:
-        job = scheduler.get_job("daily_crawl")
-        if job and job.next_run_time:
-            next_scheduled = job.next_run_time.isoformat()
+    # (리더가 아닌 워커에서도 트리거 기준으로 계산)
+    from services.scheduler import get_next_run_time
+    next_run = get_next_run_time()
+    next_scheduled = next_run.isoformat() if next_run else None
 
     return CrawlStatusResponse(
         is_running=running_count > 0,
@@ -98,22 +99,36 @@ async def get_crawl_status(db: AsyncSession = Depends(get_db)):
 
 @router.get("/logs", response_model=list[CrawlLogResponse])
 async def get_crawl_logs(
+    response: Response,
     source: Optional[str] = Query(None, description="소스 필터 (qnet, kdata 등)"),
     status: Optional[str] = Query(None, description="상태 필터 (success, failed, running)"),
     limit: int = Query(20, ge=1, le=100, description="조회 건수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 헤더)"),
     db: AsyncSession = Depends(get_db),
 ):
-    """크롤링 실행 이력 조회"""
-    stmt = select(CrawlLog).order_by(desc(CrawlLog.started_at))
+    """
+    크롤링 실행 이력 조회 (최신순)
+    다음 페이지가 있으면 X-Next-Cursor 응답 헤더로 커서를 전달 (keyset: started_at, id)
+    """
+    sort_keys = [(CrawlLog.started_at, True), (CrawlLog.id, True)]
+    stmt = select(CrawlLog).order_by(*order_clauses(sort_keys))
 
     if source:
         stmt = stmt.where(CrawlLog.source == source)
     if status:
         stmt = stmt.where(CrawlLog.status == status)
-
-    stmt = stmt.limit(limit)
-    result = await db.execute(stmt)
-    logs = result.scalars().all()
+    if cursor:
+        stmt = stmt.where(keyset_condition(sort_keys, decode_cursor(cursor, LOG_CURSOR_SCOPE, len(sort_keys))))
+
+    result = await db.execute(stmt.limit(limit + 1))
+    logs, cursor_next = next_cursor(
+        LOG_CURSOR_SCOPE,
+        list(result.scalars().all()),
+        limit,
+        lambda log: [log.started_at, log.id],
+    )
+    if cursor_next:
+        response.headers["X-Next-Cursor"] = cursor_next
 
     return [CrawlLogResponse.model_validate(log) for log in logs]
 
@@ -0,0 +1,67 @@
+"""
+운영 진단 API 라우터 (X-Debug-Token 필요 — services.debug_access)
+- SQL 문장별 실행 시간 상위 N (워커별)
+- 라우트별 응답 시간 분포 (워커별)
+- 요청/크롤링 프로파일 (speedscope JSON) 목록 / 다운로드
+"""
+
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from services.debug_access import require_debug_access
+from services.profiling import available as profiling_available, list_profiles, profile_file
+from services.query_stats import query_stats
+from services.timing import LATENCY_BUCKETS_MS, latency_histogram
+
+router = APIRouter(
+    prefix="/api/debug",
+    tags=["debug"],
+    dependencies=[Depends(require_debug_access)],
+    include_in_schema=False,
+)
+
+
+@router.get("/queries")
+async def get_query_stats(
+    limit: int = Query(20, ge=1, le=200),
+    order: str = Query("total", pattern="^(total|mean|max|calls)$", description="정렬 기준"),
+):
+    """
+    SQL 문장별 실행 통계 (요청을 처리한 워커 기준)
+    - total: 총 시간순 (가장 많은 DB 시간을 쓰는 문장)
+    - calls: 호출 수순 (N+1 패턴 — 같은 문장이 요청당 여러 번)
+    """
+    return {
+        "pid": os.getpid(),
+        "summary": query_stats.summary(),
+        "statements": query_stats.top(limit, order),
+    }
+
+
+@router.post("/queries/reset", status_code=204)
+async def reset_query_stats():
+    """이 워커의 SQL 통계 초기화"""
+    query_stats.reset()
+
+
+@router.get("/latency")
+async def get_latency_summary():
+    """이 워커의 라우트별 응답 시간 분포 (고정 버킷 히스토그램 기반 p50/p95/p99 추정)"""
+    return {"pid": os.getpid(), "buckets_ms": list(LATENCY_BUCKETS_MS), "routes": latency_histogram.snapshot()}
+
+
+@router.get("/profiles")
+async def get_profiles(limit: int = Query(50, ge=1, le=200)):
+    """저장된 프로파일 목록 (최신순, 모든 워커 공유 디렉터리)"""
+    return {"available": profiling_available(), "profiles": list_profiles(limit)}
+
+
+@router.get("/profiles/{name}")
+async def download_profile(name: str):
+    """프로파일 다운로드 — https://www.speedscope.app 에서 열기"""
+    path = profile_file(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return FileResponse(path, media_type="application/json", filename=name)
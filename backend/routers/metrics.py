@@ -0,0 +1,19 @@
+"""
+Prometheus 메트릭 노출 라우터
+- GET /metrics (nginx로 외부 노출하지 않음 — 내부 네트워크의 Prometheus가 backend:8000을 직접 수집)
+"""
+
+from fastapi import APIRouter, HTTPException, Response
+
+from services.metrics import ENABLED, render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 포맷 메트릭 (multiprocess 모드면 모든 워커 합산)"""
+    if not ENABLED:
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다.")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
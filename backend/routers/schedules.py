@@ -1,17 +1,24 @@
 """
 시험 일정 API 라우터 (guide.md 4.2 인터랙티브 캘린더)
-FullCalendar 연동을 위한 캘린더 이벤트 변환 포함
+FullCalendar 캘린더 이벤트는 calendar_events 구체화 테이블에서 조회
 """
 
+from datetime import date
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, extract
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from database import get_db
-from models import ExamSchedule, Certification
+from models import CalendarEntry, ExamSchedule
 from schemas import ExamScheduleResponse, ExamScheduleCreate, CalendarEvent
+from services.calendar_events import overlaps, refresh_calendar_events, select_events, to_event_dict
+from services.catalog_cache import cached_response
+from services.serialization import calendar_event_item
+from services.date_range import MAX_YEAR, MIN_YEAR, DateRange, in_range, resolve_range
+from services.invalidation import CATALOG, notify_change
 
 router = APIRouter(prefix="/api/schedules", tags=["schedules"])
 
@@ -19,16 +26,20 @@ router = APIRouter(prefix="/api/schedules", tags=["schedules"])
 @router.get("", response_model=list[ExamScheduleResponse])
 async def list_schedules(
     cert_id: Optional[UUID] = Query(None, description="자격증 ID 필터"),
-    year: Optional[int] = Query(None, description="연도 필터"),
+    year: Optional[int] = Query(None, ge=MIN_YEAR, le=MAX_YEAR, description="연도 필터"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="월 필터 (year와 함께)"),
+    start: Optional[date] = Query(None, description="시험일 시작 (포함, YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="시험일 끝 (미포함, YYYY-MM-DD)"),
     db: AsyncSession = Depends(get_db),
 ):
-    """시험 일정 목록"""
+    """시험 일정 목록 (시험일 기준 [start, end) 범위 필터 — 인덱스 범위 스캔)"""
     stmt = select(ExamSchedule)
 
     if cert_id:
         stmt = stmt.where(ExamSchedule.cert_id == cert_id)
-    if year:
-        stmt = stmt.where(extract("year", ExamSchedule.exam_date) == year)
+    date_range = resolve_range(year, month, start, end)
+    if date_range:
+        stmt = stmt.where(in_range(ExamSchedule.exam_date, date_range))
 
     stmt = stmt.order_by(ExamSchedule.exam_date.asc())
     result = await db.execute(stmt)
@@ -37,8 +48,10 @@ async def list_schedules(
 
 @router.get("/calendar", response_model=list[CalendarEvent])
 async def get_calendar_events(
-    year: int = Query(..., description="연도"),
-    month: Optional[int] = Query(None, description="월 (1-12)"),
+    year: Optional[int] = Query(None, ge=MIN_YEAR, le=MAX_YEAR, description="연도 (시험일 기준 조회)"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="월 (1-12)"),
+    start: Optional[date] = Query(None, description="보이는 범위 시작 (포함, YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="보이는 범위 끝 (미포함, YYYY-MM-DD)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -46,61 +59,44 @@ async def get_calendar_events(
     - 접수 기간: 연한 파란색 (#93c5fd)
     - 시험일: 진한 빨간색 (#ef4444)
     - 발표일: 녹색 (#22c55e)
+
+    조회 방식:
+    - start/end (범위 모드): FullCalendar의 보이는 범위 [start, end)와 겹치는
+      접수 기간 / 시험일 / 발표일 이벤트를 한 번의 인덱스 쿼리로 모두 반환
+    - year/month: 시험일이 해당 기간인 일정의 이벤트 3종 반환 (기존 방식)
+    응답은 카탈로그 버전별로 메모리 캐시 (쓰기/크롤링 시 무효화)
     """
-    stmt = (
-        select(ExamSchedule, Certification.name_ko)
-        .join(Certification, ExamSchedule.cert_id == Certification.id)
-        .where(extract("year", ExamSchedule.exam_date) == year)
+    date_range = resolve_range(year, month, start, end)
+    if date_range is None:
+        raise HTTPException(status_code=400, detail="year 또는 start/end 중 하나는 지정해야 합니다.")
+
+    window = start is not None or end is not None
+    if window and not (start and end):
+        raise HTTPException(status_code=400, detail="범위 모드는 start와 end를 모두 지정해야 합니다.")
+
+    return await cached_response(
+        "schedules.calendar",
+        {"start": date_range[0], "end": date_range[1], "window": window},
+        lambda: _query_calendar_events(db, date_range, window),
     )
 
-    if month:
-        stmt = stmt.where(extract("month", ExamSchedule.exam_date) == month)
+
+async def _query_calendar_events(db: AsyncSession, date_range: DateRange, window: bool) -> list[dict]:
+    """
+    캘린더 이벤트 조회 (get_calendar_events 캐시 미스 시)
+    calendar_events 구체화 테이블에서 인덱스 범위 스캔 1회로 조회
+      - 범위 모드: daterange(start_date, last_date) && [start, end)   (ix_calendar_span)
+      - 연/월 모드: 원본 일정의 exam_date ∈ [start, end)              (ix_calendar_exam_date)
+    CalendarEvent 모델을 거치지 않고 같은 키의 dict로 반환 (직렬화 고속 경로)
+    """
+    stmt = select_events()
+    if window:
+        stmt = stmt.where(overlaps(*date_range))
+    else:
+        stmt = stmt.where(in_range(CalendarEntry.exam_date, date_range))
 
     result = await db.execute(stmt)
-    events: list[CalendarEvent] = []
-
-    for schedule, cert_name in result.all():
-        cert_id_str = str(schedule.cert_id)
-
-        # 접수 기간 이벤트
-        if schedule.reg_start and schedule.reg_end:
-            events.append(
-                CalendarEvent(
-                    title=f"{cert_name} 접수",
-                    start=schedule.reg_start.isoformat(),
-                    end=schedule.reg_end.isoformat(),
-                    color="#93c5fd",
-                    textColor="#1e40af",
-                    type="registration",
-                    cert_id=cert_id_str,
-                )
-            )
-
-        # 시험일 이벤트
-        if schedule.exam_date:
-            events.append(
-                CalendarEvent(
-                    title=f"{cert_name} 시험",
-                    start=schedule.exam_date.isoformat(),
-                    color="#ef4444",
-                    type="exam",
-                    cert_id=cert_id_str,
-                )
-            )
-
-        # 발표일 이벤트
-        if schedule.result_date:
-            events.append(
-                CalendarEvent(
-                    title=f"{cert_name} 발표",
-                    start=schedule.result_date.isoformat(),
-                    color="#22c55e",
-                    type="result",
-                    cert_id=cert_id_str,
-                )
-            )
-
-    return events
+    return [calendar_event_item(to_event_dict(entry)) for entry in result.scalars().all()]
 
 
 @router.post("", response_model=ExamScheduleResponse, status_code=201)
@@ -111,6 +107,16 @@ async def create_schedule(
     """시험 일정 등록"""
     schedule = ExamSchedule(**data.model_dump())
     db.add(schedule)
-    await db.flush()
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # 캘린더 갱신 / NOTIFY 전에 실패 → 롤백 후 4xx (get_db는 HTTPException도 롤백 경로로 처리)
+        await db.rollback()
+        if "uq_schedule_cert_round" in str(e.orig):
+            raise HTTPException(status_code=409, detail="같은 자격증의 같은 회차 일정이 이미 있습니다.")
+        raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다.")
+    # 같은 트랜잭션에서 캘린더 구체화 테이블도 갱신
+    await refresh_calendar_events(db, schedule_ids=[schedule.id])
+    await notify_change(db, CATALOG)
     await db.refresh(schedule)
     return ExamScheduleResponse.model_validate(schedule)
@@ -5,7 +5,7 @@ Pydantic 스키마 (API 요청/응답 직렬화)
 from datetime import date, datetime
 from typing import Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from uuid import UUID
 
 
@@ -63,7 +63,12 @@ class ExamScheduleBase(BaseModel):
 
 
 class ExamScheduleCreate(ExamScheduleBase):
-    pass
+    @model_validator(mode="after")
+    def check_reg_period(self):
+        # 접수 마감이 시작보다 앞서면 캘린더 접수 기간(daterange)을 만들 수 없음 → 422
+        if self.reg_start and self.reg_end and self.reg_end < self.reg_start:
+            raise ValueError("접수 마감일(reg_end)은 접수 시작일(reg_start) 이후여야 합니다")
+        return self
 
 
 class ExamScheduleResponse(ExamScheduleBase):
@@ -91,9 +96,10 @@ class CalendarEvent(BaseModel):
 
 class PaginatedResponse(BaseModel):
     items: List[CertificationResponse]
-    total: int
-    page: int
+    total: Optional[int] = None          # include_total=false면 생략 (count 쿼리 생략)
+    page: Optional[int] = None           # cursor 방식이면 None
     size: int
+    next_cursor: Optional[str] = None    # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 # ===== Stats =====
@@ -115,6 +121,7 @@ class CrawlLogResponse(BaseModel):
     inserted: int = 0
     updated: int = 0
     skipped: int = 0
+    unchanged: int = 0
     duration_sec: Optional[float] = None
     error_message: Optional[str] = None
     started_at: Optional[datetime] = None
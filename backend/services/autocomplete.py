@@ -0,0 +1,202 @@
+"""
+자격증 자동완성 메모리 인덱스 (guide.md 4.1 Auto-complete)
+
+GET /api/certifications/search는 키 입력마다 호출되므로 DB를 거치지 않고
+워커 메모리의 인덱스에서 바로 응답합니다.
+
+  - 접두사 인덱스: 정규화(fold)한 name_ko / name_en / 괄호 별칭 / 단어 토큰을
+                  정렬 배열에 두고 bisect로 접두사 범위 탐색
+  - 초성 인덱스:   "ㅈㅂㅊㄹ" → 정보처리기사 (한글 음절을 초성으로 변환한 키)
+  - 부분일치:      위에서 10건이 안 차면 이름/분류 부분일치로 보충 (기존 ILIKE 의미)
+
+인덱스는 서버 시작 시, 자격증 쓰기 커밋 후, 크롤링 완료 후 다시 만들어 통째로 교체합니다.
+인덱스가 아직 없으면 호출자는 DB 검색(services.search)으로 대체합니다.
+"""
+
+import asyncio
+import bisect
+import heapq
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+from crawlers.cert_resolver import aliases_of, fold, tokenize
+from models import Certification
+from schemas import CertificationResponse
+
+logger = logging.getLogger("services.autocomplete")
+
+# ============================================================
+# 한글 초성
+# ============================================================
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+_JAMO_FIRST, _JAMO_LAST = 0x3131, 0x314E  # 호환용 자음 ㄱ ~ ㅎ
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로) — 길이 보존"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(CHOSUNG[(code - _HANGUL_BASE) // 588])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def is_jamo(ch: str) -> bool:
+    return _JAMO_FIRST <= ord(ch) <= _JAMO_LAST
+
+
+# 매칭 종류별 순위 (작을수록 상위)
+EXACT, NAME_PREFIX, TOKEN_PREFIX, CHOSUNG_MATCH, SUBSTRING, TAG_MATCH = range(6)
+
+
+class AutocompleteIndex:
+    """불변 자동완성 인덱스 (교체 방식 갱신이므로 조회 시 락 불필요)"""
+
+    def __init__(self, certs: Sequence[CertificationResponse]):
+        self.certs: List[CertificationResponse] = list(certs)
+        self._order: List[Tuple[int, str]] = [(len(c.name_ko), c.name_ko) for c in self.certs]
+
+        # 접두사 인덱스: (키, 매칭 종류, cert 인덱스)를 키 순으로 정렬
+        entries: Dict[Tuple[str, int], int] = {}
+        # 부분일치/초성용: cert별 (정규화 이름, 초성 이름) 목록
+        self._names: List[List[Tuple[str, str]]] = []
+        self._tags: List[str] = []
+
+        for idx, cert in enumerate(self.certs):
+            names = []
+            for name in (cert.name_ko, cert.name_en):
+                key = fold(name)
+                if not key:
+                    continue
+                names.append((key, to_chosung(key)))
+                self._add(entries, key, NAME_PREFIX, idx)
+                for alias in aliases_of(name):
+                    self._add(entries, fold(alias), TOKEN_PREFIX, idx)
+                for token in tokenize(name):
+                    self._add(entries, token, TOKEN_PREFIX, idx)
+            self._names.append(names)
+            self._tags.append(fold(f"{cert.tag} {cert.sub_tag or ''}"))
+
+        self._prefix: List[Tuple[str, int, int]] = sorted((k, kind, idx) for (k, idx), kind in entries.items())
+        self._prefix_keys: List[str] = [k for k, _, _ in self._prefix]
+
+        # 초성 접두사 인덱스 (한글 이름만)
+        cho = {(c, idx) for idx, names in enumerate(self._names) for k, c in names if c != k}
+        self._chosung: List[Tuple[str, int]] = sorted(cho)
+        self._chosung_keys: List[str] = [c for c, _ in self._chosung]
+
+    @staticmethod
+    def _add(entries: Dict[Tuple[str, int], int], key: str, kind: int, idx: int):
+        if key and kind < entries.get((key, idx), SUBSTRING):
+            entries[(key, idx)] = kind
+
+    def __len__(self) -> int:
+        return len(self.certs)
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def suggest(self, query: str, limit: int = 10) -> List[CertificationResponse]:
+        """검색어 → 순위순 상위 limit건"""
+        q = fold(query)
+        if not q:
+            return []
+
+        best: Dict[int, int] = {}
+
+        def hit(idx: int, kind: int):
+            if kind < best.get(idx, TAG_MATCH + 1):
+                best[idx] = kind
+
+        # 1. 이름/별칭/토큰 접두사
+        i = bisect.bisect_left(self._prefix_keys, q)
+        while i < len(self._prefix_keys) and self._prefix_keys[i].startswith(q):
+            key, kind, idx = self._prefix[i]
+            hit(idx, EXACT if key == q and kind == NAME_PREFIX else kind)
+            i += 1
+
+        # 2. 초성 (검색어에 자음만 있는 글자가 포함된 경우)
+        if any(is_jamo(ch) for ch in q):
+            if all(is_jamo(ch) or not ("가" <= ch <= "힣") for ch in q):
+                i = bisect.bisect_left(self._chosung_keys, q)
+                while i < len(self._chosung_keys) and self._chosung_keys[i].startswith(q):
+                    hit(self._chosung[i][1], CHOSUNG_MATCH)
+                    i += 1
+            # "정보ㅊㄹ"처럼 음절/초성이 섞였거나 중간부터 일치하는 경우
+            if len(best) < limit:
+                for idx, names in enumerate(self._names):
+                    if idx not in best and any(self._jamo_contains(k, c, q) for k, c in names):
+                        hit(idx, SUBSTRING)
+
+        # 3. 부분일치 보충 (기존 ILIKE '%q%')
+        if len(best) < limit:
+            for idx, names in enumerate(self._names):
+                if idx in best:
+                    continue
+                if any(q in k for k, _ in names):
+                    hit(idx, SUBSTRING)
+                elif q in self._tags[idx]:
+                    hit(idx, TAG_MATCH)
+
+        top = heapq.nsmallest(limit, best.items(), key=lambda item: (item[1], self._order[item[0]]))
+        return [self.certs[idx] for idx, _ in top]
+
+    @staticmethod
+    def _jamo_contains(key: str, cho: str, q: str) -> bool:
+        """q의 자음 글자는 초성과, 나머지는 원문과 비교하는 부분일치"""
+        for start in range(len(key) - len(q) + 1):
+            for offset, ch in enumerate(q):
+                pos = start + offset
+                if ch != key[pos] and not (is_jamo(ch) and ch == cho[pos]):
+                    break
+            else:
+                return True
+        return False
+
+
+# ============================================================
+# 워커 전역 인덱스 (통째로 교체)
+# ============================================================
+
+_index: Optional[AutocompleteIndex] = None
+_refresh_lock: Optional[asyncio.Lock] = None
+
+
+def get_autocomplete_index() -> Optional[AutocompleteIndex]:
+    """현재 인덱스 (아직 로드 전이면 None)"""
+    return _index
+
+
+def suggest(query: str, limit: int = 10) -> Optional[List[CertificationResponse]]:
+    """자동완성 결과 (인덱스가 없으면 None → 호출자가 DB 검색으로 대체)"""
+    from services.metrics import record_cache
+
+    index = _index
+    record_cache("autocomplete", index is not None)
+    if index is None:
+        return None
+    return index.suggest(query, limit)
+
+
+async def refresh_autocomplete_index():
+    """certifications 전체를 읽어 인덱스 재생성 후 교체"""
+    global _index, _refresh_lock
+    from database import async_session
+
+    if _refresh_lock is None:
+        _refresh_lock = asyncio.Lock()
+
+    async with _refresh_lock:
+        async with async_session() as session:
+            result = await session.execute(select(Certification))
+            certs = [CertificationResponse.model_validate(c) for c in result.scalars().all()]
+        _index = AutocompleteIndex(certs)
+        logger.info(f"🔤 자동완성 인덱스 갱신: {len(_index)}건")
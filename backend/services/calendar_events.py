@@ -0,0 +1,162 @@
+"""
+캘린더 이벤트 구체화 (calendar_events 테이블) 갱신 / 조회
+
+exam_schedules 1행을 접수/시험/발표 이벤트 최대 3행으로 펼쳐 calendar_events에 저장합니다.
+/api/schedules/calendar와 seed-events.ts 동기화(seed_sync)가 모두 이 테이블을 읽으므로
+요청마다 Python에서 이벤트를 펼치지 않고, 두 경로의 제목/날짜 형식도 항상 같습니다.
+
+증분 갱신 대상:
+  - 아직 이벤트가 없는 일정 (날짜가 하나라도 있는 경우)
+  - 마지막 갱신 이후 일정(exam_schedules.updated_at) 또는 자격증 이름(certifications.updated_at)이 바뀐 일정
+  - 일정 삭제는 FK ON DELETE CASCADE로 자동 반영
+
+갱신 SQL은 비동기(API/스케줄러)와 동기(크롤러 CLI/seed_sync) 세션에서 공용으로 사용합니다.
+"""
+
+import logging
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models import CalendarEntry
+
+logger = logging.getLogger("services.calendar_events")
+
+# 갱신이 필요한 일정 id
+STALE_SCHEDULES_SQL = text("""
+    SELECT es.id
+    FROM exam_schedules es
+    JOIN certifications c ON c.id = es.cert_id
+    LEFT JOIN (
+        SELECT schedule_id, MIN(refreshed_at) AS refreshed_at
+        FROM calendar_events
+        GROUP BY schedule_id
+    ) ce ON ce.schedule_id = es.id
+    WHERE (
+            ce.schedule_id IS NULL
+            AND (es.reg_start IS NOT NULL OR es.exam_date IS NOT NULL OR es.result_date IS NOT NULL)
+          )
+       OR es.updated_at > ce.refreshed_at
+       OR c.updated_at > ce.refreshed_at
+""")
+
+SCHEDULES_OF_CERTS_SQL = text("""
+    SELECT id FROM exam_schedules WHERE cert_id = ANY(CAST(:cert_ids AS uuid[]))
+""")
+
+DELETE_EVENTS_SQL = text("""
+    DELETE FROM calendar_events WHERE schedule_id = ANY(CAST(:ids AS integer[]))
+""")
+
+# 일정 1행 → 접수/시험/발표 (날짜가 없는 유형은 제외)
+INSERT_EVENTS_SQL = text("""
+    INSERT INTO calendar_events (
+        schedule_id, cert_id, cert_name, round, type, sort_order, title,
+        start_date, end_date, last_date, exam_date, color, text_color, refreshed_at
+    )
+    SELECT
+        es.id, es.cert_id, c.name_ko, es.round, v.type, v.sort_order,
+        c.name_ko
+            || CASE WHEN es.round IS NOT NULL AND es.round <> 0 THEN ' ' || es.round || '회' ELSE '' END
+            || ' ' || v.label,
+        v.start_date, v.end_date, COALESCE(v.end_date, v.start_date), es.exam_date,
+        v.color, v.text_color, NOW()
+    FROM exam_schedules es
+    JOIN certifications c ON c.id = es.cert_id
+    CROSS JOIN LATERAL (VALUES
+        ('registration', 0, '접수', CAST(es.reg_start AS date), CAST(es.reg_end AS date), '#93c5fd', '#1e40af'),
+        ('exam',         1, '시험', es.exam_date,               CAST(NULL AS date),       '#ef4444', NULL),
+        ('result',       2, '발표', es.result_date,             CAST(NULL AS date),       '#22c55e', NULL)
+    ) AS v(type, sort_order, label, start_date, end_date, color, text_color)
+    WHERE es.id = ANY(CAST(:ids AS integer[]))
+      AND v.start_date IS NOT NULL
+      AND (v.type <> 'registration' OR v.end_date IS NOT NULL)
+      -- 마감이 시작보다 앞선 접수 기간은 제외 (daterange 하한 > 상한이면 ix_calendar_span 식 평가 오류)
+      AND (v.end_date IS NULL OR v.end_date >= v.start_date)
+""")
+
+# 정렬: 자격증 이름 → 회차 → 시험일 → 유형 (seed-events.ts 기존 순서와 동일)
+ORDER_COLUMNS = (
+    CalendarEntry.cert_name,
+    CalendarEntry.round,
+    CalendarEntry.exam_date,
+    CalendarEntry.sort_order,
+)
+
+
+# ============================================================
+# 갱신
+# ============================================================
+
+def _target_ids(rows) -> List[int]:
+    return sorted({row[0] for row in rows})
+
+
+async def refresh_calendar_events(
+    db: AsyncSession,
+    schedule_ids: Optional[Sequence[int]] = None,
+    cert_ids: Optional[Sequence[UUID]] = None,
+) -> int:
+    """
+    calendar_events 증분 갱신 (호출자의 트랜잭션 안에서 실행 — AsyncSession / AsyncConnection)
+    schedule_ids / cert_ids를 주면 해당 일정만, 없으면 변경된 일정 전체
+
+    Returns:
+        갱신한 일정 수
+    """
+    if schedule_ids is not None:
+        ids = sorted(set(schedule_ids))
+    elif cert_ids is not None:
+        result = await db.execute(SCHEDULES_OF_CERTS_SQL, {"cert_ids": [str(c) for c in cert_ids]})
+        ids = _target_ids(result.all())
+    else:
+        ids = _target_ids((await db.execute(STALE_SCHEDULES_SQL)).all())
+
+    if ids:
+        await db.execute(DELETE_EVENTS_SQL, {"ids": ids})
+        await db.execute(INSERT_EVENTS_SQL, {"ids": ids})
+    return len(ids)
+
+
+def refresh_calendar_events_sync(session: Session) -> int:
+    """calendar_events 증분 갱신 (동기 세션용 — 크롤러 CLI / seed_sync)"""
+    ids = _target_ids(session.execute(STALE_SCHEDULES_SQL).all())
+    if ids:
+        session.execute(DELETE_EVENTS_SQL, {"ids": ids})
+        session.execute(INSERT_EVENTS_SQL, {"ids": ids})
+    return len(ids)
+
+
+# ============================================================
+# 조회
+# ============================================================
+
+def overlaps(start: date, end: date):
+    """[start, end)와 겹치는 이벤트 조건 (ix_calendar_span GiST 인덱스 사용)"""
+    span = func.daterange(CalendarEntry.start_date, CalendarEntry.last_date, literal_column("'[]'"))
+    return span.op("&&")(func.daterange(start, end, literal_column("'[)'")))
+
+
+def select_events():
+    """정렬된 calendar_events 조회문 (필터는 호출자가 추가)"""
+    return select(CalendarEntry).order_by(*ORDER_COLUMNS)
+
+
+def to_event_dict(entry: CalendarEntry) -> Dict:
+    """CalendarEntry → FullCalendar 이벤트 dict (API / seed-events.ts 공용)"""
+    event = {
+        "title": entry.title,
+        "start": entry.start_date.isoformat(),
+        "color": entry.color,
+        "type": entry.type,
+        "cert_id": str(entry.cert_id),
+    }
+    if entry.end_date:
+        event["end"] = entry.end_date.isoformat()
+    if entry.text_color:
+        event["textColor"] = entry.text_color
+    return event
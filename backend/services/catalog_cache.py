@@ -0,0 +1,136 @@
+"""
+카탈로그 응답 캐시 (버전 카운터 + LRU)
+
+자격증/일정 카탈로그는 크롤링과 관리자 쓰기에서만 바뀌므로, 읽기 API 응답을
+직렬화된 JSON 바이트 그대로 워커 메모리에 보관합니다.
+
+  - 캐시 키: (엔드포인트, 정규화된 파라미터, 카탈로그 버전)
+  - 무효화: 쓰기 커밋 / 크롤링 완료 시 버전 +1 → 이전 버전 키는 더 이상 조회되지 않음
+            (다른 워커에는 services.invalidation의 LISTEN/NOTIFY로 전파)
+  - 크기 제한: OrderedDict 기반 LRU (CATALOG_CACHE_MAX_ENTRIES)
+
+버전이 바뀌는 동안 계산된 응답은 저장하지 않으므로 무효화 직후 옛 데이터가 다시 들어가지 않습니다.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi.responses import Response
+
+from config import get_settings
+from services.metrics import record_cache
+from services.serialization import dumps
+from services.timing import track_serialize
+
+logger = logging.getLogger("services.catalog_cache")
+settings = get_settings()
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Hashable], ...], int]
+
+
+def normalize_params(params: Dict[str, Any]) -> Tuple[Tuple[str, Hashable], ...]:
+    """None 제거 + Enum/UUID 등은 문자열로 + 키 정렬 → 같은 요청은 같은 키"""
+    normalized = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+        elif not isinstance(value, (str, int, float, bool)):
+            value = str(value)
+        normalized.append((key, value))
+    return tuple(sorted(normalized))
+
+
+class CatalogCache:
+    """버전 기반 LRU 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, endpoint: str, params: Dict[str, Any], version: Optional[int] = None) -> CacheKey:
+        return (endpoint, normalize_params(params), self.version if version is None else version)
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        record_cache("catalog", body is not None)
+        return body
+
+    def put(self, key: CacheKey, body: bytes):
+        """계산 도중 버전이 바뀌었으면 저장하지 않음"""
+        with self._lock:
+            if key[2] != self.version:
+                return
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def bump(self, reason: str = "") -> int:
+        """카탈로그 버전 증가 + 전체 비우기 (이전 버전 키는 다시 조회되지 않으므로)"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            version = self.version
+        logger.info(f"🧹 카탈로그 캐시 무효화 → v{version}" + (f" ({reason})" if reason else ""))
+        return version
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+catalog_cache = CatalogCache(max_entries=settings.CATALOG_CACHE_MAX_ENTRIES)
+
+
+def render_json(content: Any) -> bytes:
+    """
+    응답 본문 직렬화 (services.serialization — orjson 고속 경로)
+    content는 스키마와 같은 키의 dict/list (Pydantic 모델도 허용)
+    소요 시간은 Server-Timing의 serialize 구간으로 집계
+    """
+    with track_serialize():
+        return dumps(content)
+
+
+async def cached_response(
+    endpoint: str,
+    params: Dict[str, Any],
+    compute: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    캐시된 JSON 응답 반환 (없으면 compute() 실행 후 저장)
+    X-Cache 헤더로 HIT/MISS 표시
+    """
+    if not settings.CATALOG_CACHE_ENABLED:
+        return Response(render_json(await compute()), media_type="application/json")
+
+    key = catalog_cache.key(endpoint, params)
+    body = catalog_cache.get(key)
+    if body is not None:
+        return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    body = render_json(await compute())
+    catalog_cache.put(key, body)
+    return Response(body, media_type="application/json", headers={"X-Cache": "MISS"})
+
@@ -0,0 +1,73 @@
+"""
+날짜 범위 필터 유틸리티 (일정/캘린더 API 공용)
+
+extract("year", exam_date) == year 같은 조건은 컬럼에 함수를 씌우므로 인덱스를 쓰지 못합니다.
+year / month / start / end 파라미터를 반열린 구간 [start, end)로 바꿔
+exam_date >= start AND exam_date < end 형태(인덱스 범위 스캔 가능)로 비교합니다.
+"""
+
+from datetime import date
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, true
+from sqlalchemy.sql.elements import ColumnElement
+
+DateRange = Tuple[Optional[date], Optional[date]]
+
+# year 쿼리 파라미터 허용 범위 — 다음 해 1월 1일(date(year + 1, 1, 1))을 만들 수 있는 연도까지
+MIN_YEAR = 1
+MAX_YEAR = date.max.year - 1
+
+
+def month_range(year: int, month: int) -> Tuple[date, date]:
+    """해당 월의 [1일, 다음 달 1일)"""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def year_range(year: int) -> Tuple[date, date]:
+    """해당 연도의 [1월 1일, 다음 해 1월 1일)"""
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def resolve_range(
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Optional[DateRange]:
+    """
+    쿼리 파라미터 → 반열린 구간 [start, end)
+    - start/end: 그대로 사용 (한쪽만 있으면 열린 구간)
+    - year (+ month): 해당 연도/월 전체
+    - 아무것도 없으면 None (필터 없음)
+    """
+    if (start or end) and (year or month):
+        raise HTTPException(status_code=400, detail="year/month와 start/end는 함께 사용할 수 없습니다.")
+    if month and not year:
+        raise HTTPException(status_code=400, detail="month는 year와 함께 지정해야 합니다.")
+    if start and end and start >= end:
+        raise HTTPException(status_code=400, detail="start는 end보다 이전 날짜여야 합니다.")
+
+    if start or end:
+        return start, end
+    if year and month:
+        return month_range(year, month)
+    if year:
+        return year_range(year)
+    return None
+
+
+def in_range(column, date_range: Optional[DateRange]) -> ColumnElement:
+    """column ∈ [start, end) 조건 (인덱스 범위 스캔 가능)"""
+    if not date_range:
+        return true()
+    start, end = date_range
+    conditions = []
+    if start:
+        conditions.append(column >= start)
+    if end:
+        conditions.append(column < end)
+    return and_(*conditions) if conditions else true()
@@ -0,0 +1,30 @@
+"""
+운영 진단 기능(/api/debug/*) 접근 확인
+
+DEBUG_API_TOKEN이 설정되어 있으면 X-Debug-Token 헤더가 일치해야 하고,
+비어 있으면 DEBUG=true(개발 환경)일 때만 허용합니다.
+"""
+
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from config import get_settings
+
+settings = get_settings()
+
+DEBUG_TOKEN_HEADER = "X-Debug-Token"
+
+
+def debug_token_ok(token: Optional[str]) -> bool:
+    """토큰 확인 (상수 시간 비교)"""
+    if settings.DEBUG_API_TOKEN:
+        return bool(token) and hmac.compare_digest(token, settings.DEBUG_API_TOKEN)
+    return settings.DEBUG
+
+
+async def require_debug_access(x_debug_token: Optional[str] = Header(None)):
+    """FastAPI 의존성 — 권한이 없으면 404 (진단 엔드포인트 존재 자체를 숨김)"""
+    if not debug_token_ok(x_debug_token):
+        raise HTTPException(status_code=404, detail="Not Found")
@@ -0,0 +1,233 @@
+"""
+워커 간 캐시 무효화 버스 (Postgres LISTEN/NOTIFY)
+
+uvicorn --workers N 환경에서 한 워커가 쓰기/크롤링을 처리하면 나머지 워커의
+메모리 캐시(카탈로그 응답 캐시, 자동완성 인덱스)가 낡은 상태로 남습니다.
+
+  - 발행: 쓰기 트랜잭션 안에서 pg_notify() 실행 → 커밋될 때만 전달, 롤백되면 전달 안 됨
+  - 구독: 워커마다 asyncpg 커넥션 1개로 LISTEN → 수신 즉시 해당 캐시 무효화
+  - 자기 자신이 보낸 메시지는 무시 (발행 워커는 after_commit 콜백으로 이미 처리)
+  - 구독 커넥션이 끊기면 재연결하고, 끊긴 동안 놓친 메시지가 있을 수 있으므로 전체 무효화
+
+무효화 범위(scope):
+  - "catalog":      카탈로그 응답 캐시 버전 증가
+  - "autocomplete": 자동완성 인덱스 재생성
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from config import get_settings
+from database import after_commit
+
+logger = logging.getLogger("services.invalidation")
+settings = get_settings()
+
+CATALOG = "catalog"
+AUTOCOMPLETE = "autocomplete"
+ALL_SCOPES = (CATALOG, AUTOCOMPLETE)
+
+# 워커(프로세스) 식별자 — 컨테이너가 여러 개면 pid가 겹칠 수 있어 UUID 사용
+INSTANCE_ID = uuid.uuid4().hex
+
+_listener_task: Optional[asyncio.Task] = None
+_listen_conn: Optional[AsyncConnection] = None
+
+
+# ============================================================
+# 로컬 적용
+# ============================================================
+
+async def apply_invalidation(scopes: Iterable[str], reason: str = ""):
+    """이 워커의 캐시 무효화"""
+    scopes = set(scopes)
+    if CATALOG in scopes:
+        from services.catalog_cache import catalog_cache
+        catalog_cache.bump(reason)
+    if AUTOCOMPLETE in scopes:
+        from services.autocomplete import refresh_autocomplete_index
+        try:
+            await refresh_autocomplete_index()
+        except Exception as e:
+            logger.warning(f"⚠️ 자동완성 인덱스 갱신 실패: {e}")
+
+
+# ============================================================
+# 발행
+# ============================================================
+
+def _payload(scopes: Iterable[str], reason: str) -> str:
+    return json.dumps({"origin": INSTANCE_ID, "scopes": sorted(set(scopes)), "reason": reason})
+
+
+async def notify_change(db: AsyncSession, *scopes: str, reason: str = "write"):
+    """
+    쓰기 요청용 — 현재 트랜잭션에 NOTIFY를 싣고, 커밋 후 이 워커의 캐시도 무효화
+    (get_db가 커밋에 성공한 경우에만 다른 워커에 전달되고 로컬 콜백도 실행됨)
+    """
+    scopes = scopes or ALL_SCOPES
+    if settings.INVALIDATION_ENABLED:
+        await db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.INVALIDATION_CHANNEL, "payload": _payload(scopes, reason)},
+        )
+
+    async def _apply_local():
+        await apply_invalidation(scopes, reason)
+
+    # 같은 요청에서 여러 번 호출돼도 콜백은 범위별로 한 번만 등록
+    callbacks = db.info.setdefault("invalidation_scopes", set())
+    if not callbacks.issuperset(scopes):
+        callbacks.update(scopes)
+        after_commit(db, _apply_local)
+
+
+async def broadcast_change(*scopes: str, reason: str = ""):
+    """
+    트랜잭션 밖(크롤링 완료 등)용 — 이 워커 캐시 무효화 + 다른 워커에 NOTIFY
+    """
+    from database import engine
+
+    scopes = scopes or ALL_SCOPES
+    await apply_invalidation(scopes, reason)
+
+    if not settings.INVALIDATION_ENABLED:
+        return
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": settings.INVALIDATION_CHANNEL, "payload": _payload(scopes, reason)},
+            )
+    except Exception as e:
+        logger.warning(f"⚠️ 캐시 무효화 알림 발행 실패: {e}")
+
+
+def broadcast_change_sync(*scopes: str, reason: str = ""):
+    """
+    동기 프로세스(크롤러 CLI / GitHub Actions cron)용 — API 워커들에 NOTIFY만 발행
+    (이 프로세스에는 무효화할 메모리 캐시가 없음)
+    """
+    from crawlers.base import get_sync_engine
+
+    if not settings.INVALIDATION_ENABLED:
+        return
+    scopes = scopes or ALL_SCOPES
+    try:
+        with get_sync_engine().begin() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": settings.INVALIDATION_CHANNEL, "payload": _payload(scopes, reason)},
+            )
+    except Exception as e:
+        logger.warning(f"⚠️ 캐시 무효화 알림 발행 실패: {e}")
+
+
+# ============================================================
+# 구독
+# ============================================================
+
+def _on_notification(connection, pid, channel, payload):
+    """asyncpg 리스너 콜백 (동기) → 무효화 작업은 이벤트 루프에 예약"""
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        logger.warning(f"⚠️ 잘못된 무효화 메시지 무시: {payload[:100]}")
+        return
+    if message.get("origin") == INSTANCE_ID:
+        return
+    scopes = [s for s in message.get("scopes", []) if s in ALL_SCOPES]
+    if scopes:
+        reason = f"remote:{message.get('reason', '')}"
+        asyncio.get_running_loop().create_task(apply_invalidation(scopes, reason))
+
+
+async def _listen() -> AsyncConnection:
+    """앱 엔진에서 커넥션 1개를 꺼내 LISTEN 등록 (asyncpg 드라이버 커넥션 직접 사용)"""
+    from database import engine
+
+    conn = await engine.connect()
+    try:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.add_listener(settings.INVALIDATION_CHANNEL, _on_notification)
+    except Exception:
+        await conn.close()
+        raise
+    return conn
+
+
+async def _close_listen_conn():
+    global _listen_conn
+    conn, _listen_conn = _listen_conn, None
+    if conn is None:
+        return
+    try:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.remove_listener(settings.INVALIDATION_CHANNEL, _on_notification)
+    except Exception:
+        pass
+    try:
+        # LISTEN 상태가 남은 커넥션은 풀에 돌려주지 않고 폐기
+        await conn.invalidate()
+        await conn.close()
+    except Exception:
+        pass
+
+
+async def _listener_loop():
+    """
+    구독 루프 (워커마다 1개)
+    주기적으로 커넥션을 점검하고, 끊겼으면 재연결 + 놓친 메시지 대비 전체 무효화
+    """
+    global _listen_conn
+    interval = max(settings.INVALIDATION_HEALTHCHECK_SEC, 1)
+    reconnecting = False
+
+    while True:
+        try:
+            if _listen_conn is None:
+                _listen_conn = await _listen()
+                logger.info(f"📡 캐시 무효화 채널 구독: {settings.INVALIDATION_CHANNEL}")
+                if reconnecting:
+                    await apply_invalidation(ALL_SCOPES, "listener reconnected")
+                reconnecting = False
+            else:
+                await _listen_conn.execute(text("SELECT 1"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"📡 캐시 무효화 구독 커넥션 유실 (재시도 {interval}s 후): {e}")
+            await _close_listen_conn()
+            reconnecting = True
+
+        await asyncio.sleep(interval)
+
+
+async def start_invalidation_listener():
+    """구독 시작 (FastAPI lifespan에서 호출)"""
+    global _listener_task
+    if not settings.INVALIDATION_ENABLED:
+        return
+    if _listener_task and not _listener_task.done():
+        return
+    _listener_task = asyncio.create_task(_listener_loop(), name="cache-invalidation-listener")
+
+
+async def stop_invalidation_listener():
+    """구독 종료"""
+    global _listener_task
+    if _listener_task:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _listener_task = None
+    await _close_listen_conn()
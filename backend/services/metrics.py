@@ -0,0 +1,240 @@
+"""
+Prometheus 메트릭 (GET /metrics)
+
+수집 항목:
+  - HTTP:  라우트 템플릿별 응답 시간 히스토그램, 상태 코드별 요청 수, 처리 중 요청 수
+  - DB 풀: 사용 중 / overflow / 풀 크기, 커넥션 획득 대기 시간 (API async 풀, 크롤러 sync 풀)
+  - 캐시:  카탈로그 응답 캐시 / 자동완성 인덱스 hit·miss (hit ratio = hit / (hit + miss))
+  - 크롤링: 소스별 소요 시간, 수집 방법(api/scraping/cache), upsert 행 수 — CrawlLog 기록과 같은 값
+
+uvicorn --workers N 환경에서는 PROMETHEUS_MULTIPROC_DIR를 지정해야 워커별 값이 합산됩니다.
+(prometheus_client multiprocess 모드 — 컨테이너 시작 시 디렉터리를 비워야 하며 Dockerfile.prod에서 처리)
+prometheus_client가 설치되지 않았거나 METRICS_ENABLED=false면 모든 기록 함수는 아무 일도 하지 않습니다.
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from config import get_settings
+
+logger = logging.getLogger("services.metrics")
+settings = get_settings()
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # requirements.txt에 포함 — 미설치 로컬 환경 대비
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+    Counter = Gauge = Histogram = None
+
+ENABLED = settings.METRICS_ENABLED and Counter is not None
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+# 요청 응답 시간 버킷 (초)
+HTTP_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+CRAWL_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1200, 3600)
+
+if ENABLED:
+    HTTP_REQUEST_DURATION = Histogram(
+        "certihub_http_request_duration_seconds",
+        "HTTP 요청 처리 시간",
+        ["method", "route"],
+        buckets=HTTP_BUCKETS,
+    )
+    HTTP_REQUESTS = Counter(
+        "certihub_http_requests_total",
+        "HTTP 요청 수",
+        ["method", "route", "status"],
+    )
+    HTTP_IN_FLIGHT = Gauge(
+        "certihub_http_requests_in_flight",
+        "처리 중인 HTTP 요청 수",
+        multiprocess_mode="livesum",
+    )
+
+    DB_POOL_CHECKED_OUT = Gauge(
+        "certihub_db_pool_checked_out",
+        "사용 중인 커넥션 수",
+        ["pool"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_OVERFLOW = Gauge(
+        "certihub_db_pool_overflow",
+        "pool_size를 넘어 생성된 커넥션 수",
+        ["pool"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_SIZE = Gauge(
+        "certihub_db_pool_size",
+        "설정된 풀 크기 (pool_size)",
+        ["pool"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_WAIT = Histogram(
+        "certihub_db_pool_wait_seconds",
+        "커넥션 획득 대기 시간 (신규 연결 생성 포함)",
+        ["pool"],
+        buckets=POOL_WAIT_BUCKETS,
+    )
+
+    CACHE_REQUESTS = Counter(
+        "certihub_cache_requests_total",
+        "캐시 조회 수",
+        ["cache", "result"],
+    )
+
+    CRAWL_DURATION = Histogram(
+        "certihub_crawl_duration_seconds",
+        "소스별 크롤링 소요 시간",
+        ["source"],
+        buckets=CRAWL_BUCKETS,
+    )
+    CRAWL_RUNS = Counter(
+        "certihub_crawl_runs_total",
+        "소스별 크롤링 실행 수 (status: success/failed, method: api/scraping/cache)",
+        ["source", "status", "method"],
+    )
+    CRAWL_ROWS = Counter(
+        "certihub_crawl_rows_total",
+        "소스별 일정 처리 행 수 (kind: inserted/updated/skipped/unchanged)",
+        ["source", "kind"],
+    )
+    CRAWL_LAST_SUCCESS = Gauge(
+        "certihub_crawl_last_success_timestamp_seconds",
+        "소스별 마지막 성공 시각 (unix time)",
+        ["source"],
+        multiprocess_mode="max",
+    )
+
+
+# ============================================================
+# 기록
+# ============================================================
+
+def request_started():
+    if ENABLED:
+        HTTP_IN_FLIGHT.inc()
+
+
+def request_finished(method: str, route: str, status: int, elapsed_sec: float):
+    if ENABLED:
+        HTTP_IN_FLIGHT.dec()
+        HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed_sec)
+        HTTP_REQUESTS.labels(method, route, str(status)).inc()
+
+
+def record_cache(cache: str, hit: bool):
+    if ENABLED:
+        CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_crawl(source: str, status: str, method: Optional[str], elapsed_sec: float, stats: Optional[Dict] = None):
+    """소스 1개 크롤링 결과 (CrawlLog에 기록하는 값과 동일)"""
+    if not ENABLED:
+        return
+    CRAWL_DURATION.labels(source).observe(elapsed_sec)
+    CRAWL_RUNS.labels(source, status, method or "none").inc()
+    for kind in ("inserted", "updated", "skipped", "unchanged"):
+        count = (stats or {}).get(kind, 0) or 0
+        if count:
+            CRAWL_ROWS.labels(source, kind).inc(count)
+    if status == "success":
+        CRAWL_LAST_SUCCESS.labels(source).set(time.time())
+
+
+# ============================================================
+# DB 커넥션 풀
+# ============================================================
+
+def _pool_name(pool) -> str:
+    return getattr(pool, "metrics_name", "default")
+
+
+def _observe_pool_wait(pool, elapsed_sec: float):
+    if ENABLED:
+        DB_POOL_WAIT.labels(_pool_name(pool)).observe(elapsed_sec)
+
+
+class TimedQueuePool(QueuePool):
+    """커넥션 획득(_do_get) 대기 시간을 기록하는 QueuePool (크롤러 sync 엔진)"""
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _observe_pool_wait(self, time.perf_counter() - t0)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 획득(_do_get) 대기 시간을 기록하는 AsyncAdaptedQueuePool (API async 엔진)"""
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _observe_pool_wait(self, time.perf_counter() - t0)
+
+
+def instrument_pool(engine, name: str):
+    """풀 이름 지정 + checkout/checkin 시 풀 상태 게이지 갱신"""
+    pool = getattr(engine, "sync_engine", engine).pool
+    pool.metrics_name = name
+    if not ENABLED or not hasattr(pool, "checkedout"):
+        return
+
+    def _update(returning: int = 0):
+        DB_POOL_CHECKED_OUT.labels(name).set(max(pool.checkedout() - returning, 0))
+        DB_POOL_OVERFLOW.labels(name).set(max(pool.overflow(), 0))
+        DB_POOL_SIZE.labels(name).set(pool.size())
+
+    def _on_checkout(*_args):
+        _update()
+
+    def _on_checkin(*_args):
+        # checkin 이벤트는 커넥션이 풀에 반환되기 직전에 호출되므로 반환분을 빼서 기록
+        _update(returning=1)
+
+    event.listen(pool, "checkout", _on_checkout)
+    event.listen(pool, "checkin", _on_checkin)
+    _update()
+
+
+# ============================================================
+# 노출
+# ============================================================
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 포맷 (multiprocess 모드면 모든 워커 합산)"""
+    if not ENABLED:
+        return b"", CONTENT_TYPE_LATEST
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead():
+    """워커 종료 시 livesum 게이지에서 이 프로세스 값 제외 (lifespan 종료에서 호출)"""
+    if ENABLED and MULTIPROCESS:
+        try:
+            multiprocess.mark_process_dead(os.getpid())
+        except Exception as e:
+            logger.warning(f"⚠️ 메트릭 워커 정리 실패: {e}")
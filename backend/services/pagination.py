@@ -0,0 +1,106 @@
+"""
+Keyset(커서) 페이지네이션 유틸리티
+
+OFFSET 방식은 깊은 페이지일수록 앞 행을 모두 읽고 버리므로 느려집니다.
+커서는 "마지막으로 본 행의 정렬 키 + id"를 담고 있어 다음 페이지를
+WHERE (정렬키, id) > (마지막 값) 조건 + 인덱스 스캔으로 바로 찾습니다.
+(정렬키, id) 복합 인덱스가 있어야 깊은 페이지도 첫 페이지와 같은 비용입니다
+(ix_cert_name_ko_id, ix_crawl_started_at_id).
+
+커서는 클라이언트에게 불투명한 문자열(base64url JSON)이며,
+정렬 기준이 다른 요청에 재사용되지 않도록 정렬 서명(scope)을 함께 담습니다.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+# (정렬 식, 내림차순 여부)
+SortKey = Tuple[ColumnElement, bool]
+
+
+def _dump_value(value: Any) -> Any:
+    """JSON 직렬화 불가 타입은 태그를 붙여 보존 (decode 시 원래 타입으로 복원)"""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+    return value
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    """정렬 키 값 목록 → 불투명 커서 문자열"""
+    payload = json.dumps({"s": scope, "v": [_dump_value(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str, size: int) -> List[Any]:
+    """커서 문자열 → 정렬 키 값 목록 (형식이 틀리거나 다른 정렬의 커서면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_load_value(v) for v in payload["v"]]
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    if payload.get("s") != scope or len(values) != size:
+        raise HTTPException(status_code=400, detail="현재 정렬/검색 조건과 맞지 않는 커서입니다.")
+    return values
+
+
+def keyset_condition(sort_keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    (k1, k2, ..., id) 정렬에서 커서 다음 행 조건
+    - 모든 키의 방향이 같으면 row-value 비교: (k1, k2) > (v1, v2)
+      → Postgres가 (k1, k2) 복합 인덱스의 시작 위치로 사용
+    - 방향이 섞이면 OR 체인으로 전개하고, 첫 키 범위(k1 >= v1)를 AND로 덧붙여
+      k1 인덱스 범위 조건으로 쓸 수 있게 함:
+      k1 >= v1 AND (k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...)
+    """
+    directions = {descending for _, descending in sort_keys}
+    if len(directions) == 1:
+        row = tuple_(*(expr for expr, _ in sort_keys))
+        bound = tuple_(*values)
+        return row < bound if directions.pop() else row > bound
+
+    clauses = []
+    for i, (expr, descending) in enumerate(sort_keys):
+        after = expr < values[i] if descending else expr > values[i]
+        equals = [sort_keys[j][0] == values[j] for j in range(i)]
+        clauses.append(and_(*equals, after) if equals else after)
+    first, first_desc = sort_keys[0]
+    leading = first <= values[0] if first_desc else first >= values[0]
+    return and_(leading, or_(*clauses))
+
+
+def order_clauses(sort_keys: Sequence[SortKey]) -> list:
+    return [expr.desc() if descending else expr.asc() for expr, descending in sort_keys]
+
+
+def next_cursor(scope: str, rows: list, size: int, key_values) -> Tuple[list, Optional[str]]:
+    """
+    size+1건을 조회한 결과에서 페이지와 다음 커서를 분리
+    key_values(row) → 해당 행의 정렬 키 값 목록
+    """
+    if len(rows) <= size:
+        return rows, None
+    page = rows[:size]
+    return page, encode_cursor(scope, key_values(page[-1]))
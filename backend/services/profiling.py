@@ -0,0 +1,153 @@
+"""
+요청 단위 샘플링 프로파일링 (pyinstrument → speedscope JSON)
+
+운영에서 특정 요청만 느릴 때, 그 요청에만 프로파일러를 붙여 어디서 시간을 쓰는지 확인합니다.
+
+  - 요청: X-Profile: 1 헤더 또는 ?_profile=1 + 진단 토큰(X-Debug-Token, services.debug_access)
+          → 응답은 그대로 반환하고 X-Profile 헤더로 저장된 파일 이름 전달
+          → GET /api/debug/profiles/{name} 으로 내려받아 https://www.speedscope.app 에서 열기
+  - 플래그가 없는 요청은 헤더/쿼리 문자열 확인만 하고 그대로 통과 (프로파일러 미기동)
+  - 크롤링: profile_block("crawl-qnet")으로 임의 구간을 같은 형식으로 저장 (CRAWL_PROFILE_ENABLED)
+
+파일은 PROFILE_DIR(기본 CACHE_DIR/profiles)에 저장되어 모든 워커가 공유하며, 최근 PROFILE_KEEP개만 유지합니다.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from config import get_settings
+
+logger = logging.getLogger("services.profiling")
+settings = get_settings()
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # requirements.txt에 포함 — 미설치 로컬 환경 대비
+    Profiler = None
+
+PROFILE_SUFFIX = ".speedscope.json"
+_SAFE_LABEL = re.compile(r"[^A-Za-z0-9_.-]+")
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+\.speedscope\.json$")
+
+# pyinstrument는 스레드당 프로파일러 1개만 동작 — 이벤트 루프 스레드에서는 요청 하나씩만,
+# 크롤러 executor 스레드는 스레드마다 하나씩
+_active_threads: set = set()
+_active_lock = threading.Lock()
+
+
+def available() -> bool:
+    return Profiler is not None
+
+
+def profile_dir() -> Path:
+    if settings.PROFILE_DIR:
+        return Path(settings.PROFILE_DIR)
+    return Path(os.getenv("CACHE_DIR", "/app/cache")) / "profiles"
+
+
+def _profile_path(label: str) -> Path:
+    safe = _SAFE_LABEL.sub("_", label).strip("_")[:80] or "profile"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return profile_dir() / f"{stamp}-{os.getpid()}-{uuid.uuid4().hex[:6]}-{safe}{PROFILE_SUFFIX}"
+
+
+def _prune():
+    """오래된 프로파일 정리 (최근 PROFILE_KEEP개 유지)"""
+    files = sorted(profile_dir().glob(f"*{PROFILE_SUFFIX}"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in files[settings.PROFILE_KEEP:]:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+
+
+def _save(profiler, path: Path):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(profiler.output(renderer=SpeedscopeRenderer()), encoding="utf-8")
+        _prune()
+    except Exception as e:
+        logger.warning(f"⚠️ 프로파일 저장 실패: {e}")
+        return
+    logger.info(f"🔬 프로파일 저장: {path.name} ({profiler.last_session.duration * 1000:.0f}ms)")
+
+
+def _claim_thread() -> bool:
+    ident = threading.get_ident()
+    with _active_lock:
+        if ident in _active_threads:
+            return False
+        _active_threads.add(ident)
+        return True
+
+
+def _release_thread():
+    with _active_lock:
+        _active_threads.discard(threading.get_ident())
+
+
+class ProfileHandle:
+    """profile_block() 결과 — 저장될 파일 이름 (프로파일러가 실행되지 않으면 None)"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name
+
+
+@contextmanager
+def profile_block(label: str, enabled: bool = True, async_mode: str = "disabled") -> Iterator[ProfileHandle]:
+    """
+    구간 프로파일링 → 블록 종료 시 speedscope JSON 저장
+    pyinstrument가 없거나, enabled=False거나, 같은 스레드에서 이미 실행 중이면 그대로 실행만 함
+    파일 이름은 시작 시점에 정해지므로 응답 헤더에 미리 실을 수 있음
+
+    Args:
+        async_mode: 코루틴 구간이면 "enabled" (이 컨텍스트의 await 대기 시간도 집계)
+    """
+    if not enabled or Profiler is None or not _claim_thread():
+        yield ProfileHandle()
+        return
+
+    path = _profile_path(label)
+    profiler = Profiler(interval=settings.PROFILE_INTERVAL_MS / 1000, async_mode=async_mode)
+    try:
+        profiler.start()
+        try:
+            yield ProfileHandle(path.name)
+        finally:
+            profiler.stop()
+            _save(profiler, path)
+    finally:
+        _release_thread()
+
+
+# ============================================================
+# 저장된 프로파일 조회
+# ============================================================
+
+def list_profiles(limit: int = 50) -> List[dict]:
+    directory = profile_dir()
+    if not directory.exists():
+        return []
+    files = sorted(directory.glob(f"*{PROFILE_SUFFIX}"), key=lambda p: p.stat().st_mtime, reverse=True)
+    return [
+        {"name": f.name, "size": f.stat().st_size, "created_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(f.stat().st_mtime))}
+        for f in files[:limit]
+    ]
+
+
+def profile_file(name: str) -> Optional[Path]:
+    """이름 검증 후 파일 경로 (경로 조작 방지)"""
+    if not _NAME_PATTERN.match(name):
+        return None
+    path = profile_dir() / name
+    return path if path.is_file() else None
@@ -0,0 +1,222 @@
+"""
+SQL 문장별 실행 시간 통계 + 느린 쿼리 로그 (SQLAlchemy 엔진 이벤트)
+
+echo=True는 모든 SQL을 출력해 운영에서 켤 수 없으므로, 엔진 이벤트로 문장마다
+실행 시간 / 행 수 / 호출 위치(API 라우트 또는 크롤러 소스)를 집계합니다.
+
+  - 느린 쿼리: SLOW_QUERY_MS 이상이면 WARNING 로그 (파라미터 값은 타입/길이만 남기고 가림)
+  - 상위 N: 정규화된 문장별 호출 수 / 총·평균·최대 시간 / 행 수 / 호출 위치
+            → GET /api/debug/queries (총 시간순 — N+1 패턴, 느린 필터 확인용)
+  - 통계는 워커(프로세스)별 메모리이며, 문장 종류는 QUERY_STATS_MAX_STATEMENTS개로 제한
+
+행 수는 DBAPI cursor.rowcount 기준입니다 (asyncpg SELECT처럼 실행 시점에 알 수 없으면 집계 제외).
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+from config import get_settings
+
+logger = logging.getLogger("services.query_stats")
+settings = get_settings()
+
+_call_site: ContextVar[Optional[str]] = ContextVar("query_call_site", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (...) 확장 파라미터 개수 차이로 같은 쿼리가 다른 문장으로 집계되지 않도록 축약
+_PARAM_LIST = re.compile(r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?))+\s*\)")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """공백 정리 + 파라미터 목록 축약 (통계 키, 같은 컴파일 문장은 캐시)"""
+    return _PARAM_LIST.sub("(…)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def redact_value(value: Any) -> str:
+    """파라미터 값 → 타입/길이만 (개인정보·검색어 노출 방지)"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return f"<{type(value).__name__}[{len(value)}]>"
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> str:
+    if executemany and isinstance(parameters, (list, tuple)):
+        return f"<{len(parameters)} rows>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {redact_value(v)}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(redact_value(v) for v in parameters) + ")"
+    return redact_value(parameters)
+
+
+@contextmanager
+def call_site(label: str):
+    """호출 위치 지정 (크롤러 소스 등 — 요청 밖 코드용)"""
+    token = _call_site.set(label)
+    try:
+        yield
+    finally:
+        _call_site.reset(token)
+
+
+def current_call_site() -> str:
+    """요청 중이면 'METHOD /route/{param}', 아니면 call_site() 값"""
+    from services.timing import current_timing
+
+    timing = current_timing()
+    if timing is not None and timing.scope is not None:
+        route = getattr(timing.scope.get("route"), "path", None) or timing.scope.get("path", "?")
+        return f"{timing.scope.get('method', '')} {route}"
+    return _call_site.get() or "background"
+
+
+# ============================================================
+# 집계
+# ============================================================
+
+class StatementStats:
+    __slots__ = ("statement", "calls", "total_ns", "max_ns", "rows", "slow", "sites")
+
+    def __init__(self, statement: str):
+        self.statement = statement
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.rows = 0
+        self.slow = 0
+        self.sites: Counter = Counter()
+
+    def to_dict(self, sites: int = 5) -> Dict:
+        return {
+            "statement": self.statement,
+            "calls": self.calls,
+            "total_ms": round(self.total_ns / 1e6, 2),
+            "mean_ms": round(self.total_ns / self.calls / 1e6, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ns / 1e6, 2),
+            "rows": self.rows,
+            "slow": self.slow,
+            "call_sites": dict(self.sites.most_common(sites)),
+        }
+
+
+class QueryStats:
+    """정규화된 문장별 통계 (스레드 안전 — 크롤러 sync 엔진은 executor 스레드에서 실행)"""
+
+    ORDER_KEYS = {
+        "total": lambda s: s.total_ns,
+        "mean": lambda s: s.total_ns / s.calls if s.calls else 0,
+        "max": lambda s: s.max_ns,
+        "calls": lambda s: s.calls,
+    }
+
+    def __init__(self, max_statements: int = 500):
+        self.max_statements = max_statements
+        self._stats: Dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def record(self, statement: str, elapsed_ns: int, rows: Optional[int], site: str, slow: bool):
+        key = normalize_statement(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_statements:
+                    # 가득 차면 총 시간이 가장 작은 문장을 비움 (드묾 — 문장 종류는 한정적)
+                    smallest = min(self._stats, key=lambda k: self._stats[k].total_ns)
+                    del self._stats[smallest]
+                    self.evicted += 1
+                stats = self._stats[key] = StatementStats(key)
+            stats.calls += 1
+            stats.total_ns += elapsed_ns
+            if elapsed_ns > stats.max_ns:
+                stats.max_ns = elapsed_ns
+            if rows is not None and rows >= 0:
+                stats.rows += rows
+            if slow:
+                stats.slow += 1
+            stats.sites[site] += 1
+
+    def top(self, limit: int = 20, order: str = "total") -> List[Dict]:
+        sort_key = self.ORDER_KEYS.get(order, self.ORDER_KEYS["total"])
+        with self._lock:
+            ranked = sorted(self._stats.values(), key=sort_key, reverse=True)[:limit]
+            return [s.to_dict() for s in ranked]
+
+    def summary(self) -> Dict:
+        with self._lock:
+            return {
+                "statements": len(self._stats),
+                "max_statements": self.max_statements,
+                "calls": sum(s.calls for s in self._stats.values()),
+                "total_ms": round(sum(s.total_ns for s in self._stats.values()) / 1e6, 2),
+                "evicted": self.evicted,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.evicted = 0
+
+
+query_stats = QueryStats(max_statements=settings.QUERY_STATS_MAX_STATEMENTS)
+
+
+# ============================================================
+# 엔진 이벤트
+# ============================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_stats_start", []).append(time.perf_counter_ns())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_stats_start")
+    if not starts:
+        return
+    elapsed_ns = time.perf_counter_ns() - starts.pop()
+    site = current_call_site()
+    slow = elapsed_ns >= settings.SLOW_QUERY_MS * 1_000_000
+    query_stats.record(statement, elapsed_ns, getattr(cursor, "rowcount", None), site, slow)
+
+    if slow:
+        logger.warning(
+            "🐢 느린 쿼리 %.1fms [%s] %s | params=%s",
+            elapsed_ns / 1e6,
+            site,
+            normalize_statement(statement)[:1000],
+            redact_parameters(parameters, executemany),
+        )
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get("query_stats_start")
+        if starts:
+            starts.pop()
+
+
+def instrument_engine(engine):
+    """엔진에 문장 통계 이벤트 등록 (AsyncEngine이면 sync_engine에, 중복 등록 무시)"""
+    if not settings.QUERY_STATS_ENABLED:
+        return
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -3,60 +3,91 @@ APScheduler 기반 정기 크롤링 스케줄러
 매일 새벽 3시에 전체 크롤러를 실행하고 seed-events.ts를 동기화합니다.
 
 사용법:
-  - FastAPI lifespan에서 start_scheduler() / stop_scheduler() 호출
+  - FastAPI lifespan에서 start_leader_election() / stop_leader_election() 호출
   - /api/crawl/trigger 엔드포인트에서 수동 실행 가능
+
+리더 선출 (uvicorn --workers N):
+  - 각 워커가 Postgres 세션 레벨 advisory lock(pg_try_advisory_lock) 획득을 시도
+  - 락을 잡은 워커 하나만 APScheduler를 시작 → 03:00 크롤링이 한 번만 실행됨
+  - 리더 워커가 죽으면 DB 세션 종료와 함께 락이 풀리고,
+    나머지 워커 중 하나가 다음 재시도 주기에 리더를 넘겨받음 (failover)
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from config import get_settings
 
 logger = logging.getLogger("scheduler")
+settings = get_settings()
+
+# 매일 새벽 3시 (KST) 전체 크롤링 트리거
+DAILY_CRAWL_TRIGGER = CronTrigger(hour=3, minute=0, timezone="Asia/Seoul")
 
 # 싱글턴 스케줄러 인스턴스
 _scheduler: AsyncIOScheduler | None = None
 
+# 리더 선출 상태 (워커 프로세스별)
+_leader_engine: AsyncEngine | None = None
+_leader_conn: AsyncConnection | None = None
+_election_task: asyncio.Task | None = None
+
 
 def get_scheduler() -> AsyncIOScheduler | None:
     return _scheduler
 
 
-async def run_crawl_job(source: str = "all"):
+def is_leader() -> bool:
+    """현재 워커가 스케줄러 리더인지 여부"""
+    return _leader_conn is not None
+
+
+def get_next_run_time() -> datetime | None:
     """
-    크롤링 실행 + CrawlLog 기록 + seed-events.ts 동기화
-    APScheduler 잡 또는 수동 트리거에서 호출
+    다음 정기 크롤링 예정 시각
+    리더가 아닌 워커는 스케줄러가 없으므로 트리거에서 직접 계산
     """
-    import asyncio
-    import time
-
-    from sqlalchemy.orm import Session
-    from crawlers.base import get_sync_engine
-    from models import CrawlLog
+    if _scheduler and _scheduler.running:
+        job = _scheduler.get_job("daily_crawl")
+        return job.next_run_time if job else None
+    return DAILY_CRAWL_TRIGGER.get_next_fire_time(None, datetime.now(timezone.utc))
 
-    engine = get_sync_engine()
 
-    # 실행할 크롤러 매핑
-    crawler_map = {
-        "qnet": ("crawlers.qnet_scraper", "QNetScraper", "Q-Net"),
-        "kdata": ("crawlers.kdata_scraper", "KDataScraper", "KData"),
-        "cloud": ("crawlers.cloud_scraper", "CloudScraper", "Cloud"),
-        "finance": ("crawlers.finance_scraper", "FinanceScraper", "Finance"),
-        "it_domestic": ("crawlers.it_domestic_scraper", "ITDomesticScraper", "IT Domestic"),
-        "intl": ("crawlers.intl_cert_scraper", "IntlCertScraper", "Intl Cert"),
-    }
+# 실행할 크롤러 매핑: source → (모듈 경로, 클래스 이름, 표시 이름)
+CRAWLER_MAP = {
+    "qnet": ("crawlers.qnet_scraper", "QNetScraper", "Q-Net"),
+    "kdata": ("crawlers.kdata_scraper", "KDataScraper", "KData"),
+    "cloud": ("crawlers.cloud_scraper", "CloudScraper", "Cloud"),
+    "finance": ("crawlers.finance_scraper", "FinanceScraper", "Finance"),
+    "it_domestic": ("crawlers.it_domestic_scraper", "ITDomesticScraper", "IT Domestic"),
+    "intl": ("crawlers.intl_cert_scraper", "IntlCertScraper", "Intl Cert"),
+}
 
-    sources_to_run = list(crawler_map.keys()) if source == "all" else [source]
-    results = []
 
-    loop = asyncio.get_running_loop()
+async def _run_source(src: str, engine, limiter: asyncio.Semaphore, resolver=None) -> dict:
+    """
+    단일 소스 크롤링 + CrawlLog 기록
+    소스마다 독립된 CrawlLog 행과 예외 처리를 가지므로
+    병렬 실행 시에도 한 소스의 실패가 다른 소스에 영향을 주지 않음
+    """
+    import time
 
-    for src in sources_to_run:
-        if src not in crawler_map:
-            continue
+    from sqlalchemy.orm import Session
+    from models import CrawlLog
+    from services.metrics import record_crawl
+    from services.profiling import profile_block
+    from services.query_stats import call_site
 
-        module_path, class_name, display_name = crawler_map[src]
+    module_path, class_name, display_name = CRAWLER_MAP[src]
+    loop = asyncio.get_running_loop()
 
+    async with limiter:
         # CrawlLog 시작 기록
         with Session(engine) as session:
             log = CrawlLog(source=src, status="running", started_at=datetime.now(timezone.utc))
@@ -73,8 +104,13 @@ async def run_crawl_job(source: str = "all"):
                 mod = importlib.import_module(module_path)
                 scraper_cls = getattr(mod, class_name)
                 scraper = scraper_cls()
+                scraper.resolver = resolver
                 try:
-                    stats = scraper.save_to_db()
+                    # executor 스레드는 컨텍스트를 물려받지 않으므로 여기서 SQL 호출 위치 지정
+                    with call_site(f"crawler:{src}"), profile_block(
+                        f"crawl-{src}", enabled=settings.CRAWL_PROFILE_ENABLED
+                    ):
+                        stats = scraper.save_to_db()
                     method = scraper.method_used
                     return {"stats": stats, "method": method, "error": None}
                 finally:
@@ -93,20 +129,22 @@ async def run_crawl_job(source: str = "all"):
                     log.inserted = result["stats"].get("inserted", 0)
                     log.updated = result["stats"].get("updated", 0)
                     log.skipped = result["stats"].get("skipped", 0)
+                    log.unchanged = result["stats"].get("unchanged", 0)
                     log.duration_sec = round(elapsed, 2)
                     log.finished_at = datetime.now(timezone.utc)
                     log.detail = result["stats"]
                     session.commit()
 
-            results.append({
+            record_crawl(src, "success", result["method"], elapsed, result["stats"])
+            logger.info(f"✅ {display_name} 크롤링 완료: {result['method']} ({elapsed:.1f}s)")
+            return {
                 "source": src,
                 "name": display_name,
                 "status": "success",
                 "method": result["method"],
                 "stats": result["stats"],
                 "time": round(elapsed, 2),
-            })
-            logger.info(f"✅ {display_name} 크롤링 완료: {result['method']} ({elapsed:.1f}s)")
+            }
 
         except Exception as e:
             elapsed = time.time() - start_time
@@ -122,14 +160,64 @@ async def run_crawl_job(source: str = "all"):
                     log.finished_at = datetime.now(timezone.utc)
                     session.commit()
 
-            results.append({
+            record_crawl(src, "failed", None, elapsed)
+            logger.error(f"❌ {display_name} 크롤링 실패: {e}")
+            return {
                 "source": src,
                 "name": display_name,
                 "status": "failed",
                 "error": error_msg,
                 "time": round(elapsed, 2),
-            })
-            logger.error(f"❌ {display_name} 크롤링 실패: {e}")
+            }
+
+
+async def run_crawl_job(source: str = "all", concurrent: bool | None = None):
+    """
+    크롤링 실행 + CrawlLog 기록 + seed-events.ts 동기화
+    APScheduler 잡 또는 수동 트리거에서 호출
+
+    Args:
+        source: "all" 또는 CRAWLER_MAP의 키
+        concurrent: True면 소스별 병렬 실행 (CRAWL_MAX_CONCURRENCY 한도),
+                    False면 순차 실행, None이면 CRAWL_CONCURRENT 설정을 따름
+                    호스트별 동시 요청 수는 crawlers.http_client에서 CRAWL_PER_HOST_LIMIT로 제한
+    """
+    from crawlers.base import get_sync_engine
+
+    engine = get_sync_engine()
+
+    if concurrent is None:
+        concurrent = settings.CRAWL_CONCURRENT
+
+    sources_to_run = list(CRAWLER_MAP.keys()) if source == "all" else [source]
+    sources_to_run = [src for src in sources_to_run if src in CRAWLER_MAP]
+
+    # 전역 동시 실행 한도 (순차 모드는 1)
+    max_concurrency = max(settings.CRAWL_MAX_CONCURRENCY, 1) if concurrent else 1
+    limiter = asyncio.Semaphore(max_concurrency)
+
+    if concurrent and len(sources_to_run) > 1:
+        logger.info(f"🚀 병렬 크롤링 시작: {len(sources_to_run)}개 소스 (동시 {max_concurrency}개)")
+
+    # 자격증 이름 해석기는 크롤링 1회당 한 번만 로드해 모든 소스가 공유
+    from crawlers.cert_resolver import load_resolver
+    resolver = await asyncio.get_running_loop().run_in_executor(None, load_resolver, engine)
+
+    # gather는 입력 순서대로 결과를 반환하므로 결과 순서는 순차 실행과 동일
+    results = list(await asyncio.gather(
+        *(_run_source(src, engine, limiter, resolver) for src in sources_to_run)
+    ))
+
+    # 캘린더 구체화 테이블 증분 갱신 (변경된 일정만)
+    try:
+        from database import async_session
+        from services.calendar_events import refresh_calendar_events
+        async with async_session() as session:
+            refreshed = await refresh_calendar_events(session)
+            await session.commit()
+        logger.info(f"📅 calendar_events 갱신: 일정 {refreshed}건")
+    except Exception as e:
+        logger.warning(f"⚠️ calendar_events 갱신 실패: {e}")
 
     # 크롤링 완료 후 seed-events.ts 동기화
     try:
@@ -139,6 +227,15 @@ async def run_crawl_job(source: str = "all"):
     except Exception as e:
         logger.warning(f"⚠️ seed-events.ts 동기화 실패 (서비스 운영에 영향 없음): {e}")
 
+    # 일정/자격증이 바뀌었으면 모든 워커의 카탈로그 캐시 + 자동완성 인덱스 무효화
+    # (모든 소스가 변경 없음 / 실패면 DB에 쓴 행이 없으므로 캐시 유지)
+    from crawlers.run_crawlers import written_rows
+    if written_rows(results):
+        from services.invalidation import broadcast_change
+        await broadcast_change(reason="crawl")
+    else:
+        logger.info("♻️ 크롤링 결과 변경 없음 → 캐시 무효화 생략")
+
     return results
 
 
@@ -166,7 +263,7 @@ def start_scheduler():
     # 매일 새벽 3시에 전체 크롤링
     _scheduler.add_job(
         _scheduled_crawl_job,
-        trigger=CronTrigger(hour=3, minute=0, timezone="Asia/Seoul"),
+        trigger=DAILY_CRAWL_TRIGGER,
         id="daily_crawl",
         name="매일 새벽 3시 전체 크롤링",
         replace_existing=True,
@@ -183,3 +280,131 @@ def stop_scheduler():
         _scheduler.shutdown(wait=False)
         logger.info("🕐 APScheduler 종료")
     _scheduler = None
+
+
+# ============================================================
+# 리더 선출 (Postgres advisory lock)
+# ============================================================
+
+def _get_leader_engine() -> AsyncEngine:
+    """
+    리더 락 전용 엔진
+    락은 커넥션(세션)에 묶이므로 풀을 쓰지 않고(NullPool) 전용 커넥션 1개를 유지
+    """
+    global _leader_engine
+    if _leader_engine is None:
+        _leader_engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    return _leader_engine
+
+
+async def _try_acquire_leadership() -> bool:
+    """advisory lock 획득 시도 — 성공하면 커넥션을 보관하여 락 유지"""
+    global _leader_conn
+
+    conn = await _get_leader_engine().connect()
+    try:
+        # AUTOCOMMIT: 락을 쥔 채 "idle in transaction" 상태로 남지 않도록
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        result = await conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": settings.SCHEDULER_LOCK_KEY},
+        )
+        acquired = bool(result.scalar())
+    except Exception:
+        await conn.close()
+        raise
+
+    if not acquired:
+        await conn.close()
+        return False
+
+    _leader_conn = conn
+    return True
+
+
+async def _leader_alive() -> bool:
+    """리더 커넥션 점검 — 커넥션이 끊기면 서버 측에서 락도 해제된 상태"""
+    if _leader_conn is None:
+        return False
+    try:
+        await _leader_conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.warning(f"👑 리더 락 커넥션 유실: {e}")
+        return False
+
+
+async def _release_leadership():
+    """스케줄러 중지 + 락 커넥션 반환 (커넥션 종료 시 advisory lock 자동 해제)"""
+    global _leader_conn
+
+    stop_scheduler()
+
+    conn, _leader_conn = _leader_conn, None
+    if conn is not None:
+        try:
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"),
+                {"key": settings.SCHEDULER_LOCK_KEY},
+            )
+        except Exception:
+            pass
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+
+async def _election_loop():
+    """
+    리더 선출 루프 (워커마다 1개)
+    - 팔로워: 주기적으로 락 획득 시도 → 성공 시 스케줄러 시작
+    - 리더: 주기적으로 락 커넥션 점검 → 유실 시 스케줄러 중지 후 팔로워로 전환
+    """
+    interval = max(settings.SCHEDULER_LEADER_RETRY_SEC, 1)
+
+    while True:
+        try:
+            if is_leader():
+                if not await _leader_alive():
+                    await _release_leadership()
+                    logger.warning("👑 리더 지위 상실 — 팔로워로 전환")
+            elif await _try_acquire_leadership():
+                start_scheduler()
+                logger.info("👑 스케줄러 리더로 선출됨 — 이 워커가 정기 크롤링 담당")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"👑 리더 선출 시도 실패 (재시도 {interval}s 후): {e}")
+
+        await asyncio.sleep(interval)
+
+
+async def start_leader_election():
+    """
+    리더 선출 시작 (FastAPI lifespan에서 호출)
+    첫 시도는 즉시 수행하여 기동 직후 바로 리더가 정해지도록 함
+    """
+    global _election_task
+    if _election_task and not _election_task.done():
+        return
+    _election_task = asyncio.create_task(_election_loop(), name="scheduler-leader-election")
+
+
+async def stop_leader_election():
+    """리더 선출 종료 + 리더였다면 락 반환"""
+    global _election_task, _leader_engine
+
+    if _election_task:
+        _election_task.cancel()
+        try:
+            await _election_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _election_task = None
+
+    await _release_leadership()
+
+    if _leader_engine is not None:
+        await _leader_engine.dispose()
+        _leader_engine = None
@@ -0,0 +1,103 @@
+"""
+자격증 검색 서비스 (pg_trgm 기반)
+guide.md 4.1 지능형 검색 — 목록 검색 / 자동완성 공용 조건 + 관련도 정렬
+
+- 검색 조건: ILIKE '%q%' (pg_trgm GIN 인덱스가 처리하므로 카탈로그가 커져도 순차 스캔 없음)
+- 관련도:   정확일치 > 접두사 일치 > similarity() 점수 > 이름순
+- tsvector는 기본 Postgres에 한국어 사전이 없어 사용하지 않음 (trigram은 언어 무관)
+"""
+
+import hashlib
+from typing import Optional, Tuple
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from config import get_settings
+from models import Certification
+
+settings = get_settings()
+
+# 목록 검색 대상 컬럼 / 자동완성 대상 컬럼
+LIST_SEARCH_COLUMNS = (
+    Certification.name_ko,
+    Certification.name_en,
+    Certification.tag,
+    Certification.sub_tag,
+)
+AUTOCOMPLETE_COLUMNS = (
+    Certification.name_ko,
+    Certification.name_en,
+    Certification.tag,
+)
+
+# pg_trgm 확장 설치 여부 — database.init_db가 기동 시 pg_extension으로 확인 (확인 전에는 설정값만 따름)
+_trgm_available = True
+
+
+def set_trgm_available(available: bool):
+    global _trgm_available
+    _trgm_available = available
+
+
+def trgm_enabled() -> bool:
+    """similarity() 관련도 사용 여부 (SEARCH_TRGM_ENABLED이고 확장이 설치된 DB)"""
+    return settings.SEARCH_TRGM_ENABLED and _trgm_available
+
+
+def escape_like(value: str) -> str:
+    """LIKE 와일드카드(%, _) 및 이스케이프 문자 처리"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_condition(query: str, columns=LIST_SEARCH_COLUMNS) -> ColumnElement:
+    """부분일치 검색 조건 (trigram GIN 인덱스 사용)"""
+    pattern = f"%{escape_like(query.strip())}%"
+    return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+
+
+def relevance(query: str) -> ColumnElement:
+    """
+    검색 관련도 점수 (높을수록 상위)
+    - 이름 정확일치 3점, 이름 접두사 일치 2점
+    - pg_trgm similarity() 최고값 (0~1) 가산, 분류(tag/sub_tag) 일치는 절반 가중치
+    """
+    q = query.strip()
+    prefix = f"{escape_like(q)}%"
+
+    score = case(
+        (or_(func.lower(Certification.name_ko) == q.lower(), func.lower(Certification.name_en) == q.lower()), 3.0),
+        (or_(Certification.name_ko.ilike(prefix, escape="\\"), Certification.name_en.ilike(prefix, escape="\\")), 2.0),
+        else_=0.0,
+    )
+
+    if trgm_enabled():
+        score = score + func.greatest(
+            func.similarity(Certification.name_ko, q),
+            func.similarity(Certification.name_en, q),
+            func.similarity(Certification.tag, q) * 0.5,
+            func.similarity(func.coalesce(Certification.sub_tag, ""), q) * 0.5,
+        )
+
+    return score
+
+
+def order_by_relevance(query: str) -> tuple:
+    """관련도 내림차순 + 이름순 (동점 시 결과 순서 고정)"""
+    return (relevance(query).desc(), Certification.name_ko, Certification.id)
+
+
+def list_sort_keys(query: Optional[str]) -> Tuple[str, list]:
+    """
+    목록 조회 정렬 키 (keyset 페이지네이션용)
+    Returns:
+        (커서 scope, [(정렬 식, 내림차순 여부), ...]) — 마지막 키는 항상 id
+    """
+    if query and query.strip():
+        digest = hashlib.sha1(query.strip().encode()).hexdigest()[:12]
+        return f"cert:rel:{digest}", [
+            (relevance(query), True),
+            (Certification.name_ko, False),
+            (Certification.id, False),
+        ]
+    return "cert:name", [(Certification.name_ko, False), (Certification.id, False)]
@@ -1,7 +1,7 @@
 """
 DB → seed-events.ts 자동 동기화 서비스
 
-exam_schedules + certifications 테이블에서 데이터를 읽어
+calendar_events 구체화 테이블(exam_schedules + certifications에서 생성)을 읽어
 프론트엔드의 seed-events.ts 파일을 자동 생성합니다.
 
 이 파일은 API 장애 시 fallback 용도로만 사용되며,
@@ -14,9 +14,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 from crawlers.base import get_sync_engine
+from services.calendar_events import refresh_calendar_events_sync, select_events, to_event_dict
 
 logger = logging.getLogger("seed_sync")
 
@@ -30,70 +30,16 @@ FRONTEND_SEED_PATH = os.getenv(
 def _fetch_calendar_events(session: Session) -> List[Dict]:
     """
     DB에서 캘린더 이벤트 데이터 조회
-    schedules.py의 get_calendar_events()와 동일한 로직 (동기 버전)
+    /api/schedules/calendar와 같은 calendar_events 구체화 테이블을 읽음
+    (CLI 단독 실행에도 최신이 되도록 읽기 전에 증분 갱신)
     """
-    result = session.execute(text("""
-        SELECT
-            es.id,
-            es.cert_id,
-            es.round,
-            es.reg_start,
-            es.reg_end,
-            es.exam_date,
-            es.result_date,
-            c.name_ko
-        FROM exam_schedules es
-        JOIN certifications c ON es.cert_id = c.id
-        ORDER BY c.name_ko, es.round, es.exam_date
-    """))
-
-    events = []
-    for row in result.fetchall():
-        cert_id_str = str(row.cert_id)
-        cert_name = row.name_ko
-        round_no = row.round
-        round_label = f" {round_no}회" if round_no else ""
-
-        # 접수 기간 이벤트
-        if row.reg_start and row.reg_end:
-            reg_start = row.reg_start
-            reg_end = row.reg_end
-            # datetime → date string
-            start_str = reg_start.strftime("%Y-%m-%d") if hasattr(reg_start, 'strftime') else str(reg_start)[:10]
-            end_str = reg_end.strftime("%Y-%m-%d") if hasattr(reg_end, 'strftime') else str(reg_end)[:10]
-            events.append({
-                "title": f"{cert_name}{round_label} 접수",
-                "start": start_str,
-                "end": end_str,
-                "color": "#93c5fd",
-                "textColor": "#1e40af",
-                "type": "registration",
-                "cert_id": cert_id_str,
-            })
-
-        # 시험일 이벤트
-        if row.exam_date:
-            exam_str = row.exam_date.strftime("%Y-%m-%d") if hasattr(row.exam_date, 'strftime') else str(row.exam_date)[:10]
-            events.append({
-                "title": f"{cert_name}{round_label} 시험",
-                "start": exam_str,
-                "color": "#ef4444",
-                "type": "exam",
-                "cert_id": cert_id_str,
-            })
-
-        # 발표일 이벤트
-        if row.result_date:
-            result_str = row.result_date.strftime("%Y-%m-%d") if hasattr(row.result_date, 'strftime') else str(row.result_date)[:10]
-            events.append({
-                "title": f"{cert_name}{round_label} 발표",
-                "start": result_str,
-                "color": "#22c55e",
-                "type": "result",
-                "cert_id": cert_id_str,
-            })
-
-    return events
+    refreshed = refresh_calendar_events_sync(session)
+    if refreshed:
+        session.commit()
+        logger.info(f"📅 calendar_events 갱신: 일정 {refreshed}건")
+
+    result = session.execute(select_events())
+    return [to_event_dict(entry) for entry in result.scalars().all()]
 
 
 def _generate_ts_content(events: List[Dict]) -> str:
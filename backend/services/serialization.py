@@ -0,0 +1,105 @@
+"""
+응답 JSON 직렬화 (검증 없는 고속 경로)
+
+목록/캘린더처럼 행이 많은 읽기 응답은 ORM 행마다 Pydantic 모델을 만들고
+(model_validate) FastAPI가 response_model로 한 번 더 검증/변환하는 비용이 CPU 대부분을 차지합니다.
+DB에서 읽은 값은 이미 스키마를 만족하므로, 행을 스키마와 같은 키의 dict로 바로 옮기고
+orjson으로 한 번에 바이트로 직렬화합니다. (응답 스키마는 schemas.py 그대로 — OpenAPI 문서용)
+
+  - orjson 미설치 환경에서는 표준 json으로 대체 (출력 형식 동일)
+  - datetime은 Pydantic과 같은 ISO 8601 형식 (UTC는 'Z' 접미사)
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # requirements.txt에 포함 — 미설치 로컬 환경 대비
+    orjson = None
+
+from schemas import CalendarEvent, CertificationResponse
+
+# 목록/상세 응답의 자격증 필드 (스키마에 필드를 추가하면 고속 경로에도 그대로 반영)
+CERTIFICATION_FIELDS = tuple(CertificationResponse.model_fields)
+
+# 캘린더 이벤트 필드 (값이 없으면 null)
+CALENDAR_EVENT_FIELDS = tuple(CalendarEvent.model_fields)
+
+
+# ============================================================
+# 행 → dict (검증 없음)
+# ============================================================
+
+def certification_item(cert) -> Dict[str, Any]:
+    """Certification ORM 행 → CertificationResponse와 같은 dict"""
+    return {field: getattr(cert, field) for field in CERTIFICATION_FIELDS}
+
+
+def calendar_event_item(event: Dict[str, Any]) -> Dict[str, Any]:
+    """to_event_dict() 결과 → CalendarEvent와 같은 dict (없는 키는 null)"""
+    return {field: event.get(field) for field in CALENDAR_EVENT_FIELDS}
+
+
+# ============================================================
+# dict → JSON 바이트
+# ============================================================
+
+def _isoformat(value: datetime) -> str:
+    text = value.isoformat()
+    if value.utcoffset() is not None and value.utcoffset().total_seconds() == 0:
+        return text[:-6] + "Z"
+    return text
+
+
+def _default(value: Any) -> Any:
+    """orjson / json이 기본으로 처리하지 못하는 값"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, datetime):
+        return _isoformat(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(value).__name__}")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(content: Any) -> bytes:
+        """content → JSON 바이트 (orjson)"""
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+else:
+    class _Encoder(json.JSONEncoder):
+        def default(self, value):
+            return _default(value)
+
+    def dumps(content: Any) -> bytes:
+        """content → JSON 바이트 (표준 json 대체 경로)"""
+        return json.dumps(
+            content,
+            cls=_Encoder,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+def backend_name() -> str:
+    """현재 직렬화 백엔드 (헬스체크/벤치마크 표시용)"""
+    return "orjson" if orjson is not None else "json"
+
+
+def loads(body: bytes) -> Any:
+    """JSON 바이트 → 객체 (벤치마크/검증용)"""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
@@ -0,0 +1,193 @@
+"""
+요청 구간별 시간 측정 (Server-Timing) + 라우트별 지연 히스토그램
+
+  - 요청마다 RequestTiming 1개를 contextvar에 두고, 구간별 누적 시간을 더합니다.
+      db:        SQLAlchemy 엔진 이벤트(before/after_cursor_execute)로 쿼리 실행 시간 합계
+      serialize: 응답 JSON 직렬화 시간 — 캐시 응답(services.catalog_cache.render_json) +
+                 response_model 라우트의 JSON 렌더링(TimedJSONResponse, FastAPI 기본 응답 클래스).
+                 response_model 검증 / jsonable_encoder 단계는 포함하지 않음 (app 구간에 포함)
+                 측정되지 않은 요청(직접 만든 Response, 오류 응답 등)은 Server-Timing에서 생략
+  - 미들웨어가 응답 시작 시점에 Server-Timing 헤더로 내보내고, 전체 시간을 히스토그램에 기록
+  - 히스토그램은 고정 버킷 + 정수 카운터 (요청당 bisect 1회) — 상시 켜두어도 되는 비용
+
+모든 시간은 time.perf_counter_ns() 기준입니다.
+"""
+
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from starlette.responses import JSONResponse
+
+
+class RequestTiming:
+    """요청 1건의 구간별 누적 시간 (ns)"""
+
+    __slots__ = ("start_ns", "db_ns", "db_count", "serialize_ns", "serialize_measured", "scope")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope  # ASGI scope (라우팅 후 scope["route"]로 호출 위치 확인)
+        self.start_ns = time.perf_counter_ns()
+        self.db_ns = 0
+        self.db_count = 0
+        self.serialize_ns = 0
+        self.serialize_measured = False
+
+    def elapsed_ns(self) -> int:
+        return time.perf_counter_ns() - self.start_ns
+
+    def server_timing(self, total_ns: int) -> str:
+        """Server-Timing 헤더 값 (ms, 소수 1자리) — serialize는 측정된 요청에만 포함"""
+        app_ns = max(total_ns - self.db_ns - self.serialize_ns, 0)
+        serialize = f"serialize;dur={self.serialize_ns / 1e6:.1f}, " if self.serialize_measured else ""
+        return (
+            f'db;dur={self.db_ns / 1e6:.1f};desc="{self.db_count} queries", '
+            f"{serialize}"
+            f"app;dur={app_ns / 1e6:.1f}, "
+            f"total;dur={total_ns / 1e6:.1f}"
+        )
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def begin_request(scope: Optional[dict] = None) -> Tuple[RequestTiming, object]:
+    """요청 측정 시작 → (timing, contextvar 토큰)"""
+    timing = RequestTiming(scope)
+    return timing, _current.set(timing)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+@contextmanager
+def track_serialize():
+    """응답 직렬화 구간 측정 (요청 밖에서 호출되면 측정만 건너뜀)"""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    t0 = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timing.serialize_ns += time.perf_counter_ns() - t0
+        timing.serialize_measured = True
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON 렌더링 시간을 serialize 구간으로 집계하는 JSONResponse (main.py의 default_response_class)"""
+
+    def render(self, content) -> bytes:
+        with track_serialize():
+            return super().render(content)
+
+
+# ============================================================
+# DB 시간 (SQLAlchemy 엔진 이벤트)
+# ============================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("timing_query_start", []).append(time.perf_counter_ns())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("timing_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter_ns() - starts.pop()
+    timing = _current.get()
+    if timing is not None:
+        timing.db_ns += elapsed
+        timing.db_count += 1
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get("timing_query_start")
+        if starts:
+            starts.pop()
+
+
+def instrument_engine(engine):
+    """엔진에 쿼리 시간 측정 이벤트 등록 (AsyncEngine이면 sync_engine에, 중복 등록 무시)"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+# ============================================================
+# 지연 히스토그램 (워커 메모리)
+# ============================================================
+
+# 버킷 상한 (ms) — 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """(method, route)별 고정 버킷 히스토그램"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds_ns = [int(b * 1_000_000) for b in buckets_ms]
+        self.buckets_ms = buckets_ms
+        self._series: Dict[Tuple[str, str], List[int]] = {}
+        self._sums: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, method: str, route: str, elapsed_ns: int):
+        key = (method, route)
+        counts = self._series.get(key)
+        if counts is None:
+            counts = self._series[key] = [0] * (len(self.bounds_ns) + 1)
+            self._sums[key] = 0
+        counts[bisect.bisect_left(self.bounds_ns, elapsed_ns)] += 1
+        self._sums[key] += elapsed_ns
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> Optional[float]:
+        """버킷 상한 기준 분위수 추정 (ms, 마지막 버킷을 넘으면 None)"""
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return float(self.buckets_ms[i]) if i < len(self.buckets_ms) else None
+        return 0.0
+
+    def snapshot(self) -> List[Dict]:
+        """라우트별 요약 (요청 수, 평균, p50/p95/p99 추정) — 요청 수 내림차순"""
+        rows = []
+        for (method, route), counts in list(self._series.items()):
+            total = sum(counts)
+            if not total:
+                continue
+            rows.append({
+                "method": method,
+                "route": route,
+                "count": total,
+                "mean_ms": round(self._sums[(method, route)] / total / 1e6, 2),
+                "p50_ms": self._quantile(counts, total, 0.50),
+                "p95_ms": self._quantile(counts, total, 0.95),
+                "p99_ms": self._quantile(counts, total, 0.99),
+                "buckets": dict(zip([*map(str, self.buckets_ms), "+Inf"], counts)),
+            })
+        rows.sort(key=lambda r: r["count"], reverse=True)
+        return rows
+
+    def reset(self):
+        self._series.clear()
+        self._sums.clear()
+
+
+latency_histogram = LatencyHistogram()
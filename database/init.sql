@@ -6,6 +6,7 @@
 
 -- 확장 모듈
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;  -- 검색용 trigram 인덱스
 
 -- ===== ENUM 타입 =====
 DO $$ BEGIN
@@ -30,7 +31,13 @@ CREATE TABLE IF NOT EXISTS certifications (
 -- 인덱스
 CREATE INDEX IF NOT EXISTS ix_cert_tag     ON certifications (tag);
 CREATE INDEX IF NOT EXISTS ix_cert_level   ON certifications (level);
-CREATE INDEX IF NOT EXISTS ix_cert_name_ko ON certifications (name_ko);
+CREATE INDEX IF NOT EXISTS ix_cert_name_ko_id ON certifications (name_ko, id);  -- 이름순 keyset 커서
+
+-- 검색 인덱스 (ILIKE '%q%' + similarity 관련도 정렬)
+CREATE INDEX IF NOT EXISTS ix_cert_name_ko_trgm ON certifications USING gin (name_ko gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_cert_name_en_trgm ON certifications USING gin (name_en gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_cert_tag_trgm     ON certifications USING gin (tag gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_cert_sub_tag_trgm ON certifications USING gin (sub_tag gin_trgm_ops);
 
 -- ===== 3.2 exam_schedules 테이블 (일정) =====
 CREATE TABLE IF NOT EXISTS exam_schedules (
@@ -47,7 +54,12 @@ CREATE TABLE IF NOT EXISTS exam_schedules (
 
 -- 인덱스
 CREATE INDEX IF NOT EXISTS ix_schedule_cert_id   ON exam_schedules (cert_id);
-CREATE INDEX IF NOT EXISTS ix_schedule_exam_date ON exam_schedules (exam_date);
+-- 날짜 범위 조회 (exam_date >= :start AND exam_date < :end) + 접수/발표일 부분 인덱스
+CREATE INDEX IF NOT EXISTS ix_schedule_exam_date_cert ON exam_schedules (exam_date, cert_id);
+CREATE INDEX IF NOT EXISTS ix_schedule_reg_start      ON exam_schedules (reg_start, cert_id) WHERE reg_start IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_schedule_result_date    ON exam_schedules (result_date, cert_id) WHERE result_date IS NOT NULL;
+-- 크롤러 bulk upsert(INSERT ... ON CONFLICT (cert_id, round))의 충돌 대상
+CREATE UNIQUE INDEX IF NOT EXISTS uq_schedule_cert_round ON exam_schedules (cert_id, round);
 
 -- ===== updated_at 자동 갱신 트리거 =====
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -68,6 +80,31 @@ CREATE OR REPLACE TRIGGER tr_schedule_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- ===== calendar_events 테이블 (캘린더 이벤트 구체화) =====
+-- exam_schedules 1행 → 접수/시험/발표 최대 3행. services/calendar_events.py가 SQL로 갱신
+CREATE TABLE IF NOT EXISTS calendar_events (
+    id            SERIAL PRIMARY KEY,
+    schedule_id   INTEGER NOT NULL REFERENCES exam_schedules(id) ON DELETE CASCADE,
+    cert_id       UUID NOT NULL,                            -- certifications.id
+    cert_name     VARCHAR(200) NOT NULL,                    -- 자격증 국문 명칭 (정렬/제목용)
+    round         INTEGER,                                  -- 시험 회차
+    type          VARCHAR(20) NOT NULL,                     -- registration / exam / result
+    sort_order    INTEGER NOT NULL DEFAULT 0,               -- 같은 일정 내 유형 순서
+    title         VARCHAR(260) NOT NULL,                    -- 예: 정보처리기사 55회 접수
+    start_date    DATE NOT NULL,                            -- 이벤트 시작일
+    end_date      DATE,                                     -- 이벤트 종료일 (접수 기간만)
+    last_date     DATE NOT NULL,                            -- 범위 조회용 마지막 날
+    exam_date     DATE,                                     -- 원본 일정 시험일 (연/월 모드)
+    color         VARCHAR(20) NOT NULL,
+    text_color    VARCHAR(20),
+    refreshed_at  TIMESTAMP WITH TIME ZONE DEFAULT NOW()    -- 갱신 시각 (증분 갱신 기준)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_calendar_schedule_type ON calendar_events (schedule_id, type);
+CREATE INDEX IF NOT EXISTS ix_calendar_exam_date ON calendar_events (exam_date);
+CREATE INDEX IF NOT EXISTS ix_calendar_order     ON calendar_events (cert_name, round, exam_date, sort_order);
+CREATE INDEX IF NOT EXISTS ix_calendar_span      ON calendar_events USING gist (daterange(start_date, last_date, '[]'));
+
 -- ===== 3.3 crawl_logs 테이블 (크롤링 이력) =====
 DO $$ BEGIN
     CREATE TYPE crawl_status AS ENUM ('running', 'success', 'failed');
@@ -84,6 +121,7 @@ CREATE TABLE IF NOT EXISTS crawl_logs (
     inserted      INTEGER       DEFAULT 0,                    -- 신규 삽입 건수
     updated       INTEGER       DEFAULT 0,                    -- 업데이트 건수
     skipped       INTEGER       DEFAULT 0,                    -- 건너뛴 건수
+    unchanged     INTEGER       DEFAULT 0,                    -- 변경 없어 쓰기 생략한 건수
     duration_sec  REAL,                                       -- 실행 소요 시간(초)
     error_message TEXT,                                       -- 실패 시 에러 메시지
     detail        JSONB,                                      -- 상세 결과 JSON
@@ -94,7 +132,16 @@ CREATE TABLE IF NOT EXISTS crawl_logs (
 
 CREATE INDEX IF NOT EXISTS ix_crawl_source     ON crawl_logs (source);
 CREATE INDEX IF NOT EXISTS ix_crawl_status     ON crawl_logs (status);
-CREATE INDEX IF NOT EXISTS ix_crawl_started_at ON crawl_logs (started_at);
+CREATE INDEX IF NOT EXISTS ix_crawl_started_at_id ON crawl_logs (started_at, id);  -- 최신순 keyset 커서
+
+-- ===== crawl_fingerprints 테이블 (소스별 마지막 저장 일정 집합 지문) =====
+-- 크롤러가 DB 쓰기와 같은 트랜잭션에서 갱신. 다음 실행의 정규화 집합이 같으면 쓰기 생략
+CREATE TABLE IF NOT EXISTS crawl_fingerprints (
+    source        VARCHAR(50)   PRIMARY KEY,                  -- 크롤러 source_name
+    fingerprint   VARCHAR(64)   NOT NULL,                     -- 정규화된 행 집합 SHA-256
+    row_count     INTEGER       NOT NULL DEFAULT 0,           -- 지문 대상 행 수
+    updated_at    TIMESTAMP WITH TIME ZONE DEFAULT NOW()      -- 마지막 저장 시각
+);
 
 -- ===== Supabase RLS (Row Level Security) 설정 예시 =====
 -- ALTER TABLE certifications ENABLE ROW LEVEL SECURITY;
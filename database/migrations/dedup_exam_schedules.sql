@@ -0,0 +1,38 @@
+-- =====================================================
+-- exam_schedules (cert_id, round) 중복 정리 — 1회성 수동 마이그레이션
+--
+-- uq_schedule_cert_round 유니크 인덱스를 만들기 전에 기존 중복 행을 정리합니다.
+-- 앱 시작(init_db)은 중복이 있으면 인덱스를 만들지 않고 경고 로그에 중복 수/예시를 남깁니다.
+--
+--   - (cert_id, round)마다 최신(id가 큰) 행만 남기고 나머지는 삭제
+--   - 삭제한 행은 exam_schedules_dedup_backup 테이블에 보관 (확인 후 직접 DROP)
+--   - 전체가 한 트랜잭션 — 중간에 실패하면 아무것도 바뀌지 않음
+--
+-- 사용법 (먼저 scripts/backup-db.sh로 백업 권장):
+--   docker exec -i certihub-db psql -U postgres -d certihub -v ON_ERROR_STOP=1 \
+--     < database/migrations/dedup_exam_schedules.sql
+-- =====================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS exam_schedules_dedup_backup (LIKE exam_schedules INCLUDING DEFAULTS);
+ALTER TABLE exam_schedules_dedup_backup ADD COLUMN IF NOT EXISTS backed_up_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+
+DO $$
+DECLARE
+    moved integer;
+BEGIN
+    WITH doomed AS (
+        DELETE FROM exam_schedules a
+            USING exam_schedules b
+            WHERE a.cert_id = b.cert_id AND a.round = b.round AND a.id < b.id
+            RETURNING a.*
+    )
+    INSERT INTO exam_schedules_dedup_backup SELECT * FROM doomed;
+    GET DIAGNOSTICS moved = ROW_COUNT;
+    RAISE NOTICE 'exam_schedules 중복 % 행 삭제 (exam_schedules_dedup_backup에 보관)', moved;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_schedule_cert_round ON exam_schedules (cert_id, round);
+
+COMMIT;
@@ -16,6 +16,8 @@ interface CalendarSectionProps {
   certifications: Certification[];
   onCertClick: (cert: Certification) => void;
   activeTag: string;
+  // 보이는 범위 변경 시 호출 (start 포함, end 미포함, YYYY-MM-DD)
+  onRangeChange?: (start: string, end: string) => void;
 }
 
 export default function CalendarSection({
@@ -23,6 +25,7 @@ export default function CalendarSection({
   certifications,
   onCertClick,
   activeTag,
+  onRangeChange,
 }: CalendarSectionProps) {
   const calendarRef = useRef<HTMLDivElement>(null);
   const calendarInstance = useRef<any>(null);
@@ -41,8 +44,13 @@ export default function CalendarSection({
   // refs로 최신값 유지 (calendar rebuild 방지)
   const certificationsRef = useRef(certifications);
   const onCertClickRef = useRef(onCertClick);
+  const onRangeChangeRef = useRef(onRangeChange);
   certificationsRef.current = certifications;
   onCertClickRef.current = onCertClick;
+  onRangeChangeRef.current = onRangeChange;
+
+  // 이벤트가 갱신되어 캘린더를 다시 만들 때 보던 달을 유지
+  const currentDateRef = useRef<Date | null>(null);
 
   // 이벤트 제목에서 자격증 이름 추출
   const extractCertName = useCallback((title: string) => {
@@ -121,6 +129,7 @@ export default function CalendarSection({
           initialView:
             isMobile ? "listMonth" : (viewMode === "month" ? "dayGridMonth" : "listMonth"),
           locale: "ko",
+          initialDate: currentDateRef.current ?? undefined,
           headerToolbar: false, // 기본 툴바 숨기고 커스텀 네비게이션 사용
           events: coloredEvents,
           eventDisplay: "block",
@@ -129,6 +138,12 @@ export default function CalendarSection({
           datesSet: (dateInfo: any) => {
             // 날짜 변경 시 타이틀 업데이트
             setCalendarTitle(dateInfo.view.title);
+            currentDateRef.current = dateInfo.view.currentStart;
+            // 보이는 범위(앞뒤 달 포함)의 이벤트를 한 번에 요청
+            onRangeChangeRef.current?.(
+              dateInfo.startStr.slice(0, 10),
+              dateInfo.endStr.slice(0, 10)
+            );
           },
           eventClick: (info: any) => {
             info.jsEvent.preventDefault();
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect, useCallback, useMemo } from "react";
+import { useState, useEffect, useCallback, useMemo, useRef } from "react";
 import type { Certification, CalendarEvent } from "@/lib/types";
 import Header from "./components/Header";
 import Hero from "./components/Hero";
@@ -83,6 +83,30 @@ export default function HomePage() {
     loadData();
   }, []);
 
+  // 캘린더 보이는 범위가 바뀌면 해당 범위 이벤트를 한 번 요청해 병합
+  // (이미 받은 범위는 다시 요청하지 않음, 실패 시 기존 이벤트 유지)
+  const loadedRanges = useRef<Set<string>>(new Set());
+  const handleCalendarRange = useCallback(async (start: string, end: string) => {
+    const rangeKey = `${start}_${end}`;
+    if (loadedRanges.current.has(rangeKey)) return;
+    loadedRanges.current.add(rangeKey);
+
+    try {
+      const { getCalendarEventsInRange } = await import("@/lib/api");
+      const rangeEvents = await getCalendarEventsInRange(start, end);
+
+      setEvents((prev) => {
+        const eventKey = (e: CalendarEvent) => `${e.type}|${e.cert_id}|${e.start}|${e.title}`;
+        const seen = new Set(prev.map(eventKey));
+        const added = rangeEvents.filter((e) => !seen.has(eventKey(e)));
+        return added.length > 0 ? [...prev, ...added] : prev;
+      });
+    } catch (error) {
+      loadedRanges.current.delete(rangeKey);
+      console.warn("⚠️ 캘린더 범위 이벤트 조회 실패 → 기존 이벤트 유지:", error);
+    }
+  }, []);
+
   // React 상태 기반 검색 (DOM 조작 제거)
   const handleSearch = useCallback((query: string) => {
     setSearchQuery(query);
@@ -163,6 +187,7 @@ export default function HomePage() {
               certifications={filteredCertifications}
               onCertClick={setSelectedCert}
               activeTag={activeTag}
+              onRangeChange={handleCalendarRange}
             />
           </ErrorBoundary>
           <Footer />
@@ -162,6 +162,24 @@ export async function getCalendarEvents(
   }
 }
 
+/**
+ * 보이는 범위 [start, end)와 겹치는 접수/시험/발표 이벤트 조회 (범위 모드)
+ * FullCalendar datesSet의 startStr/endStr (YYYY-MM-DD)를 그대로 전달
+ */
+export async function getCalendarEventsInRange(
+  start: string,
+  end: string
+): Promise<CalendarEvent[]> {
+  try {
+    const { data } = await api.get("/api/schedules/calendar", {
+      params: { start, end },
+    });
+    return data;
+  } catch (error) {
+    handleApiError(error, "캘린더 범위 이벤트 조회");
+  }
+}
+
 // ===== 통계 API =====
 
 export async function getStats(): Promise<{
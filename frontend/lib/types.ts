@@ -48,9 +48,10 @@ export interface TagStyle {
 
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
-  page: number;
+  total?: number | null; // include_total=false면 null
+  page?: number | null; // cursor 방식이면 null
   size: number;
+  next_cursor?: string | null; // 다음 페이지 커서 (마지막 페이지면 null)
 }
 
 export interface CertSearchParams {
@@ -60,4 +61,6 @@ export interface CertSearchParams {
   level?: CertLevel;
   page?: number;
   size?: number;
+  cursor?: string;
+  include_total?: boolean;
 }